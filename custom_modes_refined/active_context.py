@@ -0,0 +1,255 @@
+# Run this script from the root of the project.
+#
+# Structured access to memory-bank/activeContext.md (and other append-only
+# Memory Bank logs such as progress.md). The file is parsed into typed sections
+# with byte offsets, and the index is kept in a sidecar file
+# (memory-bank/.activeContext.md.index.json). Queries such as "latest Mode
+# Transition Prepared block" or "last N VAN QA log entries" then read only the
+# bytes of the sections they return instead of the whole, ever-growing file.
+
+import argparse
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import memory_bank
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = "index.json"
+
+# Section kinds, matched (in order) against the lowercased heading title.
+SECTION_KINDS = [
+    ("mode transition prepared", "mode_transition"),
+    ("van qa report", "van_qa_report"),
+    ("van qa log", "van_qa_log"),
+    ("file verification log", "file_verification_log"),
+    ("check log", "qa_check_log"),
+    ("build test log", "qa_check_log"),
+    ("creative decisions log", "creative_decisions_log"),
+    ("terminal command log", "build_log"),
+    ("build log", "build_log"),
+    ("action:", "build_log"),
+]
+KIND_PREAMBLE = "preamble"
+KIND_LOG = "log"
+KIND_SECTION = "section"
+
+_HEADING_RE = re.compile(rb"^(#{1,6})[ \t]+(.+?)[ \t#]*$")
+# "VAN QA Log - 2025-05-20 14:03: Starting technical validation." written as a plain line.
+_INLINE_LOG_RE = re.compile(rb"^(?:[-*][ \t]+)?([^:\n]*\bLog\b[^:\n]*?) - ([^:\n]*\d[^\n]*?):[ \t]")
+_FENCE_RE = re.compile(rb"^[ \t]*(```|~~~)")
+
+@dataclass
+class Section:
+    """One section of a Memory Bank Markdown log.
+
+    start/end are byte offsets into the file (end exclusive). Heading
+    sections run until the next heading of any level; inline entries are
+    single "<Name> Log - <timestamp>: ..." lines inside another section.
+    """
+    kind: str
+    title: str
+    level: int
+    start: int
+    end: int
+    line: int
+    timestamp: Optional[str] = None
+    inline: bool = False
+
+def classify(title):
+    """Returns the section kind for a heading or inline log title."""
+    lowered = title.lower()
+    for needle, kind in SECTION_KINDS:
+        if needle in lowered:
+            return kind
+    return None
+
+def split_timestamp(title):
+    """Splits 'Mode Transition Prepared - 2025-05-20 14:00' into (title, timestamp)."""
+    head, sep, tail = title.rpartition(" - ")
+    if sep and any(c.isdigit() for c in tail):
+        return head.strip(), tail.strip()
+    return title.strip(), None
+
+def parse_sections(data, base_offset=0, base_line=1):
+    """Parses Markdown bytes into a list of Sections, ordered by start offset.
+
+    base_offset/base_line let a caller parse only the tail of a file and get
+    offsets and line numbers relative to the whole file.
+    """
+    sections = []
+    current = None
+    in_fence = False
+    offset = base_offset
+    for line_number, line in enumerate(data.splitlines(keepends=True), start=base_line):
+        stripped = line.rstrip(b"\r\n")
+        if _FENCE_RE.match(stripped):
+            in_fence = not in_fence
+        heading = None if in_fence else _HEADING_RE.match(stripped)
+        if heading:
+            if current:
+                current.end = offset
+            raw_title = heading.group(2).decode("utf-8", errors="replace")
+            title, timestamp = split_timestamp(raw_title)
+            kind = classify(raw_title) or (KIND_LOG if timestamp else KIND_SECTION)
+            current = Section(kind, title, len(heading.group(1)), offset, offset + len(line),
+                              line_number, timestamp)
+            sections.append(current)
+        else:
+            if current is None:
+                current = Section(KIND_PREAMBLE, "", 0, offset, offset, line_number)
+                sections.append(current)
+            inline = None if in_fence else _INLINE_LOG_RE.match(stripped)
+            if inline:
+                title = inline.group(1).decode("utf-8", errors="replace").strip()
+                timestamp = inline.group(2).decode("utf-8", errors="replace").strip()
+                sections.append(Section(classify(title) or KIND_LOG, title, current.level,
+                                        offset, offset + len(line), line_number, timestamp, True))
+        offset += len(line)
+        current.end = offset
+    return sorted(sections, key=lambda s: (s.start, s.inline))
+
+def _last_heading(sections):
+    return max((s for s in sections if not s.inline), key=lambda s: s.start)
+
+def _index_payload(signature, sections, tail_start, tail):
+    """tail is the file's bytes from tail_start (the last heading) to the end;
+    its hash is what an append is checked against."""
+    return {
+        "version": INDEX_VERSION,
+        "size": tail_start + len(tail),
+        "mtime_ns": signature[1],
+        "tail_start": tail_start,
+        "tail_sha256": memory_bank.sha256_bytes(tail),
+        "sections": [asdict(s) for s in sections],
+    }
+
+def load_index(filepath, rebuild=False, save=True):
+    """Returns the Sections of filepath, using and refreshing its sidecar index.
+
+    - Unchanged file (same size and mtime as indexed): the index is returned
+      without reading the file.
+    - File only appended to (the last indexed section still hashes the same):
+      the file is read from the start of that section, and only that section
+      and the new bytes are hashed and re-parsed. An edit further up that
+      also grows the file is not noticed until a rebuild.
+    - Anything else: the whole file is re-parsed.
+    Returns [] if the file does not exist.
+    """
+    signature = memory_bank.stat_signature(filepath)
+    if signature is None:
+        return []
+    index_file = memory_bank.sidecar_path(filepath, INDEX_SUFFIX)
+    index = None
+    if not rebuild:
+        try:
+            with open(index_file, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != INDEX_VERSION:
+                index = None
+        except (OSError, ValueError):
+            index = None
+
+    if index and [index["size"], index["mtime_ns"]] == list(signature):
+        return [Section(**s) for s in index["sections"]]
+
+    sections = None
+    if index and index["sections"] and signature[0] >= index["size"]:
+        resume = index["tail_start"]
+        with open(filepath, "rb") as f:
+            f.seek(resume)
+            data = f.read()
+        if memory_bank.sha256_bytes(data[:index["size"] - resume]) == index["tail_sha256"]:
+            kept = [Section(**s) for s in index["sections"]]
+            last_heading = _last_heading(kept)
+            kept = [s for s in kept if s.start < resume]
+            sections = kept + parse_sections(data, resume, last_heading.line)
+    if sections is None:
+        resume = 0
+        with open(filepath, "rb") as f:
+            data = f.read()
+        sections = parse_sections(data)
+
+    if save and sections:
+        tail_start = _last_heading(sections).start
+        payload = _index_payload(signature, sections, tail_start, data[tail_start - resume:])
+        try:
+            memory_bank.atomic_write_text(index_file, json.dumps(payload) + "\n")
+        except OSError as e:
+            print(f"Warning: could not write index {index_file}: {e}")
+    return sections
+
+def section_text(filepath, section):
+    """Reads just the bytes of one section."""
+    return memory_bank.read_range(filepath, section.start, section.end)
+
+def latest_section(filepath, kind="mode_transition", sections=None):
+    """Returns (Section, text) of the last section of the given kind, or None."""
+    sections = load_index(filepath) if sections is None else sections
+    for section in reversed(sections):
+        if section.kind == kind:
+            return section, section_text(filepath, section)
+    return None
+
+def last_entries(filepath, count, kinds=None, sections=None):
+    """Returns the last `count` timestamped entries as [(Section, text)], oldest first.
+
+    Entries are timestamped heading sections and inline "... Log - <ts>:" lines,
+    optionally restricted to the given kinds.
+    """
+    sections = load_index(filepath) if sections is None else sections
+    picked = []
+    for section in reversed(sections):
+        if section.timestamp is None or (kinds and section.kind not in kinds):
+            continue
+        picked.append(section)
+        if len(picked) >= count:
+            break
+    picked.reverse()
+    if not picked:
+        return []
+    # One open/seek per entry; the rest of the file is never read.
+    with open(filepath, "rb") as f:
+        result = []
+        for section in picked:
+            f.seek(section.start)
+            result.append((section, f.read(section.end - section.start).decode("utf-8", errors="replace")))
+    return result
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Query memory-bank/activeContext.md by section.")
+    parser.add_argument("--file", default=memory_bank.ACTIVE_CONTEXT_FILE,
+                        help=f"Markdown log to query (default: {memory_bank.ACTIVE_CONTEXT_FILE}).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("sections", help="List the indexed sections with byte offsets.")
+    sub.add_parser("reindex", help="Rebuild the sidecar index from scratch.")
+    latest = sub.add_parser("latest", help="Print the latest section of a kind (default: mode_transition).")
+    latest.add_argument("--kind", default="mode_transition")
+    entries = sub.add_parser("entries", help="Print the last N timestamped log entries.")
+    entries.add_argument("-n", "--count", type=int, default=5)
+    entries.add_argument("--kind", action="append", help="Only entries of this kind. May be repeated.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not os.path.exists(args.file):
+        raise SystemExit(f"File not found: {args.file}")
+
+    if args.command in ("sections", "reindex"):
+        sections = load_index(args.file, rebuild=args.command == "reindex")
+        for s in sections:
+            marker = "  ~" if s.inline else "#" * s.level if s.level else "--"
+            stamp = f" [{s.timestamp}]" if s.timestamp else ""
+            print(f"{s.start:>9}-{s.end:<9} L{s.line:<6} {s.kind:<22} {marker} {s.title}{stamp}")
+        if args.command == "reindex":
+            print(f"Indexed {len(sections)} sections.")
+    elif args.command == "latest":
+        found = latest_section(args.file, args.kind)
+        if found is None:
+            raise SystemExit(f"No '{args.kind}' section in {args.file}")
+        print(found[1], end="")
+    elif args.command == "entries":
+        for _, text in last_entries(args.file, args.count, args.kind):
+            print(text, end="" if text.endswith("\n") else "\n")
@@ -0,0 +1,232 @@
+# Run this script from the root of the project.
+#
+# Compacts the append-only Memory Bank logs (memory-bank/activeContext.md and
+# memory-bank/progress.md). The most recent "Mode Transition Prepared" block and
+# the log entries of the current task stay inline; older timestamped sections are
+# moved, in order, into dated files under memory-bank/archive/ (one file per log
+# and day, e.g. archive/activeContext-2025-05-20.md), and a one-line pointer to
+# those files is left where they were removed.
+
+import argparse
+import datetime
+import os
+import re
+import sys
+
+import active_context
+import memory_bank
+
+DEFAULT_MAX_BYTES = 32 * 1024
+# A heading like "## Current Task: ..." or "## New Task - 2025-05-20" starts the current task.
+DEFAULT_TASK_START = r"\b(?:current|active|new)\s+task\b|^task\b"
+POINTER_PREFIX = "> Archived "
+
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+def entry_date(timestamp, today):
+    """Returns 'YYYY-MM-DD' from an entry timestamp, or today's date if it has none."""
+    match = _DATE_RE.search(timestamp or "")
+    return "-".join(match.groups()) if match else today
+
+def archive_name(filepath, date):
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    return f"{stem}-{date}.md"
+
+def subtree_end(headings, section, anchors=()):
+    """End offset of a heading section plus its deeper sub-headings, stopping
+    before the next heading of the same or a higher level or at an anchor."""
+    end = section.end
+    for other in headings:
+        if other.start > section.start:
+            if other.level <= section.level or other.start in anchors:
+                break
+            end = other.end
+    return end
+
+def log_blocks(sections, anchors=()):
+    """Groups sections into archivable blocks.
+
+    A timestamped heading (level 2 or deeper) owns every following section up
+    to the next heading of the same or a higher level, so its sub-headings move
+    with it. Inline "... Log - <ts>:" lines are blocks of their own unless
+    they lie inside a block. Sections starting at an offset in anchors are
+    never archived and own nothing, and a block ends before any anchor it
+    would otherwise contain. Returns [(start, end, first_section)] in file
+    order.
+    """
+    headings = [s for s in sections if not s.inline and s.kind != active_context.KIND_PREAMBLE]
+    blocks = []
+    covered_until = -1
+    for section in sections:
+        if section.start < covered_until or section.start in anchors:
+            continue
+        if section.inline:
+            blocks.append((section.start, section.end, section))
+            continue
+        if section.timestamp is None or section.level < 2:
+            continue
+        end = subtree_end(headings, section, anchors)
+        blocks.append((section.start, end, section))
+        covered_until = end
+    return blocks
+
+def plan_compaction(sections, size, max_bytes=DEFAULT_MAX_BYTES, task_start=DEFAULT_TASK_START):
+    """Chooses which blocks to archive.
+
+    Every block before the current task goes; the latest mode transition is
+    always kept, even when it is nested under an older timestamped entry. If
+    the file would still exceed max_bytes, the oldest blocks of the current
+    task (below the heading that starts it) are archived as well until it
+    fits. Returns the blocks to archive, in file order.
+    """
+    task_re = re.compile(task_start, re.IGNORECASE)
+    task_starts = [s.start for s in sections if not s.inline and task_re.search(s.title)]
+    transitions = [s for s in sections if s.kind == "mode_transition"]
+    keep = transitions[-1] if transitions else None
+    anchors = set(task_starts[-1:])
+    if keep:
+        anchors.add(keep.start)
+        headings = [s for s in sections if not s.inline and s.kind != active_context.KIND_PREAMBLE]
+        keep_end = keep.end if keep.inline else subtree_end(headings, keep, anchors)
+    blocks = log_blocks(sections, anchors)
+    if keep:
+        # The transition's own sub-sections stay with it.
+        blocks = [b for b in blocks if not keep.start <= b[0] < keep_end]
+    if task_starts:
+        boundary = task_starts[-1]
+    else:
+        # Without a task marker, the current task is what followed the last transition.
+        boundary = keep.start if keep else 0
+
+    archive = [b for b in blocks if b[1] <= boundary]
+    remaining = size - sum(end - start for start, end, _ in archive)
+    for block in blocks:
+        if remaining <= max_bytes:
+            break
+        if block in archive:
+            continue
+        archive.append(block)
+        remaining -= block[1] - block[0]
+    archive.sort(key=lambda b: b[0])
+    return archive
+
+def pointer_line(counts, first, last):
+    files = ", ".join(f"[archive/{name}](archive/{name})" for name in counts)
+    total = sum(counts.values())
+    span = f" ({first} .. {last})" if first and last and first != last else f" ({first})" if first else ""
+    return f"{POINTER_PREFIX}{total} older log entr{'y' if total == 1 else 'ies'}{span} to {files}.\n\n"
+
+def compact(filepath, max_bytes=DEFAULT_MAX_BYTES, task_start=DEFAULT_TASK_START,
+            archive_dir=None, dry_run=False, today=None):
+    """Compacts one log file. Returns a summary dict.
+
+    The archive files are appended to (and fsynced) before the hot file is
+    atomically rewritten, so an interrupted run can at worst duplicate
+    entries in the archive, never lose them. If the log changes while it is
+    being compacted, nothing is rewritten.
+    """
+    today = today or datetime.date.today().isoformat()
+    archive_dir = archive_dir or os.path.join(os.path.dirname(filepath), "archive")
+    signature = memory_bank.stat_signature(filepath)
+    if signature is None:
+        return {"file": filepath, "archived": 0, "size_before": 0, "size_after": 0, "archives": {}}
+    with open(filepath, "rb") as f:
+        data = f.read()
+    sections = active_context.parse_sections(data)
+    blocks = plan_compaction(sections, len(data), max_bytes, task_start)
+    summary = {"file": filepath, "archived": len(blocks), "size_before": len(data),
+               "size_after": len(data), "archives": {}}
+    if not blocks:
+        return summary
+
+    by_archive = {}
+    for start, end, section in blocks:
+        name = archive_name(filepath, entry_date(section.timestamp, today))
+        chunk = data[start:end]
+        if not chunk.endswith(b"\n"):
+            chunk += b"\n"
+        by_archive.setdefault(name, []).append(chunk)
+    counts = {name: len(chunks) for name, chunks in by_archive.items()}
+    stamps = [s.timestamp for _, _, s in blocks if s.timestamp]
+    pointer = pointer_line(counts, stamps[0] if stamps else None, stamps[-1] if stamps else None).encode("utf-8")
+
+    pieces = []
+    cursor = 0
+    for i, (start, end, _) in enumerate(blocks):
+        pieces.append(data[cursor:start])
+        if i == 0:
+            pieces.append(pointer)
+        cursor = end
+    pieces.append(data[cursor:])
+    new_data = b"".join(pieces)
+    if len(new_data) >= len(data):
+        # The entries are smaller than the pointer that would replace them.
+        summary["archived"] = 0
+        return summary
+    summary["size_after"] = len(new_data)
+    summary["archives"] = counts
+    if dry_run:
+        return summary
+
+    if memory_bank.stat_signature(filepath) != signature:
+        raise RuntimeError(f"{filepath} changed during compaction; nothing was archived. Re-run to retry.")
+    os.makedirs(archive_dir, exist_ok=True)
+    source_name = os.path.basename(filepath)
+    for name, chunks in by_archive.items():
+        path = os.path.join(archive_dir, name)
+        new_file = not os.path.exists(path)
+        with open(path, "ab") as f:
+            if new_file:
+                f.write(f"# Archived from {source_name}\n\n".encode("utf-8"))
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+    if memory_bank.stat_signature(filepath) != signature:
+        raise RuntimeError(f"{filepath} changed during compaction; archived entries were copied "
+                           f"but the file was left untouched. Re-run to finish.")
+    memory_bank.atomic_write_bytes(filepath, new_data)
+    return summary
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Move old Memory Bank log entries into memory-bank/archive/.")
+    parser.add_argument("files", nargs="*",
+                        default=[memory_bank.ACTIVE_CONTEXT_FILE, memory_bank.PROGRESS_FILE],
+                        help="Log files to compact (default: activeContext.md and progress.md).")
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES,
+                        help=f"Size the compacted file should stay under (default: {DEFAULT_MAX_BYTES}).")
+    parser.add_argument("--task-start", default=DEFAULT_TASK_START,
+                        help="Regex (case-insensitive) for the heading that starts the current task.")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would move without writing.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        re.compile(args.task_start)
+    except re.error as e:
+        raise SystemExit(f"Invalid --task-start pattern: {e}")
+
+    failed = False
+    for filepath in args.files:
+        if not os.path.exists(filepath):
+            print(f"Skipping (not found): {filepath}")
+            continue
+        try:
+            summary = compact(filepath, args.max_bytes, args.task_start, dry_run=args.dry_run)
+        except (OSError, RuntimeError) as e:
+            print(f"Error compacting {filepath}: {e}")
+            failed = True
+            continue
+        verb = "Would archive" if args.dry_run else "Archived"
+        if not summary["archived"]:
+            print(f"{filepath}: nothing to archive ({summary['size_before']:,} bytes).")
+            continue
+        print(f"{filepath}: {verb} {summary['archived']} log entries, "
+              f"{summary['size_before']:,} -> {summary['size_after']:,} bytes")
+        for name, count in summary["archives"].items():
+            print(f"    {count:>4} -> {os.path.join(os.path.dirname(filepath), 'archive', name)}")
+        if summary["size_after"] > args.max_bytes:
+            print(f"    still over --max-bytes {args.max_bytes:,}; the rest is the current task, the latest transition and untimestamped sections")
+    sys.exit(1 if failed else 0)
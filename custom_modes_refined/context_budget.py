@@ -0,0 +1,247 @@
+# Run this script from the root of the project.
+#
+# Offline per-mode context-budget estimator. Starting from each mode prompt in
+# custom_modes_refined/, walks the fetch_rules graph built by rule_graph.py and
+# reports how many tokens a session loads on its best-case, typical and
+# worst-case rule-loading path for every complexity level. Token counts come
+# from a local approximation, so no network access or model tokenizer is needed.
+
+import argparse
+import importlib
+import json
+import math
+import os
+import re
+
+import memory_bank
+import rule_graph
+
+MODE_PROMPTS = ["van.md", "plan.md", "creative.md", "implement.md", "reflect_archive.md"]
+COMPLEXITY_LEVELS = [1, 2, 3, 4]
+
+# Rules under LevelN/ are only fetched for level-N tasks.
+_LEVEL_DIR_RE = re.compile(r"(?:^|/)Level(\d)/")
+_TOKEN_PIECE_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+# Stop enumerating simple paths after this many; results are then lower bounds.
+MAX_PATHS = 200000
+
+def count_tokens_chars(text):
+    """Rough estimate: one token per four characters."""
+    return math.ceil(len(text) / 4)
+
+def count_tokens_regex(text):
+    """BPE-like estimate: words split into ~4-letter pieces, digits in groups of
+    three, one token per punctuation mark and per non-ASCII character byte pair."""
+    tokens = 0
+    for piece in _TOKEN_PIECE_RE.findall(text):
+        if piece[0].isascii() and piece[0].isalpha():
+            tokens += 1 + (len(piece) - 1) // 4
+        elif piece[0].isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        elif piece.isascii():
+            tokens += 1
+        else:
+            tokens += math.ceil(len(piece.encode("utf-8")) / 2)
+    return tokens
+
+TOKENIZERS = {
+    "chars": count_tokens_chars,
+    "regex": count_tokens_regex,
+}
+DEFAULT_TOKENIZER = "regex"
+
+def register_tokenizer(name, func):
+    """Makes a tokenizer (a callable text -> int) selectable by name."""
+    TOKENIZERS[name] = func
+
+def get_tokenizer(spec=DEFAULT_TOKENIZER):
+    """Returns a tokenizer by registered name or by 'module:function' import spec.
+
+    Raises ValueError if the tokenizer cannot be found.
+    """
+    if spec in TOKENIZERS:
+        return TOKENIZERS[spec]
+    module_name, sep, func_name = spec.partition(":")
+    if not sep:
+        raise ValueError(f"Unknown tokenizer {spec!r}; choose one of {', '.join(sorted(TOKENIZERS))} or use module:function")
+    try:
+        func = getattr(importlib.import_module(module_name), func_name)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Cannot load tokenizer {spec!r}: {e}")
+    return func
+
+def rule_level(node_id):
+    """Returns the complexity level a rule belongs to (from its LevelN/ directory), or None."""
+    match = _LEVEL_DIR_RE.search(node_id)
+    return int(match.group(1)) if match else None
+
+def node_token_counts(graph, project_root, tokenizer):
+    """Tokenizes the body of every rule and mode prompt node in the graph."""
+    counts = {}
+    for node_id, node in graph["nodes"].items():
+        if node["kind"] not in (rule_graph.NODE_RULE, rule_graph.NODE_MODE):
+            continue
+        with open(os.path.join(project_root, node_id), "r", encoding="utf-8") as f:
+            text = f.read()
+        body = rule_graph.split_frontmatter(text)[1] if node["kind"] == rule_graph.NODE_RULE else text
+        counts[node_id] = tokenizer(body)
+    return counts
+
+def level_adjacency(graph, level):
+    """fetch_rules adjacency with rules of other complexity levels removed.
+
+    Bundles are left out: they replace the rules they inline, never add to them.
+    """
+    allowed = lambda node_id: (rule_level(node_id) in (None, level)
+                               and graph["nodes"][node_id]["kind"] != rule_graph.NODE_BUNDLE)
+    adj = rule_graph.adjacency(graph, (rule_graph.EDGE_FETCH,))
+    return {n: [t for t in targets if allowed(t)] for n, targets in adj.items() if allowed(n)}
+
+def extreme_paths(adj, start, cost):
+    """Enumerates simple fetch chains from start and returns (cheapest, heaviest).
+
+    A chain ends where a rule fetches nothing that is not already on the chain.
+    Each result is (tokens, [node_id, ...]). The third return value is False if
+    enumeration stopped at MAX_PATHS.
+    """
+    best = None
+    worst = None
+    explored = 0
+    stack = [(start, [start], cost.get(start, 0))]
+    while stack:
+        node_id, path, total = stack.pop()
+        nexts = [t for t in adj.get(node_id, ()) if t not in path]
+        if not nexts:
+            explored += 1
+            if best is None or total < best[0]:
+                best = (total, path)
+            if worst is None or total > worst[0]:
+                worst = (total, path)
+            if explored >= MAX_PATHS:
+                return best, worst, False
+            continue
+        for target in nexts:
+            stack.append((target, path + [target], total + cost.get(target, 0)))
+    return best, worst, True
+
+def closure(adj, start, max_depth=None):
+    """Nodes reachable from start within max_depth fetch hops (unbounded if None)."""
+    seen = {start: 0}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for node_id in frontier:
+            depth = seen[node_id]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for target in adj.get(node_id, ()):
+                if target not in seen:
+                    seen[target] = depth + 1
+                    next_frontier.append(target)
+        frontier = next_frontier
+    return list(seen)
+
+def estimate_mode(graph, counts, mode_id, level, typical_depth=2):
+    """Estimates the rule-loading cost of one mode at one complexity level.
+
+    best_case    cheapest single fetch chain from the mode prompt to a leaf rule
+    typical      mode prompt plus every rule within typical_depth fetch hops
+                 (the orchestrator and the sub-rules it fetches directly)
+    worst_case   every rule reachable through fetch_rules, each loaded once
+    worst_path   the heaviest single fetch chain
+    always_apply tokens of alwaysApply rules, injected on top of every scenario
+    """
+    adj = level_adjacency(graph, level)
+    always_on = sorted(n for n, node in graph["nodes"].items() if node.get("always_apply"))
+    always_tokens = sum(counts.get(n, 0) for n in always_on)
+    # alwaysApply rules are already in context; fetching them adds nothing.
+    cost = {n: tokens for n, tokens in counts.items() if n not in always_on}
+    best, worst, complete = extreme_paths(adj, mode_id, cost)
+    typical_nodes = closure(adj, mode_id, typical_depth)
+    worst_nodes = closure(adj, mode_id)
+    return {
+        "mode": mode_id,
+        "level": level,
+        "always_apply": always_tokens,
+        "best_case": best[0],
+        "best_path": best[1],
+        "typical": sum(cost.get(n, 0) for n in typical_nodes),
+        "typical_rules": len(typical_nodes) - 1,
+        "worst_case": sum(cost.get(n, 0) for n in worst_nodes),
+        "worst_case_rules": len(worst_nodes) - 1,
+        "worst_path_tokens": worst[0],
+        "worst_path": worst[1],
+        "paths_complete": complete,
+    }
+
+def estimate_all(project_root, tokenizer, modes=MODE_PROMPTS, levels=COMPLEXITY_LEVELS, typical_depth=2):
+    """Runs estimate_mode for every mode prompt and level.
+
+    Returns {"baseline": tokens of all rules, "results": [...]} where the
+    baseline is the cost of loading the whole rule tree up front.
+    """
+    graph = rule_graph.build_graph(project_root)
+    counts = node_token_counts(graph, project_root, tokenizer)
+    baseline = sum(t for n, t in counts.items() if graph["nodes"][n]["kind"] == rule_graph.NODE_RULE)
+    results = []
+    for mode in modes:
+        mode_id = rule_graph.MODES_DIR + "/" + mode
+        if mode_id not in graph["nodes"]:
+            print(f"Mode prompt not found, skipping: {mode_id}")
+            continue
+        for level in levels:
+            results.append(estimate_mode(graph, counts, mode_id, level, typical_depth))
+    return {"baseline": baseline, "results": results}
+
+def _short(node_id):
+    for prefix in (rule_graph.RULES_PATH_PREFIX, rule_graph.MODES_DIR + "/"):
+        if node_id.startswith(prefix):
+            return node_id[len(prefix):]
+    return node_id
+
+def print_report(report, show_paths=False):
+    baseline = report["baseline"]
+    print(f"Baseline (all rules loaded up front): {baseline:,} tokens\n")
+    header = f"{'mode':<20} {'L':>1} {'best':>8} {'typical':>8} {'worst':>8} {'saved':>6} {'always':>7}"
+    print(header)
+    print("-" * len(header))
+    for r in report["results"]:
+        saved = 1 - (r["typical"] + r["always_apply"]) / baseline if baseline else 0
+        print(f"{_short(r['mode']):<20} {r['level']:>1} {r['best_case']:>8,} {r['typical']:>8,} "
+              f"{r['worst_case']:>8,} {saved:>6.0%} {r['always_apply']:>7,}")
+        if show_paths:
+            marker = "" if r["paths_complete"] else " (path search truncated)"
+            print(f"    worst path ({r['worst_path_tokens']:,} tokens){marker}: "
+                  + " -> ".join(_short(n) for n in r["worst_path"]))
+    print("\n'saved' compares the typical load (plus alwaysApply rules) with the baseline.")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate per-mode rule-loading token budgets offline.")
+    parser.add_argument("--tokenizer", default=DEFAULT_TOKENIZER,
+                        help=f"Tokenizer name ({', '.join(sorted(TOKENIZERS))}) or module:function "
+                             f"(default: {DEFAULT_TOKENIZER}).")
+    parser.add_argument("--mode", action="append", choices=MODE_PROMPTS,
+                        help="Only estimate this mode prompt. May be given more than once.")
+    parser.add_argument("--level", action="append", type=int, choices=COMPLEXITY_LEVELS,
+                        help="Only estimate this complexity level. May be given more than once.")
+    parser.add_argument("--typical-depth", type=int, default=2,
+                        help="Fetch hops from the mode prompt counted as the typical load (default: 2).")
+    parser.add_argument("--paths", action="store_true", help="Print the worst-case fetch chain per row.")
+    parser.add_argument("--json", metavar="PATH", help="Write the full report as JSON to PATH.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        tokenizer = get_tokenizer(args.tokenizer)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    report = estimate_all(os.getcwd(), tokenizer, args.mode or MODE_PROMPTS,
+                          args.level or COMPLEXITY_LEVELS, args.typical_depth)
+    report["tokenizer"] = args.tokenizer
+    print_report(report, args.paths)
+    if args.json:
+        memory_bank.atomic_write_text(args.json, json.dumps(report, indent=2) + "\n")
+        print(f"Wrote report JSON: {args.json}")
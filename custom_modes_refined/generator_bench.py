@@ -0,0 +1,273 @@
+# Run this script from the root of the project.
+#
+# Benchmark suite for refine-instructions.py on synthetic rule trees. Each
+# configuration synthesises N rules (MDC_FILES_DATA entries with frontmatter,
+# headings, bullets, code fences and fetch_rules references between rules)
+# spread over a directory tree of the given depth, writes them as rule sources
+# into a scratch directory and times the generator's stages on them:
+#   load    load_rule_sources() parsing the source files
+#   render  render_all()
+#   graph   rule_graph.build_graph_from_texts(), the core of the other tools
+#   write   generate_mdc_files() into an empty tree ("cold") and again with
+#           everything up to date ("warm", manifest hits only)
+#   verify  generate_mdc_files() without a manifest, so every file is read and
+#           hashed against its rendered content
+# write and verify run once per --jobs value (1 is serial). Results go to a
+# JSON file that --compare can diff against a run from another commit.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import memory_bank
+import paragraph_dedupe
+import rule_graph
+
+generator = paragraph_dedupe.load_generator()
+
+DEFAULT_SIZES = [100, 1000]
+DEFAULT_DEPTH = 3
+DEFAULT_FANOUT = 6
+DEFAULT_BODY_BYTES = 4000
+DEFAULT_REPEAT = 3
+# Runs slower than this factor against --compare are flagged, unless they are
+# within NOISE_FLOOR_S of the baseline (sub-millisecond stages jitter a lot).
+REGRESSION_FACTOR = 1.2
+NOISE_FLOOR_S = 0.002
+
+_WORDS = ("rule memory bank context level mode verify task plan creative build reflect archive fetch "
+          "component system checklist status update progress dependency phase token budget file path").split()
+
+def _sentence(rng, words):
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+def synthesize_body(rng, target_bytes, others):
+    """Returns a Markdown rule body of about target_bytes, referencing rules in others."""
+    parts = []
+    size = 0
+    section = 0
+    while size < target_bytes:
+        section += 1
+        block = [f"## {section}. {_sentence(rng, 3)[:-1].upper()}", ""]
+        block.append(" ".join(_sentence(rng, rng.randint(6, 14)) for _ in range(rng.randint(2, 5))))
+        block.append("")
+        block.extend(f"*   {_sentence(rng, rng.randint(4, 10))}" for _ in range(rng.randint(2, 6)))
+        if others and rng.random() < 0.5:
+            block.append(f"*   `fetch_rules` to load `{rng.choice(others)}`.")
+        if rng.random() < 0.2:
+            block.extend(["", "```bash", f"echo {' '.join(rng.choice(_WORDS) for _ in range(4))}", "```"])
+        block.append("")
+        text = "\n".join(block)
+        parts.append(text)
+        size += len(text.encode("utf-8")) + 1
+    return "\n".join(parts)
+
+def synthesize_rules(count, depth=DEFAULT_DEPTH, fanout=DEFAULT_FANOUT, body_bytes=DEFAULT_BODY_BYTES, seed=0):
+    """Returns count MDC_FILES_DATA entries spread over depth directory levels.
+
+    Deterministic for a given seed, so runs on different commits time the
+    same tree.
+    """
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        dirs = [f"group{(index // fanout ** level) % fanout}" for level in range(depth, 0, -1)]
+        paths.append(generator.RULES_PATH_PREFIX + "/".join(dirs + [f"rule-{index:05d}.mdc"]))
+    entries = []
+    for index, path in enumerate(paths):
+        # References point at earlier rules, like orchestrators fetching sub-rules.
+        others = paths[max(0, index - 50):index]
+        entries.append({
+            "path": path,
+            "description": _sentence(rng, 10),
+            "globs": "**/" + path[len(generator.RULES_PATH_PREFIX):],
+            "alwaysApply": index == 0,
+            "body": synthesize_body(rng, body_bytes, others),
+        })
+    return entries
+
+def write_sources(entries, source_dir):
+    """Writes entries as rule source files (frontmatter + body) below source_dir."""
+    for entry in entries:
+        filepath = os.path.join(source_dir, *entry["path"][len(generator.RULES_PATH_PREFIX):].split("/"))
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(generator.render_mdc_content(entry["description"], entry["globs"], entry["alwaysApply"],
+                                                 entry["body"]) + "\n")
+
+def time_call(func, repeat, setup=None):
+    """Runs func repeat times (after setup, untimed) and returns (seconds list, last result).
+
+    The generator's per-file progress output is discarded so it does not
+    dominate the timings.
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = func()
+            times.append(time.perf_counter() - started)
+    return times, result
+
+def _expect(stats, status, count):
+    # A stage that did not do the work it is timed for would report a bogus number.
+    if stats[status] != count:
+        raise RuntimeError(f"expected {count} rules {status}, got {stats}")
+
+def _result(config, stage, mode, jobs, times, total_bytes):
+    best = min(times)
+    return dict(config, stage=stage, mode=mode, jobs=jobs, runs=len(times), min_s=round(best, 6),
+                median_s=round(statistics.median(times), 6),
+                per_rule_us=round(best / config["rules"] * 1e6, 2),
+                mb_per_s=round(total_bytes / best / 1e6, 2) if best else None)
+
+def bench_config(count, depth, fanout, body_bytes, jobs_list, repeat, workdir, seed=0):
+    """Times every stage for one synthetic tree and returns the result rows."""
+    config = {"rules": count, "depth": depth, "fanout": fanout, "body_bytes": body_bytes}
+    scratch = tempfile.mkdtemp(prefix="generator-bench-", dir=workdir)
+    try:
+        source_dir = os.path.join(scratch, "src")
+        project_root = os.path.join(scratch, "out")
+        write_sources(synthesize_rules(count, depth, fanout, body_bytes, seed), source_dir)
+        rows = []
+
+        times, entries = time_call(lambda: generator.load_rule_sources(source_dir), repeat)
+        total_bytes = sum(len(e["body"].encode("utf-8")) for e in entries)
+        config["total_mb"] = round(total_bytes / 1e6, 2)
+        rows.append(_result(config, "load", "-", 1, times, total_bytes))
+
+        times, rendered = time_call(lambda: generator.render_all(entries, project_root), repeat)
+        rows.append(_result(config, "render", "-", 1, times, total_bytes))
+
+        texts = [(item["path"], rule_graph.NODE_RULE, item["content"]) for item in rendered]
+        times, _ = time_call(lambda: rule_graph.build_graph_from_texts(texts), repeat)
+        rows.append(_result(config, "graph", "-", 1, times, total_bytes))
+
+        manifest_path = os.path.join(project_root, generator.RULES_PATH_PREFIX, generator.MANIFEST_FILENAME)
+
+        def write(jobs):
+            return generator.generate_mdc_files(entries, project_root, manifest_path, jobs=jobs, rendered=rendered)
+
+        def clear_output():
+            shutil.rmtree(project_root, ignore_errors=True)
+
+        def drop_manifest():
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+
+        for jobs in jobs_list:
+            times, stats = time_call(lambda: write(jobs), repeat, setup=clear_output)
+            _expect(stats, "written", count)
+            rows.append(_result(config, "write", "cold", jobs, times, total_bytes))
+            times, stats = time_call(lambda: write(jobs), repeat)
+            _expect(stats, "skipped", count)
+            rows.append(_result(config, "write", "warm", jobs, times, total_bytes))
+            times, stats = time_call(lambda: write(jobs), repeat, setup=drop_manifest)
+            _expect(stats, "skipped", count)
+            rows.append(_result(config, "verify", "no manifest", jobs, times, total_bytes))
+        return rows
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+def environment():
+    """Describes the machine and commit, so results can be told apart."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+            "cpus": os.cpu_count(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def row_key(row):
+    return (row["rules"], row["depth"], row["fanout"], row["body_bytes"], row["stage"], row["mode"], row["jobs"])
+
+def is_regression(row, old_s, ratio):
+    return ratio is not None and ratio > REGRESSION_FACTOR and row["min_s"] - old_s > NOISE_FLOOR_S
+
+def compare(baseline_rows, rows):
+    """Returns [(row, baseline min_s or None, ratio)] matching rows by configuration and stage."""
+    baseline = {row_key(r): r for r in baseline_rows}
+    result = []
+    for row in rows:
+        old = baseline.get(row_key(row))
+        ratio = row["min_s"] / old["min_s"] if old and old["min_s"] else None
+        result.append((row, old["min_s"] if old else None, ratio))
+    return result
+
+def print_rows(rows, comparison=None):
+    ratios = {id(row): (old, ratio) for row, old, ratio in comparison or ()}
+    print(f"{'rules':>6} {'MB':>6} {'stage':<7} {'mode':<12} {'jobs':>4} {'min ms':>9} {'median ms':>10} "
+          f"{'us/rule':>8} {'MB/s':>7}" + (f" {'baseline':>9} {'ratio':>6}" if comparison else ""))
+    for row in rows:
+        line = (f"{row['rules']:>6} {row['total_mb']:>6.2f} {row['stage']:<7} {row['mode']:<12} {row['jobs']:>4} "
+                f"{row['min_s'] * 1000:>9.1f} {row['median_s'] * 1000:>10.1f} {row['per_rule_us']:>8.1f} "
+                f"{row['mb_per_s'] or 0:>7.1f}")
+        if comparison:
+            old, ratio = ratios[id(row)]
+            if old is None:
+                line += f" {'-':>9} {'-':>6}"
+            else:
+                flag = "  slower" if is_regression(row, old, ratio) else ""
+                line += f" {old * 1000:>9.1f} {ratio:>6.2f}{flag}"
+        print(line)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark refine-instructions.py on synthetic rule trees.")
+    parser.add_argument("--rules", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help=f"Tree sizes to benchmark (default: {' '.join(map(str, DEFAULT_SIZES))}).")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH,
+                        help=f"Directory levels below isolation_rules/ (default: {DEFAULT_DEPTH}).")
+    parser.add_argument("--fanout", type=int, default=DEFAULT_FANOUT,
+                        help=f"Subdirectories per directory level (default: {DEFAULT_FANOUT}).")
+    parser.add_argument("--body-bytes", type=int, default=DEFAULT_BODY_BYTES,
+                        help=f"Approximate body size of each rule (default: {DEFAULT_BODY_BYTES}).")
+    parser.add_argument("--jobs", type=int, nargs="+", default=None,
+                        help=f"Writer thread counts for write/verify (default: 1 {generator.default_jobs()}).")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per stage; the fastest is reported (default: {DEFAULT_REPEAT}).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic rules (default: 0).")
+    parser.add_argument("--workdir", default=None, help="Scratch directory parent (default: the system temp dir).")
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON to PATH.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against results previously written with --json.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    jobs_list = args.jobs or sorted({1, generator.default_jobs()})
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Cannot read baseline {args.compare}: {e}")
+    rows = []
+    for count in args.rules:
+        print(f"Benchmarking {count} rules (depth {args.depth}, ~{args.body_bytes} bytes each)...", file=sys.stderr)
+        rows.extend(bench_config(count, args.depth, args.fanout, args.body_bytes, jobs_list, args.repeat,
+                                 args.workdir, args.seed))
+    comparison = compare(baseline["results"], rows) if baseline else None
+    print_rows(rows, comparison)
+    if baseline:
+        print(f"\nBaseline: commit {baseline['environment'].get('commit')}, {baseline['environment'].get('timestamp')}")
+    if args.json:
+        payload = {"environment": environment(), "results": rows}
+        memory_bank.atomic_write_text(args.json, json.dumps(payload, indent=2) + "\n")
+        print(f"Wrote {args.json}")
+    slower = [row for row, old, ratio in comparison or () if is_regression(row, old, ratio)]
+    sys.exit(1 if slower else 0)
@@ -0,0 +1,83 @@
+# Shared helpers for the scripts that read and maintain the memory-bank/
+# directory of a project (activeContext.md, progress.md, tasks.md, QA status,
+# caches). Paths are relative to the project root the scripts are run from.
+
+import contextlib
+import hashlib
+import os
+import tempfile
+
+MEMORY_BANK_DIR = "memory-bank"
+ACTIVE_CONTEXT_FILE = os.path.join(MEMORY_BANK_DIR, "activeContext.md")
+PROGRESS_FILE = os.path.join(MEMORY_BANK_DIR, "progress.md")
+TASKS_FILE = os.path.join(MEMORY_BANK_DIR, "tasks.md")
+ARCHIVE_DIR = os.path.join(MEMORY_BANK_DIR, "archive")
+
+def memory_bank_path(project_root, *parts):
+    """Joins parts below the project's memory-bank/ directory."""
+    return os.path.join(project_root, MEMORY_BANK_DIR, *parts)
+
+def sidecar_path(filepath, suffix):
+    """Returns the hidden sidecar file next to filepath, e.g. '.activeContext.md.index.json'."""
+    dir_name, base = os.path.split(filepath)
+    return os.path.join(dir_name, f".{base}.{suffix}")
+
+@contextlib.contextmanager
+def atomic_open(filepath):
+    """Opens a temp file next to filepath for binary writing and renames it into
+    place when the block exits cleanly; on error the temp file is removed.
+
+    Readers never observe a partially written file. Parent directories are
+    created as needed.
+    """
+    dir_name = os.path.dirname(filepath) or "."
+    os.makedirs(dir_name, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=f".{os.path.basename(filepath)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def atomic_write_bytes(filepath, data):
+    """Writes data to a temp file next to filepath and renames it into place."""
+    with atomic_open(filepath) as f:
+        f.write(data)
+
+def atomic_write_text(filepath, content):
+    atomic_write_bytes(filepath, content.encode("utf-8"))
+
+def stat_signature(filepath):
+    """Returns (size, mtime_ns) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+def sha256_file(filepath, chunk_size=1 << 20):
+    """Returns the sha256 hex digest of a file, or None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def read_range(filepath, start, end):
+    """Reads bytes [start, end) of a file and decodes them as UTF-8."""
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode("utf-8", errors="replace")
@@ -0,0 +1,204 @@
+# Run this script from the root of the project.
+#
+# Full-text search over the documents that accumulate in memory-bank/creative/,
+# memory-bank/reflection/ and memory-bank/archive/. Every Markdown file is split
+# into heading sections (byte offsets from active_context.parse_sections) and
+# indexed in a local SQLite FTS5 table (memory-bank/.search_index.sqlite).
+# Each run first brings the index up to date: unchanged files (same size and
+# mtime) are skipped without being read, touched-but-identical files (same
+# sha256) only have their stat refreshed, and only changed files are re-split.
+# A query returns the best-ranked sections with their byte ranges, so REFLECT
+# and CREATIVE mode can read the one relevant past paragraph instead of whole
+# documents.
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+
+import active_context
+import memory_bank
+
+INDEX_FILE = os.path.join(memory_bank.MEMORY_BANK_DIR, ".search_index.sqlite")
+SCHEMA_VERSION = 1
+SEARCH_DIRS = ["creative", "reflection", "archive"]
+# bm25 weights of the (heading, body) columns: a hit in a heading counts more.
+HEADING_WEIGHT = 4.0
+BODY_WEIGHT = 1.0
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+def connect(index_file=INDEX_FILE):
+    """Opens the index, (re)creating the schema if it is missing or outdated."""
+    os.makedirs(os.path.dirname(index_file) or ".", exist_ok=True)
+    db = sqlite3.connect(index_file)
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    if version != SCHEMA_VERSION:
+        db.executescript("""
+            DROP TABLE IF EXISTS files;
+            DROP TABLE IF EXISTS sections;
+            DROP TABLE IF EXISTS sections_fts;
+            CREATE TABLE files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT);
+            CREATE TABLE sections (id INTEGER PRIMARY KEY, path TEXT, heading TEXT, level INTEGER,
+                                   start INTEGER, end INTEGER, line INTEGER);
+            CREATE INDEX sections_path ON sections (path);
+            CREATE VIRTUAL TABLE sections_fts USING fts5(heading, body, tokenize='porter unicode61');
+        """)
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        db.commit()
+    return db
+
+def document_paths(memory_bank_dir=memory_bank.MEMORY_BANK_DIR, dirs=SEARCH_DIRS):
+    """All Markdown files below the searched memory-bank/ subdirectories, as
+    '/'-separated paths so the index is the same on every platform."""
+    paths = []
+    for name in dirs:
+        for root, subdirs, files in os.walk(os.path.join(memory_bank_dir, name)):
+            subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+            paths.extend(os.path.join(root, f).replace(os.sep, "/") for f in sorted(files)
+                         if f.endswith(".md") and not f.startswith("."))
+    return paths
+
+def split_document(data):
+    """Returns [(heading path, level, start, end, line, body)] for one document.
+
+    The heading path joins the enclosing headings ("Decision > Option 2"), so
+    a hit deep in a document still says where it is.
+    """
+    chunks = []
+    trail = []
+    for section in active_context.parse_sections(data):
+        if section.inline:
+            continue
+        if section.level:
+            trail = [t for t in trail if t[0] < section.level] + [(section.level, section.title)]
+        body = data[section.start:section.end].decode("utf-8", errors="replace")
+        if not body.strip():
+            continue
+        heading = " > ".join(title for _, title in trail)
+        chunks.append((heading, section.level, section.start, section.end, section.line, body))
+    return chunks
+
+def _drop(db, path):
+    db.execute("DELETE FROM sections_fts WHERE rowid IN (SELECT id FROM sections WHERE path = ?)", (path,))
+    db.execute("DELETE FROM sections WHERE path = ?", (path,))
+    db.execute("DELETE FROM files WHERE path = ?", (path,))
+
+def update_index(db, memory_bank_dir=memory_bank.MEMORY_BANK_DIR):
+    """Brings the index in line with the documents on disk.
+
+    Returns a dict of counts: indexed, unchanged, touched (stat changed but
+    the content hash did not) and removed.
+    """
+    stats = {"indexed": 0, "unchanged": 0, "touched": 0, "removed": 0}
+    known = {row[0]: row[1:] for row in db.execute("SELECT path, size, mtime_ns, sha256 FROM files")}
+    seen = set()
+    for path in document_paths(memory_bank_dir):
+        seen.add(path)
+        signature = memory_bank.stat_signature(path)
+        if signature is None:
+            continue
+        previous = known.get(path)
+        if previous and tuple(previous[:2]) == signature:
+            stats["unchanged"] += 1
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = memory_bank.sha256_bytes(data)
+        if previous and previous[2] == digest:
+            db.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", (*signature, path))
+            stats["touched"] += 1
+            continue
+        _drop(db, path)
+        db.execute("INSERT INTO files VALUES (?, ?, ?, ?)", (path, *signature, digest))
+        for heading, level, start, end, line, body in split_document(data):
+            cursor = db.execute("INSERT INTO sections (path, heading, level, start, end, line) VALUES (?, ?, ?, ?, ?, ?)",
+                                (path, heading, level, start, end, line))
+            db.execute("INSERT INTO sections_fts (rowid, heading, body) VALUES (?, ?, ?)",
+                       (cursor.lastrowid, heading, body))
+        stats["indexed"] += 1
+    for path in set(known) - seen:
+        _drop(db, path)
+        stats["removed"] += 1
+    db.commit()
+    return stats
+
+def fts_query(text, any_term=False):
+    """Turns free text into an FTS5 query of quoted terms (AND, or OR with any_term)."""
+    terms = [f'"{w}"' for w in _WORD_RE.findall(text)]
+    return (" OR " if any_term else " ").join(terms)
+
+def search(db, text, limit=5, within=None, any_term=False):
+    """Returns the best-ranked sections for text as dicts, best first.
+
+    All terms must match; if nothing does, sections matching any term are
+    returned instead. within restricts results to one subdirectory
+    (e.g. "creative").
+    """
+    query = fts_query(text, any_term)
+    if not query:
+        return []
+    sql = f"""SELECT s.path, s.heading, s.start, s.end, s.line,
+                     bm25(sections_fts, {HEADING_WEIGHT}, {BODY_WEIGHT}) AS score,
+                     snippet(sections_fts, 1, '[', ']', ' ... ', 12)
+              FROM sections_fts JOIN sections s ON s.id = sections_fts.rowid
+              WHERE sections_fts MATCH ?"""
+    params = [query]
+    if within:
+        sql += " AND s.path LIKE ? ESCAPE '\\'"
+        prefix = memory_bank.MEMORY_BANK_DIR + "/" + within + "/"
+        params.append(re.sub(r"([\\%_])", r"\\\1", prefix) + "%")
+    sql += " ORDER BY score LIMIT ?"
+    params.append(limit)
+    rows = db.execute(sql, params).fetchall()
+    if not rows and not any_term and len(query.split()) > 1:
+        return search(db, text, limit, within, any_term=True)
+    return [{"path": r[0], "heading": r[1], "start": r[2], "end": r[3], "line": r[4],
+             "score": round(-r[5], 3), "snippet": " ".join(r[6].split())} for r in rows]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Search memory-bank/ creative, reflection and archive documents.")
+    parser.add_argument("--index", default=INDEX_FILE, help=f"Index location (default: {INDEX_FILE}).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("update", help="Bring the index up to date and print what changed.")
+    query = sub.add_parser("search", help="Print the best-matching sections.")
+    query.add_argument("terms", nargs="+")
+    query.add_argument("-n", "--limit", type=int, default=5, help="Number of sections (default: 5).")
+    query.add_argument("--in", dest="within", choices=SEARCH_DIRS, help="Only search this subdirectory.")
+    query.add_argument("--any", action="store_true", help="Match sections with any of the terms.")
+    query.add_argument("--show", action="store_true", help="Print each section's text.")
+    query.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    started = time.perf_counter()
+    try:
+        db = connect(args.index)
+        stats = update_index(db)
+    except (OSError, sqlite3.Error) as e:
+        raise SystemExit(f"Cannot update search index {args.index}: {e}")
+    if args.command == "update":
+        print(f"Indexed {stats['indexed']}, unchanged {stats['unchanged']}, touched {stats['touched']}, "
+              f"removed {stats['removed']} documents in {(time.perf_counter() - started) * 1000:.0f} ms.")
+        sys.exit(0)
+    results = search(db, " ".join(args.terms), args.limit, args.within, args.any)
+    if args.json:
+        for result in results:
+            if args.show:
+                result["text"] = memory_bank.read_range(result["path"], result["start"], result["end"])
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        sys.exit(0 if results else 1)
+    if not results:
+        print("No matching sections.")
+        sys.exit(1)
+    for result in results:
+        print(f"{result['path']}:{result['line']} [bytes {result['start']}-{result['end']}] "
+              f"{result['heading'] or '(preamble)'} (score {result['score']:g})")
+        print(f"    {result['snippet']}")
+        if args.show:
+            print(memory_bank.read_range(result["path"], result["start"], result["end"]).rstrip() + "\n")
@@ -0,0 +1,431 @@
+# Run this script from the root of the project.
+#
+# Finds near-duplicate paragraphs across the rule sources (the entries that make
+# up MDC_FILES_DATA in refine-instructions.py) using word shingles, MinHash
+# signatures and locality-sensitive hashing, and reports how many tokens the
+# repeated copies cost. refine-instructions.py can optionally hoist the repeated
+# paragraphs into a single shared Core rule (--hoist-duplicates) where that
+# makes the mode sessions loading them smaller.
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+
+import context_budget
+import memory_bank
+import rule_graph
+
+SHINGLE_SIZE = 5
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+# Shorter paragraphs are too small to be worth reporting.
+DEFAULT_MIN_TOKENS = 15
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_LIST_MARKER = r"^\s*(?:[-*+]|\d+\.|[a-z]{1,4}\.|[ivx]+\.)\s+"
+_LIST_ITEM_RE = re.compile(_LIST_MARKER)
+_LIST_MARKER_RE = re.compile(_LIST_MARKER, re.MULTILINE)
+_WORD_RE = re.compile(r"\w+")
+
+def _indent(line):
+    return len(line) - len(line.lstrip())
+
+def _item_end(lines, start, in_fence):
+    """End (exclusive) of the list item at start: its continuation lines and
+    everything indented deeper than its marker, blank lines and code blocks
+    inside it included, up to the next item at its level, a heading, or text
+    at its indentation after a blank line."""
+    indent = _indent(lines[start])
+    end = start + 1
+    blank = False
+    for j in range(start + 1, len(lines)):
+        line = lines[j]
+        if in_fence[j] and not line.strip().startswith("```"):
+            end = j + 1
+            continue
+        if not line.strip():
+            blank = True
+            continue
+        if line.lstrip().startswith("#") and not in_fence[j]:
+            break
+        deeper = _indent(line) > indent
+        if not deeper and (_LIST_ITEM_RE.match(line) or blank):
+            break
+        end = j + 1
+        blank = False
+    return end
+
+def split_paragraphs(body):
+    """Splits a rule body into (start_line, end_line, text) units, end exclusive.
+
+    Units are blank-line separated paragraphs, fenced code blocks (blank lines
+    included) and list items. A list item unit carries its nested sub-items
+    and code blocks, so replacing it never orphans them; every nested item is
+    also a unit of its own. Units may therefore overlap.
+    """
+    lines = body.split("\n")
+    in_fence = []
+    fenced = False
+    for line in lines:
+        if line.strip().startswith("```"):
+            in_fence.append(True)
+            fenced = not fenced
+        else:
+            in_fence.append(fenced)
+
+    units = []
+    covered_until = 0
+    start = None
+
+    def close(end):
+        if start is not None:
+            units.append((start, end, "\n".join(lines[start:end])))
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if stripped.startswith("```") and i >= covered_until:
+            close(i)
+            end = i + 1
+            while end < len(lines) and not lines[end].strip().startswith("```"):
+                end += 1
+            start = i
+            close(min(end + 1, len(lines)))
+            start = None
+            i = end + 1
+            continue
+        if in_fence[i]:
+            i += 1
+            continue
+        if _LIST_ITEM_RE.match(line):
+            if i >= covered_until:
+                close(i)
+                start = None
+            end = _item_end(lines, i, in_fence)
+            units.append((i, end, "\n".join(lines[i:end])))
+            covered_until = max(covered_until, end)
+        elif i >= covered_until:
+            if not stripped:
+                close(i)
+                start = None
+            elif stripped.startswith("#"):
+                close(i)
+                start = i
+            elif start is None:
+                start = i
+        i += 1
+    close(len(lines))
+    return sorted(units)
+
+def normalize_paragraph(text):
+    """Lowercases and strips list markers and punctuation so cosmetic edits still match."""
+    return " ".join(_WORD_RE.findall(_LIST_MARKER_RE.sub("", text).lower()))
+
+def shingles(normalized, size=SHINGLE_SIZE):
+    words = normalized.split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+def _hash64(value):
+    return struct.unpack("<Q", hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest())[0]
+
+def _permutations(count):
+    # Deterministic (a, b) coefficients so reports are reproducible across runs.
+    coefficients = []
+    for i in range(count):
+        a = _hash64(f"minhash-a-{i}") % (_MERSENNE_PRIME - 1) + 1
+        b = _hash64(f"minhash-b-{i}") % _MERSENNE_PRIME
+        coefficients.append((a, b))
+    return coefficients
+
+_PERMUTATIONS = _permutations(NUM_PERMUTATIONS)
+
+def minhash(shingle_set):
+    """Returns the MinHash signature (a tuple of NUM_PERMUTATIONS ints) of a shingle set."""
+    hashes = [_hash64(s) for s in shingle_set]
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+def overlaps(a, b):
+    """Whether two paragraphs share lines (a list item and one of its sub-items)."""
+    return a["path"] == b["path"] and a["line"] < b["end"] and b["line"] < a["end"]
+
+def collect_paragraphs(files_data, tokenizer, min_tokens=DEFAULT_MIN_TOKENS):
+    """Extracts the candidate paragraphs of every rule.
+
+    Returns a list of dicts with "path", "line" and "end" (1-based, end
+    exclusive), "text", "tokens", "normalized" and "shingles". Headings and
+    short paragraphs are skipped.
+    """
+    paragraphs = []
+    for file_data in files_data:
+        for line, end, text in split_paragraphs(file_data["body"].strip()):
+            if text.lstrip().startswith("#") and "\n" not in text:
+                continue
+            tokens = tokenizer(text)
+            if tokens < min_tokens:
+                continue
+            normalized = normalize_paragraph(text)
+            paragraphs.append({"path": file_data["path"], "line": line + 1, "end": end + 1, "text": text,
+                               "tokens": tokens, "normalized": normalized,
+                               "shingles": shingles(normalized)})
+    return paragraphs
+
+def find_duplicate_clusters(paragraphs, threshold=DEFAULT_THRESHOLD):
+    """Groups paragraphs whose shingle Jaccard similarity is at least threshold.
+
+    Candidate pairs come from LSH over MinHash signatures and are then verified
+    against the exact shingle sets. Returns clusters (lists of paragraph
+    indexes) with at least two members, each sorted by index.
+    """
+    rows = NUM_PERMUTATIONS // LSH_BANDS
+    buckets = {}
+    for index, paragraph in enumerate(paragraphs):
+        signature = minhash(paragraph["shingles"])
+        for band in range(LSH_BANDS):
+            key = (band, signature[band * rows:(band + 1) * rows])
+            buckets.setdefault(key, []).append(index)
+
+    parent = list(range(len(paragraphs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                pair = (members[x], members[y])
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                if overlaps(paragraphs[pair[0]], paragraphs[pair[1]]):
+                    continue
+                if jaccard(paragraphs[pair[0]]["shingles"], paragraphs[pair[1]]["shingles"]) >= threshold:
+                    parent[find(pair[1])] = find(pair[0])
+
+    clusters = {}
+    for index in range(len(paragraphs)):
+        clusters.setdefault(find(index), []).append(index)
+    return [sorted(c) for c in clusters.values() if len(c) > 1]
+
+def cluster_report(paragraphs, clusters):
+    """Summarizes clusters, ranked by redundant tokens (every copy after the first).
+
+    Returns a list of dicts with "occurrences" [(path, line, tokens)],
+    "rules", "total_tokens", "redundant_tokens", "min_similarity" and a
+    "sample" of the first paragraph.
+    """
+    report = []
+    for cluster in clusters:
+        members = [paragraphs[i] for i in cluster]
+        # Sub-items of a repeated item are reported with the item.
+        if all(any(overlaps(m, paragraphs[o]) and paragraphs[o]["end"] - paragraphs[o]["line"] > m["end"] - m["line"]
+                   for other in clusters if other is not cluster for o in other) for m in members):
+            continue
+        similarities = [jaccard(members[0]["shingles"], m["shingles"]) for m in members[1:]]
+        total = sum(m["tokens"] for m in members)
+        report.append({
+            "occurrences": [(m["path"], m["line"], m["tokens"]) for m in members],
+            "rules": len({m["path"] for m in members}),
+            "total_tokens": total,
+            "redundant_tokens": total - max(m["tokens"] for m in members),
+            "min_similarity": round(min(similarities), 3),
+            "sample": members[0]["text"],
+        })
+    report.sort(key=lambda r: (-r["redundant_tokens"], r["occurrences"][0]))
+    return report
+
+def analyze(files_data, tokenizer, threshold=DEFAULT_THRESHOLD, min_tokens=DEFAULT_MIN_TOKENS):
+    """Runs the whole pass and returns (paragraphs, clusters, report)."""
+    paragraphs = collect_paragraphs(files_data, tokenizer, min_tokens)
+    clusters = find_duplicate_clusters(paragraphs, threshold)
+    return paragraphs, clusters, cluster_report(paragraphs, clusters)
+
+def print_report(report, top=15):
+    redundant = sum(r["redundant_tokens"] for r in report)
+    print(f"Near-duplicate paragraph clusters: {len(report)}, redundant tokens across rules: {redundant:,}")
+    for r in report[:top]:
+        first_line = r["sample"].strip().split("\n")[0][:90]
+        print(f"\n  {r['redundant_tokens']:>6,} redundant tokens, {len(r['occurrences'])} copies in "
+              f"{r['rules']} rule(s), similarity >= {r['min_similarity']}")
+        print(f"    \"{first_line}\"")
+        for path, line, tokens in r["occurrences"]:
+            print(f"      {path}:{line} ({tokens} tokens)")
+
+# --- Hoisting ---
+SHARED_RULE_NAME = "Core/shared-snippets.mdc"
+SHARED_RULE_PATH = ".cursor/rules/isolation_rules/" + SHARED_RULE_NAME
+
+def session_paths(files_data, project_root="."):
+    """Returns [(mode, level, {rule paths})]: every rule a mode prompt can reach
+    through fetch_rules at a complexity level, alwaysApply rules included (the
+    worst_case scenario of context_budget.py)."""
+    sources = [(f["path"], rule_graph.NODE_RULE,
+                f"---\nalwaysApply: {str(f['alwaysApply']).lower()}\n---\n{f['body']}") for f in files_data]
+    for mode in context_budget.MODE_PROMPTS:
+        mode_id = rule_graph.MODES_DIR + "/" + mode
+        try:
+            with open(os.path.join(project_root, mode_id), "r", encoding="utf-8") as f:
+                sources.append((mode_id, rule_graph.NODE_MODE, f.read()))
+        except OSError:
+            continue
+    graph = rule_graph.build_graph_from_texts(sources)
+    always_on = {f["path"] for f in files_data if f["alwaysApply"]}
+    paths = []
+    for mode_id, _, _ in sources[len(files_data):]:
+        for level in context_budget.COMPLEXITY_LEVELS:
+            adj = context_budget.level_adjacency(graph, level)
+            rules = set(context_budget.closure(adj, mode_id)) - {mode_id}
+            paths.append((mode_id.rsplit("/", 1)[-1], level, rules | always_on))
+    return paths
+
+def _shared_body(snippets):
+    return "# SHARED SNIPPETS\n\n" + "\n\n".join(f"## {snippet_id}\n{text}" for snippet_id, text, _ in snippets)
+
+def _snippet_text(text):
+    """The unit without its own list marker and indentation."""
+    lines = text.split("\n")
+    indent = _indent(lines[0])
+    lines[0] = _LIST_ITEM_RE.sub("", lines[0]).strip()
+    return "\n".join([lines[0]] + [line[min(indent, _indent(line)):] for line in lines[1:]])
+
+def _reference(snippet_id):
+    # The bare file name resolves to the shared rule and keeps every copy short.
+    return f"Follow `{snippet_id}` in `{SHARED_RULE_NAME.rsplit('/', 1)[-1]}`."
+
+def _replacement(member, reference):
+    first = member["text"].split("\n")[0]
+    # Keep the unit's own indentation and list marker ("    a.  ").
+    marker = _LIST_ITEM_RE.match(first)
+    return (marker.group(0) if marker else first[:_indent(first)]) + reference
+
+def hoist_duplicates(files_data, paragraphs, clusters, tokenizer, paths, min_similarity=1.0):
+    """Replaces repeated units with references to one shared Core rule.
+
+    Only clusters whose copies are all at least min_similarity alike (1.0 means
+    identical after normalization) and occur in two or more rules are
+    candidates. A cluster is hoisted only if every session in paths (see
+    session_paths) that loads one of its copies still gets smaller: the copies
+    it loads shrink to a reference, but it now also loads the shared rule.
+    Returns (new_files_data, shared_entry, savings) where shared_entry is None
+    if nothing was hoisted and savings is [(mode, level, tokens before,
+    tokens after)] for the sessions that changed. The input entries are not
+    modified.
+    """
+    candidates = []
+    for cluster in clusters:
+        members = [paragraphs[i] for i in cluster]
+        if len({m["path"] for m in members}) < 2:
+            continue
+        if min(jaccard(members[0]["shingles"], m["shingles"]) for m in members) < min_similarity:
+            continue
+        candidates.append(members)
+    candidates.sort(key=lambda ms: (-sum(m["tokens"] for m in ms), ms[0]["path"], ms[0]["line"]))
+
+    def net_savings(snippets):
+        saved = {}
+        for snippet_id, _, members in snippets:
+            reference = _reference(snippet_id)
+            for m in members:
+                gain = m["tokens"] - tokenizer(_replacement(m, reference))
+                for index, (_, _, rules) in enumerate(paths):
+                    if m["path"] in rules:
+                        saved[index] = saved.get(index, 0) + gain
+        shared_tokens = tokenizer(_shared_body(snippets))
+        return {index: gain - shared_tokens for index, gain in saved.items()}
+
+    snippets = []
+    for members in candidates:
+        taken = [m for _, _, ms in snippets for m in ms]
+        if any(overlaps(m, t) for m in members for t in taken):
+            continue
+        trial = snippets + [(f"SNIPPET-{len(snippets) + 1:02d}", _snippet_text(members[0]["text"]), members)]
+        net = net_savings(trial)
+        if net and all(gain > 0 for gain in net.values()):
+            snippets = trial
+
+    if not snippets:
+        return list(files_data), None, []
+
+    replacements = {}
+    for snippet_id, _, members in snippets:
+        reference = _reference(snippet_id)
+        for m in members:
+            replacements.setdefault(m["path"], {})[m["line"]] = (m["end"], _replacement(m, reference))
+    new_files_data = []
+    for file_data in files_data:
+        by_line = replacements.get(file_data["path"])
+        if not by_line:
+            new_files_data.append(file_data)
+            continue
+        lines = file_data["body"].strip().split("\n")
+        # Replace from the bottom up so earlier line numbers stay valid.
+        for line in sorted(by_line, reverse=True):
+            end, replacement = by_line[line]
+            lines[line - 1:end - 1] = [replacement]
+        new_files_data.append(dict(file_data, body="\n".join(lines)))
+
+    shared_entry = {
+        "path": SHARED_RULE_PATH,
+        "description": "Shared instruction snippets hoisted from other rules by refine-instructions.py --hoist-duplicates. Fetched by rules that reference a SNIPPET-NN.",
+        "globs": "**/Core/shared-snippets.mdc",
+        "alwaysApply": False,
+        "body": _shared_body(snippets),
+    }
+    before = {f["path"]: tokenizer(f["body"]) for f in files_data}
+    after = {f["path"]: tokenizer(f["body"]) for f in new_files_data}
+    shared_tokens = tokenizer(shared_entry["body"])
+    savings = []
+    for mode, level, rules in paths:
+        if rules & replacements.keys():
+            savings.append((mode, level, sum(before.get(r, 0) for r in rules),
+                            sum(after.get(r, 0) for r in rules) + shared_tokens))
+    return new_files_data, shared_entry, savings
+
+def load_generator():
+    """Imports refine-instructions.py (whose file name is not a valid module name)."""
+    import importlib.util
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "refine-instructions.py")
+    spec = importlib.util.spec_from_file_location("refine_instructions", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Report near-duplicate paragraphs across the rule sources.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum shingle Jaccard similarity (default: {DEFAULT_THRESHOLD}).")
+    parser.add_argument("--min-tokens", type=int, default=DEFAULT_MIN_TOKENS,
+                        help=f"Ignore paragraphs shorter than this (default: {DEFAULT_MIN_TOKENS}).")
+    parser.add_argument("--tokenizer", default=context_budget.DEFAULT_TOKENIZER,
+                        help="Tokenizer name or module:function, as in context_budget.py.")
+    parser.add_argument("--only", action="append", metavar="GLOB", help="Only analyze matching rule sources.")
+    parser.add_argument("--top", type=int, default=15, help="Number of clusters to print.")
+    parser.add_argument("--json", metavar="PATH", help="Write the full report as JSON to PATH.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        tokenizer = context_budget.get_tokenizer(args.tokenizer)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    generator = load_generator()
+    files_data = generator.load_rule_sources(generator.DEFAULT_SOURCE_DIR, args.only)
+    _, _, report = analyze(files_data, tokenizer, args.threshold, args.min_tokens)
+    print_report(report, args.top)
+    if args.json:
+        memory_bank.atomic_write_text(args.json, json.dumps(report, indent=2) + "\n")
+        print(f"\nWrote report JSON: {args.json}")
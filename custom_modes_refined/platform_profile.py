@@ -0,0 +1,171 @@
+# Run this script from the root of the project.
+#
+# Probes the host platform once and caches the result in
+# memory-bank/.platform_profile.json: OS, shell, path separator and the
+# command equivalents `run_terminal_cmd` needs (mkdir, ls, rm, env, ...). The
+# profile is reused until the host fingerprint (OS, release, architecture,
+# host name and shell) changes, so the agent does not have to re-derive the
+# platform from techContext.md/activeContext.md or ask the user every session.
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+
+import memory_bank
+
+PROFILE_FILE = os.path.join(memory_bank.MEMORY_BANK_DIR, ".platform_profile.json")
+SCHEMA_VERSION = 1
+
+# Command templates per shell family. {path}, {name}, {value}, {src}, {dst}
+# are placeholders for the agent to fill in.
+COMMANDS = {
+    "posix": {
+        "mkdir": "mkdir -p {path}",
+        "list": "ls -la {path}",
+        "remove_file": "rm {path}",
+        "remove_dir": "rm -rf {path}",
+        "copy": "cp -r {src} {dst}",
+        "move": "mv {src} {dst}",
+        "set_env": "export {name}={value}",
+        "read_env": "echo ${name}",
+        "which": "command -v {name}",
+        "chain": "&&",
+    },
+    "powershell": {
+        "mkdir": "New-Item -ItemType Directory -Force -Path {path}",
+        "list": "Get-ChildItem -Force {path}",
+        "remove_file": "Remove-Item {path}",
+        "remove_dir": "Remove-Item -Recurse -Force {path}",
+        "copy": "Copy-Item -Recurse {src} {dst}",
+        "move": "Move-Item {src} {dst}",
+        "set_env": "$env:{name}=\"{value}\"",
+        "read_env": "$env:{name}",
+        "which": "Get-Command {name}",
+        "chain": ";",
+    },
+    "cmd": {
+        "mkdir": "mkdir {path}",
+        "list": "dir {path}",
+        "remove_file": "del {path}",
+        "remove_dir": "rmdir /s /q {path}",
+        "copy": "xcopy /e /i {src} {dst}",
+        "move": "move {src} {dst}",
+        "set_env": "set {name}={value}",
+        "read_env": "echo %{name}%",
+        "which": "where {name}",
+        "chain": "&&",
+    },
+}
+PROBED_TOOLS = ["git", "node", "npm", "python3", "python", "pip", "make", "docker"]
+
+def os_name():
+    system = platform.system()
+    return {"Darwin": "macOS"}.get(system, system or "Unknown")
+
+def in_powershell(env):
+    """Guesses whether a Windows process runs under PowerShell rather than cmd.exe.
+
+    Windows sets PSModulePath system-wide, so its presence alone says nothing.
+    PowerShell adds the user's own module directory (under the profile or
+    Documents) to it, and cmd.exe sets PROMPT, which PowerShell does not.
+    """
+    module_path = env.get("PSModulePath")
+    if not module_path:
+        return False
+    profile = env.get("USERPROFILE", "").rstrip("\\").lower()
+    for segment in module_path.lower().split(";"):
+        if (profile and segment.startswith(profile + "\\")) or "\\documents\\" in segment:
+            return True
+    return "PROMPT" not in env
+
+def detect_shell(env=None):
+    """Returns (shell name, shell path, family) from the environment, without running anything."""
+    env = os.environ if env is None else env
+    if os.name == "nt":
+        if in_powershell(env):
+            path = shutil.which("pwsh") or shutil.which("powershell") or "powershell"
+            return "powershell", path, "powershell"
+        return "cmd", env.get("ComSpec", "cmd.exe"), "cmd"
+    path = env.get("SHELL") or "/bin/sh"
+    return os.path.basename(path), path, "posix"
+
+def host_fingerprint(env=None):
+    """Hash of everything the profile depends on. Cheap: no subprocesses, no file reads."""
+    shell, shell_path, _ = detect_shell(env)
+    parts = [str(SCHEMA_VERSION), platform.system(), platform.release(), platform.machine(),
+             platform.node(), os.sep, shell, shell_path]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+def detect_profile(env=None):
+    """Probes the host and returns a fresh profile dict."""
+    shell, shell_path, family = detect_shell(env)
+    return {
+        "schema": SCHEMA_VERSION,
+        "fingerprint": host_fingerprint(env),
+        "detected_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "os": os_name(),
+        "os_release": platform.release(),
+        "machine": platform.machine(),
+        "shell": shell,
+        "shell_path": shell_path,
+        "shell_family": family,
+        "path_separator": os.sep,
+        "line_ending": "CRLF" if os.name == "nt" else "LF",
+        "commands": COMMANDS[family],
+        "tools": {tool: shutil.which(tool) for tool in PROBED_TOOLS},
+    }
+
+def load_profile(path=PROFILE_FILE):
+    """Returns the cached profile, or None if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(profile, dict) or profile.get("schema") != SCHEMA_VERSION:
+        return None
+    return profile
+
+def get_profile(path=PROFILE_FILE, refresh=False, env=None):
+    """Returns (profile, probed): the cached profile if the host fingerprint still
+    matches, otherwise a freshly probed one, which is written to path."""
+    if not refresh:
+        cached = load_profile(path)
+        if cached and cached.get("fingerprint") == host_fingerprint(env):
+            return cached, False
+    profile = detect_profile(env)
+    memory_bank.atomic_write_text(path, json.dumps(profile, indent=2) + "\n")
+    return profile, True
+
+def print_profile(profile, probed):
+    source = "probed now" if probed else f"cached since {profile['detected_at']}"
+    print(f"OS: {profile['os']} {profile['os_release']} ({profile['machine']}) [{source}]")
+    print(f"Shell: {profile['shell']} ({profile['shell_family']}), path separator: {profile['path_separator']}")
+    for action, template in profile["commands"].items():
+        print(f"    {action:<12} {template}")
+    found = [t for t, p in profile["tools"].items() if p]
+    print(f"Tools on PATH: {', '.join(found) if found else 'none of ' + ', '.join(profile['tools'])}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Print the cached platform profile, probing the host if needed.")
+    parser.add_argument("--file", default=PROFILE_FILE, help=f"Profile location (default: {PROFILE_FILE}).")
+    parser.add_argument("--refresh", action="store_true", help="Re-probe even if the host fingerprint matches.")
+    parser.add_argument("--json", action="store_true", help="Print the profile as JSON.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        profile, probed = get_profile(args.file, args.refresh)
+    except OSError as e:
+        raise SystemExit(f"Cannot write platform profile {args.file}: {e}")
+    if args.json:
+        json.dump(profile, sys.stdout, indent=2)
+        print()
+    else:
+        print_profile(profile, probed)
@@ -0,0 +1,179 @@
+# Run this script from the root of the project.
+#
+# Structured VAN QA status. memory-bank/.qa_validation_status.json replaces the
+# bare "PASS"/"FAIL" flag file: it records the overall verdict plus each check's
+# status, timing and input fingerprint, so BUILD mode (and anything else that
+# needs to know whether QA passed) can decide from one small read instead of
+# re-parsing the VAN QA log in activeContext.md.
+#
+#   {
+#     "schema": 1,
+#     "status": "PASS",
+#     "timestamp": "2025-05-20 14:03:11",
+#     "source": "van_qa.py",
+#     "duration_ms": 1412,
+#     "checks": {
+#       "dependency": {"status": "PASS", "duration_ms": 903, "cached": false,
+#                      "fingerprint": "3f1c...", "summary": null},
+#       ...
+#     }
+#   }
+#
+# A legacy .qa_validation_status text file ("PASS" or "QA_STATUS: FAIL - ...")
+# is still understood when reading.
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import memory_bank
+
+STATUS_FILE = os.path.join(memory_bank.MEMORY_BANK_DIR, ".qa_validation_status.json")
+LEGACY_STATUS_FILE = os.path.join(memory_bank.MEMORY_BANK_DIR, ".qa_validation_status")
+SCHEMA_VERSION = 1
+CHECK_NAMES = ["dependency", "config", "environment", "build"]
+STATUSES = ["PASS", "WARN", "FAIL", "SKIPPED"]
+
+_LEGACY_RE = re.compile(r"(PASS|FAIL)(?:\s*-\s*(.+))?")
+
+def check_summary(result):
+    """First FAIL (or else WARN) item of a van_qa.py check result, as one line."""
+    for wanted in ("FAIL", "WARN", "SKIPPED"):
+        for entry in result.get("items", []):
+            if entry["status"] == wanted:
+                return f"{entry['name']}: {entry['detail']}" if entry.get("detail") else entry["name"]
+    return None
+
+def status_from_report(report, source="van_qa.py"):
+    """Builds the status document from a van_qa.run_qa() report."""
+    checks = {}
+    for name, result in report["checks"].items():
+        checks[name] = {
+            "status": result["status"],
+            "duration_ms": result.get("duration_ms"),
+            "cached": result.get("cached", False),
+            "fingerprint": result.get("fingerprint"),
+            "summary": check_summary(result),
+        }
+    return {
+        "schema": SCHEMA_VERSION,
+        "status": report["overall"],
+        "timestamp": report["timestamp"],
+        "source": source,
+        "duration_ms": report.get("duration_ms"),
+        "checks": checks,
+    }
+
+def manual_status(overall, check_statuses, source="manual"):
+    """Builds a status document for checks run by hand (e.g. via the VAN QA rules)."""
+    return {
+        "schema": SCHEMA_VERSION,
+        "status": overall,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "source": source,
+        "duration_ms": None,
+        "checks": {name: {"status": status, "duration_ms": None, "cached": False,
+                          "fingerprint": None, "summary": None}
+                   for name, status in check_statuses.items()},
+    }
+
+def write_status(status, path=STATUS_FILE):
+    memory_bank.atomic_write_text(path, json.dumps(status, indent=2) + "\n")
+
+def read_status(path=STATUS_FILE, legacy_path=LEGACY_STATUS_FILE):
+    """Returns the status document, or None if QA has never recorded one.
+
+    Falls back to the legacy flag file (unless legacy_path is None), returned
+    in the same shape with no per-check data. Raises ValueError if the JSON
+    file is malformed.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            status = json.load(f)
+    except FileNotFoundError:
+        status = None
+    if status is not None:
+        if not isinstance(status, dict) or status.get("status") not in ("PASS", "FAIL"):
+            raise ValueError(f"{path} has no valid 'status' field")
+        return status
+    if legacy_path is None:
+        return None
+    try:
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except FileNotFoundError:
+        return None
+    match = _LEGACY_RE.search(text)
+    if not match:
+        raise ValueError(f"{legacy_path} does not contain PASS or FAIL")
+    return {"schema": 0, "status": match.group(1), "timestamp": (match.group(2) or "").strip() or None,
+            "source": "legacy", "duration_ms": None, "checks": {}}
+
+def build_gate(status, max_age_hours=None, now=None):
+    """Decides whether BUILD mode may start. Returns (allowed, reason)."""
+    if status is None:
+        return False, "VAN QA has not been run (no QA status recorded)"
+    if status["status"] != "PASS":
+        failed = [f"{name} ({check['status']}{': ' + check['summary'] if check.get('summary') else ''})"
+                  for name, check in status.get("checks", {}).items() if check["status"] != "PASS"]
+        return False, "VAN QA failed" + (": " + "; ".join(failed) if failed else "")
+    if max_age_hours is not None and status.get("timestamp"):
+        try:
+            recorded = time.mktime(time.strptime(status["timestamp"], "%Y-%m-%d %H:%M:%S"))
+        except ValueError:
+            return False, f"Cannot tell the age of the QA status (timestamp {status['timestamp']!r})"
+        age_hours = ((now or time.time()) - recorded) / 3600
+        if age_hours > max_age_hours:
+            return False, f"VAN QA passed {age_hours:.1f} h ago, older than {max_age_hours} h; re-run VAN QA"
+    return True, f"VAN QA passed at {status.get('timestamp') or 'unknown time'}"
+
+def parse_check_status(spec):
+    name, sep, value = spec.partition("=")
+    if not sep or name not in CHECK_NAMES or value.upper() not in STATUSES:
+        raise argparse.ArgumentTypeError(
+            f"expected CHECK=STATUS with CHECK in {', '.join(CHECK_NAMES)} and STATUS in {', '.join(STATUSES)}")
+    return name, value.upper()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Read, gate on or record the structured VAN QA status.")
+    parser.add_argument("--file", help=f"Status file (default: {STATUS_FILE}, falling back to the legacy "
+                                       f"{LEGACY_STATUS_FILE}).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("show", help="Print the recorded QA status.")
+    gate = sub.add_parser("gate", help="Exit 0 if BUILD mode may start, 1 otherwise.")
+    gate.add_argument("--max-age-hours", type=float, help="Also require the QA run to be this recent.")
+    record = sub.add_parser("record", help="Record the outcome of a manually run QA.")
+    record.add_argument("status", choices=["PASS", "FAIL"])
+    record.add_argument("--check", action="append", type=parse_check_status, default=[],
+                        metavar="CHECK=STATUS", help="Per-check status. May be repeated.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    # The legacy flag file only stands in for the default status file.
+    legacy_path = LEGACY_STATUS_FILE if args.file is None else None
+    args.file = args.file or STATUS_FILE
+    if args.command == "record":
+        write_status(manual_status(args.status, dict(args.check)), args.file)
+        print(f"Recorded QA status {args.status} in {args.file}")
+        sys.exit(0)
+
+    try:
+        status = read_status(args.file, legacy_path)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Cannot read QA status: {e}")
+    if args.command == "show":
+        if status is None:
+            raise SystemExit("No QA status recorded.")
+        print(f"QA status: {status['status']} at {status.get('timestamp')} (source: {status.get('source')})")
+        for name, check in status.get("checks", {}).items():
+            summary = f" - {check['summary']}" if check.get("summary") else ""
+            cached = " (cached)" if check.get("cached") else ""
+            print(f"    {name:<12} {check['status']:<8}{cached}{summary}")
+    elif args.command == "gate":
+        allowed, reason = build_gate(status, args.max_age_hours)
+        print(("BUILD allowed: " if allowed else "BUILD BLOCKED: ") + reason)
+        sys.exit(0 if allowed else 1)
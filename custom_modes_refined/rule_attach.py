@@ -0,0 +1,253 @@
+# Run this script from the root of the project.
+#
+# Simulates which rules Cursor puts in context for a request and what the
+# alwaysApply rules cost. Every rule's frontmatter (description, globs,
+# alwaysApply) is read from .cursor/rules/isolation_rules/: alwaysApply rules
+# are injected into every request, rules whose globs match an open or edited
+# file are auto-attached, and the mode prompt fetches its own rules through
+# fetch_rules (the typical path from context_budget.py). For each alwaysApply
+# rule the report shows which modes fetch it anyway and how many tokens per
+# request demoting it to an on-demand (agent-requested) rule would save.
+
+import argparse
+import json
+import os
+import re
+
+import context_budget
+import memory_bank
+import rule_graph
+
+MODE_ALIASES = {
+    "van": "van.md",
+    "plan": "plan.md",
+    "creative": "creative.md",
+    "implement": "implement.md",
+    "build": "implement.md",
+    "reflect": "reflect_archive.md",
+    "archive": "reflect_archive.md",
+}
+
+RULE_ALWAYS = "always"
+RULE_AUTO = "auto-attached"
+RULE_AGENT = "agent-requested"
+RULE_MANUAL = "manual"
+
+def glob_to_regex(pattern):
+    """Compiles a Cursor rule glob. '**' spans directories, '*' and '?' do not,
+    '{a,b}' alternates, and a pattern without '/' matches the file name anywhere."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "{":
+            end = pattern.find("}", i)
+            if end < 0:
+                raise ValueError(f"unclosed '{{' in glob {pattern!r}")
+            out.append("(?:" + "|".join(re.escape(a) for a in pattern[i + 1:end].split(",")) + ")")
+            i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    prefix = "" if "/" in pattern else "(?:.*/)?"
+    return re.compile(prefix + "".join(out) + r"\Z")
+
+def split_globs(value):
+    """Frontmatter 'globs' value -> list of patterns (comma separated, quotes stripped)."""
+    value = value.strip().strip("[]")
+    # Commas inside {a,b} belong to the pattern.
+    parts, depth, current = [], 0, ""
+    for c in value:
+        if c == "," and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        depth += (c == "{") - (c == "}")
+        current += c
+    parts.append(current)
+    return [p.strip().strip("'\"") for p in parts if p.strip().strip("'\"")]
+
+def load_rules(project_root, tokenizer, rules_dir=rule_graph.RULES_DIR):
+    """Returns {rule_id: {description, globs, always_apply, type, tokens}} from the live tree."""
+    rules = {}
+    for node_id, kind, filepath in rule_graph.scan_sources(project_root, rules_dir):
+        if kind == rule_graph.NODE_MODE:
+            continue
+        with open(filepath, "r", encoding="utf-8") as f:
+            fields, body = rule_graph.split_frontmatter(f.read())
+        globs = split_globs(fields.get("globs", ""))
+        always = fields.get("alwaysApply", "").lower() == "true"
+        if always:
+            rule_type = RULE_ALWAYS
+        elif globs:
+            rule_type = RULE_AUTO
+        elif fields.get("description"):
+            rule_type = RULE_AGENT
+        else:
+            rule_type = RULE_MANUAL
+        rules[node_id] = {"description": fields.get("description", ""), "globs": globs, "always_apply": always,
+                          "type": rule_type, "tokens": tokenizer(body), "bundle": kind == rule_graph.NODE_BUNDLE}
+    return rules
+
+def auto_attached(rules, files):
+    """Returns {rule_id: [matching files]} for the non-alwaysApply rules whose globs match."""
+    attached = {}
+    for rule_id, rule in rules.items():
+        if rule["always_apply"] or not rule["globs"]:
+            continue
+        regexes = [glob_to_regex(g) for g in rule["globs"]]
+        hits = [f for f in files if any(r.match(f) for r in regexes)]
+        if hits:
+            attached[rule_id] = hits
+    return attached
+
+def self_matching_globs(rules):
+    """Rules whose globs only match their own file, so they never auto-attach during real work."""
+    result = []
+    for rule_id, rule in rules.items():
+        if rule["globs"] and all(glob_to_regex(g).match(rule_id) for g in rule["globs"]):
+            result.append(rule_id)
+    return sorted(result)
+
+def mode_rules(graph, mode_id, level, depth):
+    """Rules the mode prompt fetches at this level: within depth hops (None: all reachable)."""
+    adj = context_budget.level_adjacency(graph, level)
+    return [n for n in context_budget.closure(adj, mode_id, depth) if n != mode_id]
+
+def simulate(rules, graph, files, mode_id, level, depth=2):
+    """Returns the context a request starts with: always, auto-attached and fetched rules."""
+    always = sorted(r for r, rule in rules.items() if rule["always_apply"])
+    attached = auto_attached(rules, files)
+    fetched = [r for r in mode_rules(graph, mode_id, level, depth) if r in rules and r not in always] if mode_id else []
+    tokens = lambda ids: sum(rules[r]["tokens"] for r in ids)
+    loaded = set(always) | set(fetched)
+    return {
+        "mode": mode_id, "level": level, "files": files,
+        "always": always, "always_tokens": tokens(always),
+        "attached": attached, "attached_tokens": tokens(attached),
+        # An auto-attached rule the mode also fetches is paid for twice.
+        "attached_and_fetched": sorted(set(attached) & loaded),
+        "fetched": fetched, "fetched_tokens": tokens(fetched),
+        "total_tokens": tokens(set(always) | set(attached) | set(fetched)),
+    }
+
+def demotion_report(rules, graph, levels=context_budget.COMPLEXITY_LEVELS, requests=20):
+    """For every alwaysApply rule: who references it, which modes reach it through
+    fetch_rules anyway, and the projected savings of demoting it.
+
+    Savings are counted for the (mode, level) combinations that never fetch the
+    rule: there it would simply no longer be injected. Where a mode does fetch
+    it, the tokens are paid once instead of on every request.
+    """
+    combos = [(rule_graph.MODES_DIR + "/" + m, level) for m in context_budget.MODE_PROMPTS for level in levels
+              if rule_graph.MODES_DIR + "/" + m in graph["nodes"]]
+    reach = {(m, level): set(mode_rules(graph, m, level, None)) for m, level in combos}
+    referenced_by = {}
+    for edge in graph["edges"]:
+        referenced_by.setdefault(edge["target"], set()).add(edge["source"])
+    report = []
+    for rule_id in sorted(r for r, rule in rules.items() if rule["always_apply"]):
+        tokens = rules[rule_id]["tokens"]
+        needing = [c for c in combos if rule_id in reach[c]]
+        not_needing = len(combos) - len(needing)
+        per_request = tokens * not_needing / len(combos) if combos else tokens
+        modes_needing = sorted({os.path.basename(m) for m, _ in needing})
+        refs = sorted(referenced_by.get(rule_id, ()))
+        if not refs:
+            advice = ("demote to agent-requested (alwaysApply: false, keep the description) and add "
+                      "`fetch_rules` to the orchestrators that rely on it; nothing references it today")
+        elif not_needing:
+            advice = "demote to agent-requested; the rules that need it already reference it"
+        else:
+            advice = "keep: every mode fetches it anyway"
+        report.append({
+            "rule": rule_id, "tokens": tokens, "referenced_by": refs, "modes_fetching": modes_needing,
+            "scenarios_without_fetch": not_needing, "scenarios": len(combos),
+            "avg_saving_per_request": round(per_request, 1),
+            "saving_per_session": round(per_request * requests),
+            "advice": advice,
+        })
+    return report
+
+def _short(node_id):
+    return node_id[len(rule_graph.RULES_PATH_PREFIX):] if node_id.startswith(rule_graph.RULES_PATH_PREFIX) else node_id
+
+def print_simulation(sim, rules):
+    mode = os.path.basename(sim["mode"]) if sim["mode"] else "no mode"
+    print(f"Request context for {mode}, level {sim['level']}, {len(sim['files'])} open/edited file(s):")
+    print(f"  alwaysApply ({len(sim['always'])} rules, {sim['always_tokens']:,} tokens):")
+    for rule_id in sim["always"]:
+        print(f"      {rules[rule_id]['tokens']:>6,}  {_short(rule_id)}")
+    print(f"  auto-attached by globs ({len(sim['attached'])} rules, {sim['attached_tokens']:,} tokens):")
+    for rule_id, hits in sorted(sim["attached"].items()):
+        print(f"      {rules[rule_id]['tokens']:>6,}  {_short(rule_id)}  <- {', '.join(hits)}")
+    if sim["mode"]:
+        print(f"  fetched by the mode, typical path ({len(sim['fetched'])} rules, {sim['fetched_tokens']:,} tokens):")
+        for rule_id in sim["fetched"]:
+            print(f"      {rules[rule_id]['tokens']:>6,}  {_short(rule_id)}")
+    if sim["attached_and_fetched"]:
+        print(f"  attached and also loaded otherwise: {', '.join(_short(r) for r in sim['attached_and_fetched'])}")
+    print(f"  total: {sim['total_tokens']:,} tokens, of which {sim['always_tokens']:,} are alwaysApply tax")
+
+def print_demotions(report, requests):
+    print(f"\nalwaysApply tax ({sum(r['tokens'] for r in report):,} tokens on every request):")
+    for row in report:
+        modes = ", ".join(row["modes_fetching"]) or "none"
+        print(f"  {_short(row['rule'])}: {row['tokens']:,} tokens; fetched by modes: {modes}; "
+              f"referenced by {len(row['referenced_by'])} rule(s)")
+        print(f"      not needed in {row['scenarios_without_fetch']}/{row['scenarios']} mode/level scenarios -> "
+              f"saves ~{row['avg_saving_per_request']:,} tokens/request, ~{row['saving_per_session']:,} per "
+              f"{requests}-request session")
+        print(f"      {row['advice']}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Cursor rule attachment and the alwaysApply token tax.")
+    parser.add_argument("files", nargs="*", help="Open or edited files, relative to the project root.")
+    parser.add_argument("--mode", choices=sorted(MODE_ALIASES), help="Also count the rules this mode fetches.")
+    parser.add_argument("--level", type=int, choices=context_budget.COMPLEXITY_LEVELS, default=2,
+                        help="Complexity level for the mode's fetch path (default: 2).")
+    parser.add_argument("--typical-depth", type=int, default=2,
+                        help="Fetch hops counted as the mode's typical load (default: 2).")
+    parser.add_argument("--requests", type=int, default=20,
+                        help="Requests per session for projected savings (default: 20).")
+    parser.add_argument("--tokenizer", default=context_budget.DEFAULT_TOKENIZER,
+                        help="Tokenizer name or module:function, as in context_budget.py.")
+    parser.add_argument("--json", metavar="PATH", help="Write the simulation and recommendations as JSON to PATH.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        tokenizer = context_budget.get_tokenizer(args.tokenizer)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    project_root = os.getcwd()
+    rules = load_rules(project_root, tokenizer)
+    graph = rule_graph.build_graph(project_root)
+    files = [rule_graph.to_posix(os.path.relpath(os.path.abspath(f), project_root)) for f in args.files]
+    mode_id = rule_graph.MODES_DIR + "/" + MODE_ALIASES[args.mode] if args.mode else None
+    sim = simulate(rules, graph, files, mode_id, args.level, args.typical_depth)
+    print_simulation(sim, rules)
+    report = demotion_report(rules, graph, requests=args.requests)
+    print_demotions(report, args.requests)
+    self_only = self_matching_globs(rules)
+    if self_only:
+        print(f"\n{len(self_only)} rule(s) have globs that only match their own file, so they never "
+              f"auto-attach while you edit project files (they behave as on-demand rules).")
+    if args.json:
+        payload = {"simulation": sim, "always_apply": report, "self_matching_globs": self_only,
+                   "rules": rules}
+        memory_bank.atomic_write_text(args.json, json.dumps(payload, indent=2) + "\n")
+        print(f"Wrote JSON: {args.json}")
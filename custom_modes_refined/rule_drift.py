@@ -0,0 +1,183 @@
+# Run this script from the root of the project.
+#
+# Drift detector for the three copies of every rule: the generator's rendering
+# of the source in custom_modes_refined/rules/ (what refine-instructions.py
+# would write, bundles included), the live file under
+# .cursor/rules/isolation_rules/, and its entry in the packed "mdc rules/*.txt"
+# snapshots. Each copy is reduced to a sha256 and compared with the live file
+# (or with the generator output when there is no live file), so the whole tree
+# is checked without diffing anything. --diff prints unified diffs for the
+# copies that differ.
+
+import argparse
+import difflib
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
+
+import memory_bank
+import paragraph_dedupe
+import rule_pack
+
+RULES_ROOT = rule_pack.RULES_ROOT
+MANIFEST_NAME = ".manifest.json"
+# States of the generator and packed copies of a rule.
+MATCH, DIFFERS, MISSING, NOT_COVERED = "match", "differs", "missing", "-"
+
+def _trimmed(data):
+    return data.strip(b" \t\r\n\x0b\x0c")
+
+def generated_rules(source_dir=None):
+    """Returns {path: rendered bytes} for everything the generator would write."""
+    generator = paragraph_dedupe.load_generator()
+    source_dir = source_dir or generator.DEFAULT_SOURCE_DIR
+    entries = generator.load_rule_sources(source_dir)
+    if generator.BUNDLES:
+        from context_budget import get_tokenizer
+        entries += generator.build_bundles(entries, source_dir, get_tokenizer("regex"))
+    return {entry["path"]: generator.render_mdc_content(entry["description"], entry["globs"],
+                                                          entry["alwaysApply"], entry["body"]).encode("utf-8")
+            for entry in entries}
+
+def live_rules(root=RULES_ROOT):
+    """Returns the paths of every file in the live rule tree (the manifest excluded)."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        paths.extend(os.path.join(dirpath, f).replace(os.sep, "/") for f in sorted(filenames) if f != MANIFEST_NAME)
+    return paths
+
+def packed_rules(bundles=None, keep=None):
+    """Returns ({path: sha256 of the entry}, {path: bundle}, {path: entry bytes}).
+
+    Entry bytes are only kept for paths in keep (for --diff); the hashes are
+    computed while streaming.
+    """
+    hashes, owners, contents = {}, {}, {}
+    for bundle in existing_bundles(bundles):
+        digest, parts, current = None, [], None
+        for event, value in rule_pack.bundle_events(bundle):
+            if event == "start":
+                current, digest, parts = value, hashlib.sha256(), []
+            elif event == "data":
+                digest.update(value)
+                if keep and current in keep:
+                    parts.append(value)
+            elif event == "end":
+                hashes[value] = digest.hexdigest()
+                owners[value] = bundle
+                if keep and value in keep:
+                    contents[value] = b"".join(parts)
+    return hashes, owners, contents
+
+def existing_bundles(bundles=None):
+    return [b for b in rule_pack.bundle_paths(bundles) if os.path.exists(b)]
+
+def bundle_coverage(bundles=None):
+    """Returns [(bundle, include patterns)] so uncovered paths can be told apart from missing ones."""
+    return [(b, rule_pack.read_header(b)[0]) for b in existing_bundles(bundles)]
+
+def _covered(path, coverage):
+    return any(path == p or path.startswith(p.rstrip("/") + "/") for _, patterns in coverage for p in patterns)
+
+def compare(generated, live_paths, packed_hashes, coverage):
+    """Returns one row per rule path: {path, live, generator, packed}.
+
+    live is True/False; generator and packed are MATCH, DIFFERS, MISSING or
+    NOT_COVERED (the packed snapshots do not include that path). Both are
+    compared with the live file, or with each other when it is missing.
+    """
+    live_set = set(live_paths)
+    rows = []
+    for path in sorted(live_set | set(generated) | set(packed_hashes)):
+        live_data = None
+        if path in live_set:
+            with open(path, "rb") as f:
+                live_data = f.read()
+        reference = live_data if live_data is not None else generated.get(path)
+        if path not in generated:
+            gen_state = MISSING
+        elif live_data is None:
+            gen_state = MISSING if reference is None else MATCH
+        else:
+            gen_state = MATCH if memory_bank.sha256_bytes(generated[path]) == memory_bank.sha256_bytes(live_data) else DIFFERS
+        if path in packed_hashes:
+            # Repomix trims every file, so compare the trimmed reference.
+            same = reference is not None and memory_bank.sha256_bytes(_trimmed(reference)) == packed_hashes[path]
+            packed_state = MATCH if same else DIFFERS
+        else:
+            packed_state = MISSING if _covered(path, coverage) else NOT_COVERED
+        rows.append({"path": path, "live": live_data is not None, "generator": gen_state, "packed": packed_state})
+    return rows
+
+def is_drifted(row):
+    return (not row["live"] or row["generator"] != MATCH
+            or row["packed"] not in (MATCH, NOT_COVERED))
+
+def unified_diff(a, b, a_name, b_name):
+    """Unified diff of two byte strings. A last line without a newline gets the
+    '\\ No newline at end of file' marker, as in diff(1), instead of running
+    into the next line."""
+    lines = difflib.unified_diff(a.decode("utf-8", errors="replace").splitlines(keepends=True),
+                                 b.decode("utf-8", errors="replace").splitlines(keepends=True),
+                                 a_name, b_name)
+    return "".join(line if line.endswith("\n") else line + "\n\\ No newline at end of file\n" for line in lines)
+
+def print_report(rows, verbose=False):
+    drifted = [r for r in rows if is_drifted(r)]
+    print(f"{len(rows)} rule paths, {len(rows) - len(drifted)} in sync, {len(drifted)} drifted")
+    if drifted or verbose:
+        print(f"\n    {'live':<8} {'generator':<10} {'packed':<8} path")
+    for row in rows:
+        if verbose or is_drifted(row):
+            live = "present" if row["live"] else "missing"
+            print(f"    {live:<8} {row['generator']:<10} {row['packed']:<8} {row['path']}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare generator output, live rules and packed rule bundles.")
+    parser.add_argument("--source-dir", default=None, help="Rule source directory (default: the generator's).")
+    parser.add_argument("--bundle", action="append", help="Packed bundle to compare (default: all in 'mdc rules/').")
+    parser.add_argument("--only", action="append", metavar="GLOB",
+                        help="Only report rule paths below isolation_rules/ matching GLOB. May be repeated.")
+    parser.add_argument("--diff", action="store_true", help="Print unified diffs against the live files.")
+    parser.add_argument("--json", metavar="PATH", help="Write the comparison as JSON to PATH.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List rules that are in sync too.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    started = time.perf_counter()
+    try:
+        generated = generated_rules(args.source_dir)
+        live_paths = live_rules()
+        keep = set(live_paths) | set(generated) if args.diff else None
+        packed_hashes, owners, packed_contents = packed_rules(args.bundle, keep)
+        coverage = bundle_coverage(args.bundle)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Error: {e}")
+    rows = compare(generated, live_paths, packed_hashes, coverage)
+    if args.only:
+        prefix = RULES_ROOT + "/"
+        rows = [r for r in rows if any(fnmatch.fnmatchcase(r["path"][len(prefix):], g) for g in args.only)]
+    print_report(rows, args.verbose)
+    print(f"\nCompared in {(time.perf_counter() - started) * 1000:.0f} ms.")
+
+    if args.diff:
+        for row in rows:
+            if not row["live"]:
+                continue
+            with open(row["path"], "rb") as f:
+                live_data = f.read()
+            if row["generator"] == DIFFERS:
+                print("\n" + unified_diff(generated[row["path"]], live_data,
+                                          f"generator:{row['path']}", f"live:{row['path']}"), end="")
+            if row["packed"] == DIFFERS:
+                print("\n" + unified_diff(packed_contents[row["path"]], _trimmed(live_data),
+                                          f"{owners[row['path']]}:{row['path']}", f"live (trimmed):{row['path']}"), end="")
+    if args.json:
+        memory_bank.atomic_write_text(args.json, json.dumps(rows, indent=2) + "\n")
+        print(f"Wrote {args.json}")
+    sys.exit(1 if any(is_drifted(r) for r in rows) else 0)
@@ -0,0 +1,320 @@
+# Run this script from the root of the project.
+#
+# Builds the static fetch_rules / read_file dependency graph of the Memory Bank
+# rules: every .mdc under .cursor/rules/isolation_rules/ plus the custom mode
+# prompts in custom_modes_refined/*.md. References are extracted from the rule
+# prose (e.g. "`fetch_rules` for `.cursor/rules/isolation_rules/Core/x.mdc`")
+# and exported as JSON and Graphviz DOT with the body size of every node.
+
+import argparse
+import json
+import os
+import re
+
+import memory_bank
+
+RULES_DIR = os.path.join(".cursor", "rules", "isolation_rules")
+RULES_PATH_PREFIX = ".cursor/rules/isolation_rules/"
+MODES_DIR = "custom_modes_refined"
+
+# Edge kinds, from strongest to weakest. A line mentioning a rule together with
+# `fetch_rules` is a load instruction; a bare mention is only a cross-reference.
+EDGE_FETCH = "fetch_rules"
+EDGE_READ = "read_file"
+EDGE_EDIT = "edit_file"
+EDGE_REFERENCE = "reference"
+
+NODE_RULE = "rule"
+NODE_MODE = "mode"
+# Pre-compiled bundles generated by refine-instructions.py. Their content is
+# inlined copies of other rules, so they have no outgoing edges of their own.
+NODE_BUNDLE = "bundle"
+BUNDLES_PREFIX = RULES_PATH_PREFIX + "bundles/"
+NODE_MEMORY_BANK = "memory-bank"
+
+_MDC_REF_RE = re.compile(r"[A-Za-z0-9_./\[\]-]*\.mdc\b")
+_MEMORY_BANK_REF_RE = re.compile(r"memory-bank/[A-Za-z0-9_./\[\]*-]*[A-Za-z0-9_\]*]")
+
+def split_frontmatter(text):
+    """Splits .mdc text into (frontmatter fields dict, body).
+
+    Files without a leading '---' block return ({}, text).
+    """
+    if not text.startswith("---"):
+        return {}, text
+    lines = text.split("\n")
+    fields = {}
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            return fields, "\n".join(lines[index + 1:])
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.strip()] = value.strip()
+    return {}, text
+
+def to_posix(path):
+    return path.replace(os.sep, "/")
+
+def scan_sources(project_root, rules_dir=RULES_DIR, modes_dir=MODES_DIR):
+    """Lists (node_id, node_kind, absolute_path) for every rule and mode prompt.
+
+    Node ids are project-relative '/'-separated paths, matching the "path"
+    values in refine-instructions.py.
+    """
+    sources = []
+    rules_abs = os.path.join(project_root, rules_dir)
+    for dirpath, dirnames, filenames in os.walk(rules_abs):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".mdc"):
+                filepath = os.path.join(dirpath, filename)
+                node_id = to_posix(os.path.relpath(filepath, project_root))
+                kind = NODE_BUNDLE if node_id.startswith(BUNDLES_PREFIX) else NODE_RULE
+                sources.append((node_id, kind, filepath))
+    modes_abs = os.path.join(project_root, modes_dir)
+    if os.path.isdir(modes_abs):
+        for filename in sorted(os.listdir(modes_abs)):
+            if filename.endswith(".md"):
+                filepath = os.path.join(modes_abs, filename)
+                sources.append((to_posix(os.path.relpath(filepath, project_root)), NODE_MODE, filepath))
+    return sources
+
+def line_verb(line):
+    """Classifies a line by the strongest tool it mentions."""
+    if "fetch_rules" in line:
+        return EDGE_FETCH
+    if "read_file" in line:
+        return EDGE_READ
+    if "edit_file" in line:
+        return EDGE_EDIT
+    return EDGE_REFERENCE
+
+def extract_references(body, all_memory_bank=False):
+    """Yields (line_number, verb, kind, raw_reference) for each path mentioned in body.
+
+    kind is "mdc" for rule references and "memory-bank" for memory-bank paths.
+    Memory-bank paths are only reported on lines that read or edit them,
+    unless all_memory_bank is set.
+    """
+    for line_number, line in enumerate(body.split("\n"), start=1):
+        verb = line_verb(line)
+        for match in _MDC_REF_RE.finditer(line):
+            raw = match.group(0)
+            if raw.startswith("./"):
+                raw = raw[2:]
+            if raw and raw != ".mdc":
+                yield line_number, (EDGE_REFERENCE if verb == EDGE_EDIT else verb), "mdc", raw
+        if all_memory_bank or verb in (EDGE_READ, EDGE_EDIT):
+            for match in _MEMORY_BANK_REF_RE.finditer(line):
+                yield line_number, verb, NODE_MEMORY_BANK, match.group(0).rstrip(".")
+
+def resolve_rule_reference(raw, source_id, rule_ids, by_basename):
+    """Maps a raw .mdc reference to a rule node id.
+
+    Tries, in order: a full project-relative path, a path relative to
+    isolation_rules/, a path relative to the referencing file's directory,
+    a unique path-suffix match, and a same-directory basename match.
+    Returns (node_id, None) on success or (None, reason) if unresolved.
+    """
+    if "[" in raw or "]" in raw:
+        return None, "templated"
+    candidate = raw.lstrip("/")
+    if candidate in rule_ids:
+        return candidate, None
+    if RULES_PATH_PREFIX + candidate in rule_ids:
+        return RULES_PATH_PREFIX + candidate, None
+    source_dir = source_id.rsplit("/", 1)[0]
+    relative = os.path.normpath(source_dir + "/" + candidate).replace("\\", "/")
+    if relative in rule_ids:
+        return relative, None
+
+    basename = candidate.rsplit("/", 1)[-1]
+    matches = [node_id for node_id in by_basename.get(basename, ()) if node_id.endswith("/" + candidate)]
+    if len(matches) == 1:
+        return matches[0], None
+    if len(matches) > 1:
+        same_dir = [node_id for node_id in matches if node_id.rsplit("/", 1)[0] == source_dir]
+        if len(same_dir) == 1:
+            return same_dir[0], None
+        return None, "ambiguous"
+    return None, "missing"
+
+def index_by_basename(rule_ids):
+    """Groups rule ids by file name, as needed by resolve_rule_reference."""
+    by_basename = {}
+    for node_id in rule_ids:
+        by_basename.setdefault(node_id.rsplit("/", 1)[-1], []).append(node_id)
+    return by_basename
+
+def build_graph(project_root, rules_dir=RULES_DIR, modes_dir=MODES_DIR):
+    """Scans the rule tree and mode prompts and returns the reference graph.
+
+    See build_graph_from_texts for the shape of the result.
+    """
+    sources = []
+    for node_id, node_kind, filepath in scan_sources(project_root, rules_dir, modes_dir):
+        with open(filepath, "r", encoding="utf-8") as f:
+            sources.append((node_id, node_kind, f.read()))
+    return build_graph_from_texts(sources)
+
+def build_graph_from_texts(sources):
+    """Builds the reference graph from (node_id, node_kind, text) triples.
+
+    The graph is a dict with:
+      "nodes": {node_id: {"kind", "always_apply", "body_bytes", "body_lines", "total_bytes"}}
+      "edges": [{"source", "target", "kind", "line", "raw"}] (deduplicated per
+               source/target/kind, keeping the first line)
+      "unresolved": [{"source", "raw", "kind", "line", "reason"}]
+    """
+    nodes = {}
+    bodies = {}
+    for node_id, node_kind, text in sources:
+        fields, body = split_frontmatter(text) if node_kind != NODE_MODE else ({}, text)
+        if node_kind != NODE_BUNDLE:
+            bodies[node_id] = body
+        nodes[node_id] = {
+            "kind": node_kind,
+            "always_apply": fields.get("alwaysApply", "").lower() == "true",
+            "body_bytes": len(body.encode("utf-8")),
+            "body_lines": body.count("\n") + 1 if body else 0,
+            "total_bytes": len(text.encode("utf-8")),
+        }
+
+    rule_ids = {node_id for node_id, node in nodes.items() if node["kind"] in (NODE_RULE, NODE_BUNDLE)}
+    by_basename = index_by_basename(rule_ids)
+
+    edges = []
+    seen = set()
+    unresolved = []
+    for source_id, body in bodies.items():
+        for line_number, verb, ref_kind, raw in extract_references(body):
+            if ref_kind == "mdc":
+                target, reason = resolve_rule_reference(raw, source_id, rule_ids, by_basename)
+                if target is None:
+                    unresolved.append({"source": source_id, "raw": raw, "kind": verb,
+                                       "line": line_number, "reason": reason})
+                    continue
+                if target == source_id:
+                    continue # A rule naming itself is not a dependency.
+            else:
+                target = raw
+                if target not in nodes:
+                    nodes[target] = {"kind": NODE_MEMORY_BANK, "always_apply": False, "body_bytes": None,
+                                     "body_lines": None, "total_bytes": None}
+            key = (source_id, target, verb)
+            if key in seen:
+                continue
+            seen.add(key)
+            edges.append({"source": source_id, "target": target, "kind": verb,
+                          "line": line_number, "raw": raw})
+
+    return {"nodes": nodes, "edges": edges, "unresolved": unresolved}
+
+def successors(graph, node_id, kinds=(EDGE_FETCH,)):
+    """Returns the targets of node_id's outgoing edges of the given kinds, in order."""
+    result = []
+    for edge in graph["edges"]:
+        if edge["source"] == node_id and edge["kind"] in kinds and edge["target"] not in result:
+            result.append(edge["target"])
+    return result
+
+def adjacency(graph, kinds=(EDGE_FETCH,)):
+    """Returns {node_id: [target, ...]} for edges of the given kinds."""
+    adj = {node_id: [] for node_id in graph["nodes"]}
+    for edge in graph["edges"]:
+        if edge["kind"] in kinds and edge["target"] not in adj[edge["source"]]:
+            adj[edge["source"]].append(edge["target"])
+    return adj
+
+def reachable(graph, start, kinds=(EDGE_FETCH,)):
+    """Returns every node reachable from start (inclusive) via edges of the given kinds."""
+    adj = adjacency(graph, kinds)
+    seen = [start]
+    stack = [start]
+    while stack:
+        for target in adj.get(stack.pop(), ()):
+            if target not in seen:
+                seen.append(target)
+                stack.append(target)
+    return seen
+
+def closure_bytes(graph, start, kinds=(EDGE_FETCH,)):
+    """Total body bytes of everything reachable from start, each node counted once."""
+    return sum(graph["nodes"][n]["body_bytes"] or 0 for n in reachable(graph, start, kinds))
+
+def to_json(graph):
+    return json.dumps(graph, indent=2, sort_keys=True) + "\n"
+
+def _dot_label(node_id, node):
+    label = node_id[len(RULES_PATH_PREFIX):] if node_id.startswith(RULES_PATH_PREFIX) else node_id
+    if node["body_bytes"] is not None:
+        label += f"\\n{node['body_bytes'] / 1024:.1f} KB"
+    return label
+
+def to_dot(graph, kinds=(EDGE_FETCH, EDGE_READ, EDGE_REFERENCE)):
+    """Renders the graph as Graphviz DOT. Edge style: fetch solid, read dashed, reference dotted."""
+    shapes = {NODE_RULE: "box", NODE_MODE: "doubleoctagon", NODE_BUNDLE: "box3d", NODE_MEMORY_BANK: "note"}
+    styles = {EDGE_FETCH: "solid", EDGE_READ: "dashed", EDGE_EDIT: "dashed", EDGE_REFERENCE: "dotted"}
+    lines = ["digraph isolation_rules {", "  rankdir=LR;", "  node [fontsize=10];"]
+    used = {e["source"] for e in graph["edges"] if e["kind"] in kinds}
+    used |= {e["target"] for e in graph["edges"] if e["kind"] in kinds}
+    for node_id, node in sorted(graph["nodes"].items()):
+        if node["kind"] == NODE_MEMORY_BANK and node_id not in used:
+            continue
+        lines.append(f'  "{node_id}" [label="{_dot_label(node_id, node)}", shape={shapes.get(node["kind"], "box")}];')
+    for edge in graph["edges"]:
+        if edge["kind"] in kinds:
+            lines.append(f'  "{edge["source"]}" -> "{edge["target"]}" [style={styles[edge["kind"]]}];')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def print_summary(graph, top):
+    """Prints node/edge counts and the nodes with the largest fetch_rules closure."""
+    kinds = {}
+    for edge in graph["edges"]:
+        kinds[edge["kind"]] = kinds.get(edge["kind"], 0) + 1
+    rule_count = sum(1 for n in graph["nodes"].values() if n["kind"] == NODE_RULE)
+    mode_count = sum(1 for n in graph["nodes"].values() if n["kind"] == NODE_MODE)
+    print(f"Rules: {rule_count}, mode prompts: {mode_count}, edges: "
+          + ", ".join(f"{k}={v}" for k, v in sorted(kinds.items())))
+    print(f"Unresolved references: {len(graph['unresolved'])}")
+
+    ranked = sorted(
+        ((closure_bytes(graph, node_id), node_id) for node_id, node in graph["nodes"].items()
+         if node["kind"] in (NODE_RULE, NODE_MODE)),
+        reverse=True,
+    )
+    print(f"\nLargest fetch_rules closures (top {top}):")
+    for total, node_id in ranked[:top]:
+        count = len(reachable(graph, node_id)) - 1
+        print(f"  {total / 1024:7.1f} KB  {node_id}  (+{count} rules)")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the fetch_rules/read_file dependency graph of the rule tree.")
+    parser.add_argument("--json", metavar="PATH", help="Write the graph as JSON to PATH.")
+    parser.add_argument("--dot", metavar="PATH", help="Write the graph as Graphviz DOT to PATH.")
+    parser.add_argument("--fetch-only", action="store_true",
+                        help="Only include fetch_rules edges in the DOT output.")
+    parser.add_argument("--unresolved", action="store_true",
+                        help="List references that could not be resolved to a rule file.")
+    parser.add_argument("--top", type=int, default=10, help="Number of closures to list in the summary.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    project_root = os.getcwd()
+    graph = build_graph(project_root)
+
+    if args.json:
+        memory_bank.atomic_write_text(args.json, to_json(graph))
+        print(f"Wrote graph JSON: {args.json}")
+    if args.dot:
+        kinds = (EDGE_FETCH,) if args.fetch_only else (EDGE_FETCH, EDGE_READ, EDGE_REFERENCE)
+        memory_bank.atomic_write_text(args.dot, to_dot(graph, kinds))
+        print(f"Wrote graph DOT: {args.dot}")
+
+    print_summary(graph, args.top)
+    if args.unresolved:
+        print("\nUnresolved references:")
+        for ref in graph["unresolved"]:
+            print(f"  {ref['source']}:{ref['line']}: {ref['raw']} ({ref['reason']}, {ref['kind']})")
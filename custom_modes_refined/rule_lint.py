@@ -0,0 +1,280 @@
+# Run this script from the root of the project.
+#
+# Linter for the isolation_rules tree. For every .mdc rule it checks that the
+# frontmatter is a well-formed 'key: value' block that a YAML parser reads the
+# way Cursor does (alwaysApply is a boolean, the description is a safe plain
+# scalar), that the globs are valid and match the rule's own path, and that
+# every .mdc path mentioned in the body resolves to an existing rule (so a
+# broken fetch_rules chain is caught before an agent spends round-trips on
+# it). memory-bank/ paths are checked against the layout declared in
+# Core/memory-bank-paths.mdc plus the files the tools themselves write. The
+# mode prompts (custom_modes_refined/*.md, custom_modes/*.md) get the
+# reference checks. Files are linted independently, across processes when
+# there are enough of them; pass single files to lint just those on save.
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import memory_bank
+import memory_search
+import platform_profile
+import qa_status
+import rule_attach
+import rule_graph
+import task_tree
+import van_qa
+
+ERROR = "error"
+WARNING = "warning"
+FRONTMATTER_KEYS = ("description", "globs", "alwaysApply")
+SOURCE_PREFIX = rule_graph.MODES_DIR + "/rules/"
+LEGACY_MODES_DIR = "custom_modes"
+MEMORY_BANK_PATHS_RULE = rule_graph.RULES_PATH_PREFIX + "Core/memory-bank-paths.mdc"
+# Files the tools keep in memory-bank/ next to the documented layout.
+TOOL_FILES = [qa_status.STATUS_FILE, van_qa.RESULTS_FILE, van_qa.CACHE_FILE, platform_profile.PROFILE_FILE,
+              memory_search.INDEX_FILE, os.path.join(memory_bank.MEMORY_BANK_DIR, task_tree.SHARD_DIR_NAME)]
+# Below this many files a single process is faster than starting a pool.
+PARALLEL_MIN_FILES = 200
+
+_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*\Z")
+# Prose placeholders such as 'LevelX/workflow-levelX.mdc' name no single rule.
+_PLACEHOLDER_RE = re.compile(r"[Ll]evel[XN]\b")
+
+def _issue(path, line, severity, message):
+    return {"path": path, "line": line, "severity": severity, "message": message}
+
+def plain_scalar_problem(value):
+    """Returns (severity, message) if an unquoted YAML value would not parse as
+    the intended string, else None."""
+    if not value:
+        return None
+    if value[0] in "'\"":
+        if len(value) < 2 or value[-1] != value[0]:
+            return ERROR, "unterminated quoted value"
+        return None
+    if value[0] in "[]{}>|*&!%@`":
+        return ERROR, f"starts with {value[0]!r}, which YAML reads as syntax; quote the value"
+    if value[:2] in ("- ", "? ") or value in ("-", "?"):
+        return ERROR, f"starts with {value[:1]!r}, which YAML reads as syntax; quote the value"
+    if ": " in value or value.endswith(":"):
+        return ERROR, "contains ': ', which YAML reads as a nested mapping; quote the value"
+    if " #" in value:
+        return WARNING, "' #' starts a YAML comment, so the rest of the value is dropped"
+    return None
+
+def check_globs(path, line, value, rule_id):
+    """Checks a globs value. Cursor's unquoted '**/x.mdc' form is accepted as is."""
+    issues = []
+    patterns = rule_attach.split_globs(value)
+    compiled = []
+    for pattern in patterns:
+        problem = None
+        if "\\" in pattern:
+            problem = "uses '\\'; globs are '/'-separated"
+        elif "***" in pattern:
+            problem = "has '***'"
+        elif pattern.count("{") != pattern.count("}") or "{}" in pattern or "{," in pattern or ",}" in pattern:
+            problem = "has an unbalanced or empty '{...}' group"
+        else:
+            try:
+                compiled.append(rule_attach.glob_to_regex(pattern))
+            except ValueError as e:
+                problem = str(e)
+        if problem:
+            issues.append(_issue(path, line, ERROR, f"invalid glob {pattern!r}: {problem}"))
+    if compiled and len(compiled) == len(patterns) and not any(r.match(rule_id) for r in compiled):
+        issues.append(_issue(path, line, ERROR, f"globs {', '.join(patterns)} do not match the rule's own path"))
+    return issues
+
+def check_frontmatter(path, text, rule_id):
+    """Returns (issues, body, number of lines before the body)."""
+    lines = text.split("\n")
+    if lines[0].strip() != "---":
+        return [_issue(path, 1, ERROR, "no frontmatter block")], text, 0
+    close = next((i for i in range(1, len(lines)) if lines[i].strip() == "---"), None)
+    if close is None:
+        return [_issue(path, 1, ERROR, "frontmatter is never closed with '---'")], text, 0
+    issues = []
+    seen = {}
+    for index in range(1, close):
+        line, number = lines[index], index + 1
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(":")
+        if line[0] in " \t" or not sep or not _KEY_RE.match(key.strip()):
+            issues.append(_issue(path, number, ERROR, f"not a 'key: value' line: {line.strip()!r}"))
+            continue
+        key, value = key.strip(), value.strip()
+        if key in seen:
+            issues.append(_issue(path, number, ERROR, f"duplicate key {key!r} (first on line {seen[key]})"))
+            continue
+        seen[key] = number
+        if key not in FRONTMATTER_KEYS:
+            issues.append(_issue(path, number, WARNING, f"unknown key {key!r}; Cursor reads {', '.join(FRONTMATTER_KEYS)}"))
+        elif key == "alwaysApply":
+            if value not in ("true", "false"):
+                issues.append(_issue(path, number, ERROR, f"alwaysApply must be true or false, not {value!r}"))
+        elif key == "globs":
+            issues.extend(check_globs(path, number, value, rule_id))
+        else:
+            problem = plain_scalar_problem(value)
+            if problem:
+                issues.append(_issue(path, number, problem[0], f"{key}: {problem[1]}"))
+    for key in FRONTMATTER_KEYS:
+        if key not in seen:
+            issues.append(_issue(path, 1, WARNING, f"missing {key!r}"))
+    return issues, "\n".join(lines[close + 1:]), close + 1
+
+def memory_bank_layout(paths_rule_text):
+    """Returns the set of memory-bank/ files and directories declared by
+    Core/memory-bank-paths.mdc, plus the files the tools write."""
+    declared = {raw.rstrip("/") for _, _, kind, raw in rule_graph.extract_references(paths_rule_text, True)
+                if kind == rule_graph.NODE_MEMORY_BANK and "[" not in raw}
+    declared |= {rule_graph.to_posix(p) for p in TOOL_FILES}
+    declared.add(memory_bank.MEMORY_BANK_DIR)
+    return frozenset(declared)
+
+def memory_bank_known(raw, layout):
+    """True if raw is a declared path, lies inside a declared directory, or is
+    a '*' pattern matching a declared path."""
+    raw = raw.rstrip("/")
+    if raw in layout:
+        return True
+    parent = raw.rsplit("/", 1)[0]
+    if any(parent == p or parent.startswith(p + "/") for p in layout if p != memory_bank.MEMORY_BANK_DIR):
+        return True
+    if "*" in raw or "[" in raw:
+        # '*' and '[placeholder]' stand for any file name part.
+        pattern = re.compile(re.sub(r"\\\[.*?\\\]|\\\*", "[^/]*", re.escape(raw)) + r"\Z")
+        return any(pattern.match(p) for p in layout)
+    return False
+
+def check_references(path, source_id, body, offset, context):
+    """Checks every .mdc and memory-bank/ path mentioned in body; .mdc paths are
+    resolved relative to source_id."""
+    rule_ids, by_basename, layout = context
+    issues = []
+    seen = set()
+    for number, verb, kind, raw in rule_graph.extract_references(body, True):
+        if (number, raw) in seen:
+            continue
+        seen.add((number, raw))
+        line = number + offset
+        if kind == "mdc":
+            if _PLACEHOLDER_RE.search(raw):
+                continue
+            resolved, reason = rule_graph.resolve_rule_reference(raw, source_id, rule_ids, by_basename)
+            if reason == "missing":
+                what = "fetch_rules target" if verb == rule_graph.EDGE_FETCH else "rule reference"
+                issues.append(_issue(path, line, ERROR, f"{what} {raw} does not resolve to a rule"))
+            elif reason == "ambiguous":
+                issues.append(_issue(path, line, WARNING, f"rule reference {raw} matches several rules"))
+        elif not memory_bank_known(raw, layout):
+            issues.append(_issue(path, line, WARNING, f"{raw} is not in the layout of Core/memory-bank-paths.mdc"))
+    return issues
+
+def rule_id_for(path):
+    """Maps a rule source path to the live rule it renders to."""
+    if path.startswith(SOURCE_PREFIX):
+        return rule_graph.RULES_PATH_PREFIX + path[len(SOURCE_PREFIX):]
+    return path
+
+def lint_text(path, text, context):
+    """Returns the issues of one file (path is project-relative, '/'-separated)."""
+    issues, body, offset = [], text, 0
+    if path.endswith(".mdc"):
+        issues, body, offset = check_frontmatter(path, text, rule_id_for(path))
+    # References are resolved from the live location, as the agent sees them.
+    return issues + check_references(path, rule_id_for(path), body, offset, context)
+
+def _lint_item(item, context):
+    return lint_text(item[0], item[1], context)
+
+def lint(items, context, jobs=None):
+    """Lints [(path, text)] and returns all issues in input order.
+
+    jobs=None uses one process below PARALLEL_MIN_FILES files and a process
+    per CPU above it.
+    """
+    if jobs is None:
+        jobs = 1 if len(items) < PARALLEL_MIN_FILES else (os.cpu_count() or 1)
+    if jobs <= 1:
+        results = [_lint_item(item, context) for item in items]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_lint_item, items, repeat(context), chunksize=max(1, len(items) // (jobs * 4))))
+    return [issue for file_issues in results for issue in file_issues]
+
+def default_targets(project_root):
+    """Every live rule plus the mode prompts, as project-relative paths."""
+    targets = [node_id for node_id, _, _ in rule_graph.scan_sources(project_root)]
+    legacy = os.path.join(project_root, LEGACY_MODES_DIR)
+    if os.path.isdir(legacy):
+        targets += [LEGACY_MODES_DIR + "/" + f for f in sorted(os.listdir(legacy)) if f.endswith(".md")]
+    return targets
+
+def build_context(project_root, extra_texts=None):
+    """Returns (rule ids, basename index, memory-bank layout) for resolving references."""
+    rule_ids = {node_id for node_id, kind, _ in rule_graph.scan_sources(project_root) if kind != rule_graph.NODE_MODE}
+    rule_ids |= set(extra_texts or ())
+    paths_text = (extra_texts or {}).get(MEMORY_BANK_PATHS_RULE)
+    if paths_text is None:
+        paths_file = os.path.join(project_root, MEMORY_BANK_PATHS_RULE)
+        paths_text = open(paths_file, encoding="utf-8").read() if os.path.exists(paths_file) else ""
+    rule_ids = frozenset(rule_ids)
+    return rule_ids, rule_graph.index_by_basename(rule_ids), memory_bank_layout(paths_text)
+
+def print_issues(issues, file_count, elapsed_ms):
+    for issue in issues:
+        print(f"{issue['path']}:{issue['line']}: {issue['severity']}: {issue['message']}")
+    errors = sum(1 for i in issues if i["severity"] == ERROR)
+    print(f"{file_count} files, {errors} errors, {len(issues) - errors} warnings in {elapsed_ms:.0f} ms")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Lint rule frontmatter, globs and rule / memory-bank references.")
+    parser.add_argument("files", nargs="*",
+                        help="Files to lint, relative to the project root (default: all rules and mode prompts).")
+    parser.add_argument("--generated", action="store_true",
+                        help="Lint what refine-instructions.py would write instead of the live rule files.")
+    parser.add_argument("--jobs", type=int, help=f"Worker processes (default: 1 below {PARALLEL_MIN_FILES} files, "
+                                                 "else one per CPU).")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 on warnings too.")
+    parser.add_argument("--json", metavar="PATH", help="Write the issues as JSON to PATH.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    started = time.perf_counter()
+    project_root = os.getcwd()
+    generated = {}
+    if args.generated:
+        import rule_drift
+        generated = {path: data.decode("utf-8") for path, data in rule_drift.generated_rules().items()}
+    targets = [rule_graph.to_posix(os.path.relpath(os.path.abspath(f), project_root)) for f in args.files] \
+        or default_targets(project_root)
+    items = []
+    for path in targets:
+        if path in generated:
+            items.append((path, generated[path]))
+            continue
+        try:
+            with open(os.path.join(project_root, path), "r", encoding="utf-8") as f:
+                items.append((path, f.read()))
+        except (OSError, UnicodeDecodeError) as e:
+            raise SystemExit(f"Cannot read {path}: {e}")
+    if args.generated and not args.files:
+        live = {path for path, _ in items}
+        items += [(path, text) for path, text in sorted(generated.items()) if path not in live]
+    issues = lint(items, build_context(project_root, generated), args.jobs)
+    print_issues(issues, len(items), (time.perf_counter() - started) * 1000)
+    if args.json:
+        memory_bank.atomic_write_text(args.json, json.dumps(issues, indent=2) + "\n")
+        print(f"Wrote {args.json}")
+    failing = [i for i in issues if args.strict or i["severity"] == ERROR]
+    sys.exit(1 if failing else 0)
@@ -0,0 +1,343 @@
+# Run this script from the root of the project.
+#
+# Native packer/unpacker for the Repomix-style snapshots in "mdc rules/*.txt"
+# (rules-core.txt, rules-levels.txt, rules-visual-maps.txt,
+# rules-phases-main.txt). The files are written and read one rule at a time in
+# fixed-size chunks, so memory use does not grow with the bundle. The format
+# is Repomix's plain style: a fixed summary header naming the include
+# patterns, a directory listing, then one entry per file
+#
+#   ================
+#   File: .cursor/rules/isolation_rules/Core/command-execution.mdc
+#   ================
+#   <file content, leading/trailing whitespace trimmed>
+#   <blank line>
+#
+# and an "End of Codebase" footer. Because Repomix trims each file, `verify`
+# compares a bundle entry with the trimmed live file.
+
+import argparse
+import glob
+import hashlib
+import os
+import sys
+
+import memory_bank
+
+BUNDLE_DIR = "mdc rules"
+RULES_ROOT = ".cursor/rules/isolation_rules"
+CHUNK_SIZE = 1 << 16
+
+SEPARATOR = b"=" * 16
+LONG_SEPARATOR = b"=" * 64
+PATTERNS_PREFIX = b"- Only files matching these patterns are included: "
+HEADER = (
+    b"This file is a merged representation of a subset of the codebase, containing specifically included files, combined into a single document by Repomix.\n"
+    b"\n"
+    b"================================================================\n"
+    b"File Summary\n"
+    b"================================================================\n"
+    b"\n"
+    b"Purpose:\n"
+    b"--------\n"
+    b"This file contains a packed representation of the entire repository's contents.\n"
+    b"It is designed to be easily consumable by AI systems for analysis, code review,\n"
+    b"or other automated processes.\n"
+    b"\n"
+    b"File Format:\n"
+    b"------------\n"
+    b"The content is organized as follows:\n"
+    b"1. This summary section\n"
+    b"2. Repository information\n"
+    b"3. Directory structure\n"
+    b"4. Repository files (if enabled)\n"
+    b"5. Multiple file entries, each consisting of:\n"
+    b"  a. A separator line (================)\n"
+    b"  b. The file path (File: path/to/file)\n"
+    b"  c. Another separator line\n"
+    b"  d. The full contents of the file\n"
+    b"  e. A blank line\n"
+    b"\n"
+    b"Usage Guidelines:\n"
+    b"-----------------\n"
+    b"- This file should be treated as read-only. Any changes should be made to the\n"
+    b"  original repository files, not this packed version.\n"
+    b"- When processing this file, use the file path to distinguish\n"
+    b"  between different files in the repository.\n"
+    b"- Be aware that this file may contain sensitive information. Handle it with\n"
+    b"  the same level of security as you would the original repository.\n"
+    b"\n"
+    b"Notes:\n"
+    b"------\n"
+    b"- Some files may have been excluded based on .gitignore rules and Repomix's configuration\n"
+    b"- Binary files are not included in this packed representation. Please refer to the Repository Structure section for a complete list of file paths, including binary files\n"
+    b"%PATTERNS%\n"
+    b"- Files matching patterns in .gitignore are excluded\n"
+    b"- Files matching default ignore patterns are excluded\n"
+    b"- Files are sorted by Git change count (files with more changes are at the bottom)\n"
+    b"\n"
+    b"\n"
+)
+ENTRY_END = b"\n\n"
+FOOTER = b"\n\n\n" + LONG_SEPARATOR + b"\nEnd of Codebase\n" + LONG_SEPARATOR + b"\n"
+_WHITESPACE = b" \t\r\n\x0b\x0c"
+# Punctuation in the order Repomix's locale-aware sort puts it (CLDR root collation).
+_PUNCTUATION_ORDER = "_-,;:!?.'\"()[]{}@*/\\&#%`^+<=>|~$"
+
+def _section(title):
+    return LONG_SEPARATOR + b"\n" + title + b"\n" + LONG_SEPARATOR + b"\n"
+
+def path_sort_key(path):
+    """Orders paths like Repomix's directory listing: component by component,
+    case-insensitive, punctuation before digits before letters."""
+    def char_key(c):
+        if c.isdigit():
+            return (1, c)
+        if c.isalpha():
+            return (2, c.lower())
+        index = _PUNCTUATION_ORDER.find(c)
+        return (0, index if index >= 0 else len(_PUNCTUATION_ORDER) + ord(c))
+    return [[char_key(c) for c in part] for part in path.split("/")]
+
+def bundle_paths(names=None):
+    """The bundles to work on: the named ones (a name or path), else all in BUNDLE_DIR."""
+    if not names:
+        return sorted(glob.glob(os.path.join(BUNDLE_DIR, "*.txt")))
+    paths = []
+    for name in names:
+        if os.path.exists(name) or "/" in name or os.sep in name:
+            paths.append(name)
+        else:
+            paths.append(os.path.join(BUNDLE_DIR, name if name.endswith(".txt") else f"{name}.txt"))
+    return paths
+
+def matching_files(patterns):
+    """Files under the include patterns (a directory means everything below it), sorted."""
+    found = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                found.update(os.path.join(root, f).replace(os.sep, "/") for f in files if not f.startswith("."))
+        elif os.path.isfile(pattern):
+            found.add(pattern.replace(os.sep, "/"))
+        else:
+            found.update(p.replace(os.sep, "/") for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    return sorted(found, key=path_sort_key)
+
+def read_header(bundle_path):
+    """Returns (patterns, listed paths) from a bundle's summary and directory listing."""
+    patterns, listed = [], []
+    in_listing = False
+    with open(bundle_path, "rb") as f:
+        for line in f:
+            line = line.rstrip(b"\r\n")
+            if line.startswith(PATTERNS_PREFIX):
+                patterns = [p.strip().decode("utf-8") for p in line[len(PATTERNS_PREFIX):].split(b",") if p.strip()]
+            elif line == b"Directory Structure":
+                in_listing = True
+            elif line == b"Files":
+                break
+            elif in_listing and line and line != LONG_SEPARATOR:
+                listed.append(line.decode("utf-8"))
+    return patterns, listed
+
+def bundle_events(bundle_path):
+    """Streams a bundle as events: ("start", path), ("data", bytes)..., ("end", path).
+
+    Holds back at most the last eight lines, enough to recognise an entry
+    header or the footer and drop the blank lines that precede it.
+    """
+    with open(bundle_path, "rb") as f:
+        window = []
+        for line in f:
+            window = (window + [line.rstrip(b"\r\n")])[-4:]
+            if window == [LONG_SEPARATOR, b"Files", LONG_SEPARATOR, b""]:
+                break
+        else:
+            raise ValueError(f"{bundle_path}: no Files section found")
+
+        current = None
+        pending = []
+        for line in f:
+            pending.append(line)
+            if (len(pending) >= 3 and pending[-3].rstrip(b"\r\n") == SEPARATOR
+                    and pending[-2].startswith(b"File: ") and pending[-1].rstrip(b"\r\n") == SEPARATOR):
+                tail = b"".join(pending[:-3])
+                if current is not None:
+                    yield "data", tail[:-len(ENTRY_END)] if tail.endswith(ENTRY_END) else tail
+                    yield "end", current
+                current = pending[-2][len(b"File: "):].rstrip(b"\r\n").decode("utf-8")
+                pending = []
+                yield "start", current
+            elif len(pending) > 8:
+                if current is not None:
+                    yield "data", pending[0]
+                pending.pop(0)
+        tail = b"".join(pending)
+        if not tail.endswith(FOOTER):
+            raise ValueError(f"{bundle_path}: missing 'End of Codebase' footer")
+        if current is not None:
+            tail = tail[:-len(FOOTER)]
+            yield "data", tail[:-len(ENTRY_END)] if tail.endswith(ENTRY_END) else tail
+            yield "end", current
+
+def bundle_order(bundle_path):
+    """File paths in the order they appear in an existing bundle ([] if there is none)."""
+    if not os.path.exists(bundle_path):
+        return []
+    return [value for event, value in bundle_events(bundle_path) if event == "start"]
+
+def trimmed_chunks(filepath, chunk_size=CHUNK_SIZE):
+    """Yields a file's bytes with leading and trailing whitespace removed, in chunks."""
+    started = False
+    held = b""
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            if not started:
+                chunk = chunk.lstrip(_WHITESPACE)
+                if not chunk:
+                    continue
+                started = True
+            body = chunk.rstrip(_WHITESPACE)
+            if body:
+                yield held + body
+                held = chunk[len(body):]
+            else:
+                held += chunk
+
+def trimmed_sha256(filepath):
+    digest = hashlib.sha256()
+    for chunk in trimmed_chunks(filepath):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+def pack(bundle_path, patterns, order=None):
+    """Writes a bundle of the files matching patterns, streaming one file at a time.
+
+    Files keep their position from order (normally the bundle's previous
+    contents, which Repomix sorted by git change count); new files come first.
+    Returns the list of packed paths.
+    """
+    files = matching_files(patterns)
+    order = bundle_order(bundle_path) if order is None else order
+    position = {path: i for i, path in enumerate(order)}
+    new = [p for p in files if p not in position]
+    ordered = new + sorted((p for p in files if p in position), key=position.get)
+    pattern_line = PATTERNS_PREFIX + ", ".join(patterns).encode("utf-8")
+    with memory_bank.atomic_open(bundle_path) as out:
+        out.write(HEADER.replace(b"%PATTERNS%", pattern_line))
+        out.write(_section(b"Directory Structure"))
+        for path in files:
+            out.write(path.encode("utf-8") + b"\n")
+        out.write(b"\n" + _section(b"Files") + b"\n")
+        for path in ordered:
+            out.write(SEPARATOR + b"\nFile: " + path.encode("utf-8") + b"\n" + SEPARATOR + b"\n")
+            for chunk in trimmed_chunks(path):
+                out.write(chunk)
+            out.write(ENTRY_END)
+        out.write(FOOTER)
+    return ordered
+
+def _selected(path, only):
+    return not only or any(path == p or path.startswith(p.rstrip("/") + "/") for p in only)
+
+def unpack(bundle_path, dest=".", only=None):
+    """Writes each (selected) bundle entry below dest. Returns the paths written."""
+    written = []
+    out = None
+    for event, value in bundle_events(bundle_path):
+        if event == "start" and _selected(value, only):
+            target = os.path.join(dest, value)
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            out = open(target, "wb")
+            written.append(target)
+        elif event == "data" and out:
+            out.write(value)
+        elif event == "end" and out:
+            out.close()
+            out = None
+    return written
+
+def verify(bundle_path, only=None):
+    """Compares a bundle with the live files, entry by entry.
+
+    Returns [(path, state)] with state "match", "differs", "missing"
+    (in the bundle, not on disk) or "new" (on disk under the bundle's patterns
+    but not in the bundle), plus "unlisted" for entries absent from the
+    directory listing.
+    """
+    patterns, listed = read_header(bundle_path)
+    results = []
+    seen = []
+    digest = None
+    for event, value in bundle_events(bundle_path):
+        if event == "start":
+            digest = hashlib.sha256()
+        elif event == "data":
+            digest.update(value)
+        elif event == "end":
+            if not _selected(value, only):
+                continue
+            seen.append(value)
+            if not os.path.isfile(value):
+                results.append((value, "missing"))
+            else:
+                results.append((value, "match" if digest.hexdigest() == trimmed_sha256(value) else "differs"))
+            if value not in listed:
+                results.append((value, "unlisted"))
+    for path in matching_files(patterns):
+        if _selected(path, only) and path not in seen:
+            results.append((path, "new"))
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pack, unpack and verify the Repomix-style rule bundles in 'mdc rules/'.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    pack_cmd = sub.add_parser("pack", help="Regenerate bundles from the live rule tree.")
+    pack_cmd.add_argument("bundles", nargs="*", help="Bundle names or paths (default: all in 'mdc rules/').")
+    pack_cmd.add_argument("--include", action="append", metavar="PATTERN",
+                          help=f"Pack these directories/files instead of the bundle's own patterns, e.g. {RULES_ROOT}/Core. May be repeated.")
+    unpack_cmd = sub.add_parser("unpack", help="Write a bundle's files to disk.")
+    unpack_cmd.add_argument("bundle")
+    unpack_cmd.add_argument("--dest", default=".", help="Directory to unpack into (default: the project root).")
+    unpack_cmd.add_argument("--only", action="append", metavar="DIR", help="Only files below this path. May be repeated.")
+    verify_cmd = sub.add_parser("verify", help="Check that bundles match the live rule tree. Exits 1 on any difference.")
+    verify_cmd.add_argument("bundles", nargs="*")
+    verify_cmd.add_argument("--only", action="append", metavar="DIR", help="Only files below this path. May be repeated.")
+    verify_cmd.add_argument("-v", "--verbose", action="store_true", help="Also list matching files.")
+    sub.add_parser("list", help="List the bundles and their include patterns.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        if args.command == "pack":
+            if args.include and len(bundle_paths(args.bundles)) != 1:
+                raise SystemExit("--include needs exactly one bundle name")
+            for path in bundle_paths(args.bundles):
+                patterns = args.include or (read_header(path)[0] if os.path.exists(path) else [])
+                if not patterns:
+                    raise SystemExit(f"{path}: no include patterns (pass --include)")
+                packed = pack(path, patterns)
+                print(f"Packed {len(packed)} files into {path}")
+        elif args.command == "unpack":
+            written = unpack(bundle_paths([args.bundle])[0], args.dest, args.only)
+            print(f"Unpacked {len(written)} files into {args.dest}")
+        elif args.command == "verify":
+            problems = 0
+            for path in bundle_paths(args.bundles):
+                results = verify(path, args.only)
+                bad = [(p, state) for p, state in results if state != "match"]
+                problems += len(bad)
+                print(f"{path}: {len(results) - len(bad)} match, {len(bad)} differ")
+                for p, state in results:
+                    if state != "match" or args.verbose:
+                        print(f"    {state:<9} {p}")
+            sys.exit(1 if problems else 0)
+        elif args.command == "list":
+            for path in bundle_paths():
+                patterns, listed = read_header(path)
+                print(f"{path}: {len(listed)} files from {', '.join(patterns)}")
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Error: {e}")
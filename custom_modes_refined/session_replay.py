@@ -0,0 +1,413 @@
+# Run this script from the root of the project.
+#
+# Offline replay of a Memory Bank session (VAN -> PLAN -> CREATIVE -> VAN QA ->
+# IMPLEMENT -> REFLECT) against the current rules, without a model. Each step
+# starts from its mode prompt in custom_modes_refined/ and follows the
+# fetch_rules, read_file and edit_file instructions in line order, depth
+# first, the way an agent works through a rule and the sub-rules it fetches.
+# A rule already in context is not fetched again; alwaysApply rules are in
+# context from the start. A fetch of another mode's map is a mode transition
+# and is left to that mode's step.
+#
+# Branch points are decided by the conditions written in the rules: an
+# instruction is followed only if every "If ..." / "(if ...)" clause before it
+# on its line, and on the list items it is nested under, holds for the scripted
+# scenario. Known conditions (complexity level, QA pass/fail per check, design
+# type, quick fix, bundles, user commands) are evaluated from the decision
+# file; unknown ones are followed and listed so they can be scripted with
+# "branches". Example decision file:
+#
+#   {"level": 3, "qa": ["fail:env", "pass"], "creative": ["architecture"],
+#    "memory_bank_tokens": {"memory-bank/tasks.md": 1500},
+#    "branches": {"If it blocks": false}}
+#
+# The output is a trace of every simulated tool call with its size in tokens
+# and the cumulative context, plus per-step totals; --json writes both, so two
+# rule revisions can be compared on the same scenario.
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+
+import context_budget
+import memory_bank
+import rule_attach
+import rule_graph
+
+DEFAULT_QA_FAILING_CHECK = "build"
+QA_CHECKS = ["dep", "config", "env", "build"]
+DEFAULT_READ_TOKENS = 300
+DEFAULT_EDIT_TOKENS = 150
+MAX_CALLS = 5000
+QA_STEP = "qa"
+QA_ENTRY_RULE = rule_graph.RULES_PATH_PREFIX + "visual-maps/van_mode_split/van-qa-main.mdc"
+STEP_ALIASES = dict(rule_attach.MODE_ALIASES, qa=QA_STEP)
+
+DEFAULT_DECISIONS = {
+    "level": 3,
+    "modes": None,            # None: derived from the level (and "qa")
+    "qa": [],                 # VAN QA outcomes in order: "pass", "fail" or "fail:<check>"
+    "quick_fix": False,
+    "creative": ["architecture"],
+    "use_bundles": False,
+    "commands": ["ARCHIVE NOW"],
+    "optional_reads": False,
+    "new_chat_per_mode": False,
+    "memory_bank_tokens": {},
+    "edit_tokens": DEFAULT_EDIT_TOKENS,
+    "branches": {},
+}
+
+_LIST_MARKER_RE = re.compile(r"^\s*(?:>\s*)?(?:[-*+]|\d+\.|[a-z]{1,5}\.)?\s*")
+_BOLD_LABEL_RE = re.compile(r"^\*\*([^*]+)\*\*:?\s*")
+_PAREN_IF_RE = re.compile(r"\(([^()]*\b(?:[Ii]f|for)\b[^()]*)\)")
+_LEVELS_RE = re.compile(r"\b(?:Level|L)\s*([1-4](?:\s*(?:,\s*or|,|/|or|and|-)\s*(?:Level\s*|L)?[1-4])*)\b")
+
+def default_steps(level, qa_outcomes):
+    """The usual mode sequence for a complexity level, with VAN QA runs before IMPLEMENT."""
+    steps = ["van"]
+    if level >= 2:
+        steps.append("plan")
+    if level >= 3:
+        steps.append("creative")
+    steps += [QA_STEP] * len(qa_outcomes)
+    return steps + ["implement", "reflect"]
+
+def levels_in(text):
+    """Complexity levels named in a condition ('Level 2, 3, or 4', 'L3/L4', 'Level 2-4')."""
+    levels = set()
+    for match in _LEVELS_RE.finditer(text):
+        digits = [int(d) for d in re.findall(r"[1-4]", match.group(1))]
+        if "-" in match.group(1) and len(digits) == 2:
+            digits = list(range(digits[0], digits[1] + 1))
+        levels.update(digits)
+    return levels
+
+def parse_qa_outcome(outcome):
+    """'pass' -> None; 'fail' / 'fail:<check>' -> the name of the failing check."""
+    if outcome == "pass":
+        return None
+    kind, _, check = outcome.partition(":")
+    check = check or DEFAULT_QA_FAILING_CHECK
+    if kind != "fail" or check not in QA_CHECKS:
+        raise ValueError(f"invalid QA outcome {outcome!r}; use pass, fail or fail:<{'|'.join(QA_CHECKS)}>")
+    return check
+
+def _check_passes(name, state):
+    failing = state["qa_failing"]
+    return failing is None or QA_CHECKS.index(name) < QA_CHECKS.index(failing)
+
+# Conditions the simulator understands: (pattern, predicate(match, state)).
+# The first pattern found in a condition decides it.
+BRANCH_RULES = [
+    (re.compile(r"context budget allows", re.I), lambda m, s: s["decisions"]["use_bundles"]),
+    (re.compile(r"\bpass_qa`?\s+is\s+TRUE"), lambda m, s: s["qa_failing"] is None),
+    (re.compile(r"\bpass_qa`?\s+is\s+FALSE"), lambda m, s: s["qa_failing"] is not None),
+    (re.compile(r"\bpass_(dep|config|env|build)_check`?\s+is\s+true"), lambda m, s: _check_passes(m.group(1), s)),
+    (re.compile(r"\bVAN QA failed"), lambda m, s: s["qa_runs"] > 0 and s["last_qa_failing"] is not None),
+    (re.compile(r"\bVAN QA (?:was run|Passed)"), lambda m, s: s["qa_runs"] > 0),
+    (re.compile(r"\"VAN QA\" was typed"), lambda m, s: s["step"] == QA_STEP),
+    (re.compile(r"user types [`\"']?([A-Z][A-Z ]*[A-Z])"),
+     lambda m, s: m.group(1) in s["decisions"]["commands"] or (m.group(1) == "VAN QA" and s["step"] == QA_STEP)),
+    (re.compile(r"\bIf YES\b"), lambda m, s: s["decisions"]["quick_fix"]),
+    (re.compile(r"\bIf NO\b"), lambda m, s: not s["decisions"]["quick_fix"]),
+    (re.compile(r"Design Type is ([\w/]+)", re.I),
+     lambda m, s: m.group(1).lower().replace("/", "") in s["design_types"]),
+    (re.compile(r"\bif (?:necessary|needed)\b", re.I), lambda m, s: s["decisions"]["optional_reads"]),
+    (re.compile(r"\bif applicable\b", re.I), lambda m, s: True),
+    (_LEVELS_RE, lambda m, s: s["decisions"]["level"] in levels_in(m.string)),
+]
+
+def conditions(text):
+    """Returns the condition clauses of one line.
+
+    For the line holding an instruction only the text before the instruction
+    is passed in; ancestors pass their whole line.
+    """
+    found = []
+    stripped = _LIST_MARKER_RE.sub("", text, count=1)
+    label = _BOLD_LABEL_RE.match(stripped)
+    if label:
+        if levels_in(label.group(1)) and not label.group(1).strip().lower().startswith("if"):
+            found.append(label.group(1))
+        stripped = stripped[label.end():] if not label.group(1).lstrip().startswith("If") else label.group(1)
+    stripped = stripped.lstrip("* ")
+    if stripped.startswith("If ") or stripped.startswith("if "):
+        found.append(stripped)
+    found.extend(match.group(1) for match in _PAREN_IF_RE.finditer(text))
+    return found
+
+def evaluate(condition, state, unscripted, where):
+    """Decides one condition: scripted branches first, then BRANCH_RULES, else True."""
+    for pattern, value in state["decisions"]["branches"].items():
+        if re.search(pattern, condition):
+            return bool(value)
+    for pattern, predicate in BRANCH_RULES:
+        match = pattern.search(condition)
+        if match:
+            return bool(predicate(match, state))
+    unscripted.setdefault(condition.strip(), where)
+    return True
+
+def ancestors(lines, index):
+    """Indices of the list items line index is nested under, innermost first."""
+    result = []
+    indent = len(lines[index]) - len(lines[index].lstrip())
+    for i in range(index - 1, -1, -1):
+        line = lines[i]
+        if not line.strip():
+            continue
+        if line.lstrip().startswith("#"):
+            break
+        current = len(line) - len(line.lstrip())
+        if current < indent:
+            result.append(i)
+            indent = current
+            if current == 0:
+                break
+    return result
+
+class Session:
+    """Holds the simulated context and the trace."""
+
+    def __init__(self, project_root, graph, tokenizer, decisions):
+        self.project_root = project_root
+        self.graph = graph
+        self.tokenizer = tokenizer
+        self.decisions = decisions
+        self.rule_ids = {n for n, node in graph["nodes"].items()
+                         if node["kind"] in (rule_graph.NODE_RULE, rule_graph.NODE_BUNDLE)}
+        self.by_basename = rule_graph.index_by_basename(self.rule_ids)
+        self.level = decisions["level"]
+        self.trace = []
+        self.context = 0
+        self.loaded = set()
+        self.unscripted = {}
+        self._texts = {}
+        self.followed = set()
+        # The map each mode prompt fetches; fetching another mode's map from a
+        # rule means "switch to that mode", which is that mode's step.
+        self.mode_maps = {edge["target"]: edge["source"] for edge in graph["edges"]
+                          if edge["kind"] == rule_graph.EDGE_FETCH
+                          and graph["nodes"][edge["source"]]["kind"] == rule_graph.NODE_MODE}
+        self.state = {"decisions": decisions, "step": None, "index": None, "prompt": None, "qa_failing": None,
+                      "last_qa_failing": None, "qa_runs": 0, "design_types": set()}
+
+    def text(self, node_id):
+        if node_id not in self._texts:
+            with open(os.path.join(self.project_root, node_id), "r", encoding="utf-8") as f:
+                text = f.read()
+            body = text if node_id.startswith(rule_graph.MODES_DIR + "/") and node_id.endswith(".md") \
+                else rule_graph.split_frontmatter(text)[1]
+            self._texts[node_id] = (body, self.tokenizer(body))
+        return self._texts[node_id]
+
+    def call(self, tool, target, tokens, source=None, note=None):
+        if len(self.trace) >= MAX_CALLS:
+            raise RuntimeError(f"more than {MAX_CALLS} simulated calls; is a fetch loop unguarded?")
+        self.context += tokens
+        self.trace.append({"n": len(self.trace) + 1, "index": self.state["index"], "step": self.state["step"], "tool": tool, "target": target,
+                           "tokens": tokens, "context": self.context, "source": source, "note": note})
+
+    def new_chat(self):
+        self.context = 0
+        self.loaded = set()
+        always = sorted(n for n, node in self.graph["nodes"].items() if node.get("always_apply"))
+        for rule_id in always:
+            self.loaded.add(rule_id)
+            self.call("always_apply", rule_id, self.text(rule_id)[1])
+
+    def memory_bank_tokens(self, path, tool):
+        if tool == "edit_file":
+            return self.decisions["edit_tokens"]
+        for pattern, tokens in self.decisions["memory_bank_tokens"].items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return tokens
+        filepath = os.path.join(self.project_root, path)
+        if "[" not in path and os.path.isfile(filepath):
+            with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+                return self.tokenizer(f.read())
+        return DEFAULT_READ_TOKENS
+
+    def load_rule(self, rule_id, tool, source):
+        """Puts a rule in context (once per chat) and follows its instructions (once per step)."""
+        if context_budget.rule_level(rule_id) not in (None, self.level):
+            return
+        body, tokens = self.text(rule_id)
+        if rule_id not in self.loaded:
+            self.loaded.add(rule_id)
+            self.call(tool, rule_id, tokens, source)
+            if self.graph["nodes"].get(rule_id, {}).get("kind") == rule_graph.NODE_BUNDLE:
+                # The bundled rules are now in context; fetching them would add nothing.
+                self.loaded.update(re.findall(r"<!-- BEGIN BUNDLED RULE: (\S+) -->", body))
+        if rule_id not in self.followed:
+            self.followed.add(rule_id)
+            self.follow(rule_id, body)
+
+    def follow(self, node_id, body):
+        lines = body.split("\n")
+        seen = set()
+        for number, verb, kind, raw in rule_graph.extract_references(body):
+            if verb not in (rule_graph.EDGE_FETCH, rule_graph.EDGE_READ, rule_graph.EDGE_EDIT):
+                continue
+            if (number, raw) in seen:
+                continue
+            seen.add((number, raw))
+            line = lines[number - 1]
+            where = f"{context_budget._short(node_id)}:{number}"
+            before = line[:line.find(raw)] if raw in line else line
+            clauses = conditions(before) + [c for i in ancestors(lines, number - 1) for c in conditions(lines[i])]
+            if not all(evaluate(c, self.state, self.unscripted, where) for c in clauses):
+                continue
+            if kind == "mdc":
+                target, _ = rule_graph.resolve_rule_reference(raw, node_id, self.rule_ids, self.by_basename)
+                if target is None:
+                    self.call(verb, raw, 0, where, "unresolved")
+                elif self.graph["nodes"][target]["kind"] == rule_graph.NODE_BUNDLE and not self.decisions["use_bundles"]:
+                    continue
+                elif target in self.mode_maps and self.mode_maps[target] != self.state["prompt"]:
+                    continue
+                else:
+                    self.load_rule(target, verb, where)
+            else:
+                self.call(verb, raw, self.memory_bank_tokens(raw, verb), where)
+
+    def run_step(self, index, step, qa_outcome=None):
+        self.state["index"], self.state["step"] = index, step
+        self.followed = set()
+        if step == QA_STEP:
+            self.state["qa_failing"] = parse_qa_outcome(qa_outcome)
+        if self.decisions["new_chat_per_mode"] or not self.trace:
+            self.new_chat()
+        if step == QA_STEP:
+            # "VAN QA" enters VAN mode directly at the QA orchestrator.
+            prompt = rule_graph.MODES_DIR + "/" + STEP_ALIASES["van"]
+            self.state["prompt"] = prompt
+            if prompt not in self.loaded:
+                self.loaded.add(prompt)
+                self.call("mode_prompt", prompt, self.text(prompt)[1])
+            if QA_ENTRY_RULE in self.loaded:
+                # A re-run follows the orchestrator already in context again.
+                self.follow(QA_ENTRY_RULE, self.text(QA_ENTRY_RULE)[0])
+            else:
+                self.load_rule(QA_ENTRY_RULE, rule_graph.EDGE_FETCH, "VAN QA")
+            self.state["qa_runs"] += 1
+            self.state["last_qa_failing"] = self.state["qa_failing"]
+            return
+        prompt = rule_graph.MODES_DIR + "/" + STEP_ALIASES[step]
+        self.state["prompt"] = prompt
+        self.loaded.add(prompt)
+        body, tokens = self.text(prompt)
+        self.call("mode_prompt", prompt, tokens)
+        if step == "creative":
+            # One design pass per scripted design type.
+            for design_type in self.decisions["creative"]:
+                self.state["design_types"] = {design_type.lower().replace("/", "")}
+                self.follow(prompt, body)
+            self.state["design_types"] = set()
+        else:
+            self.follow(prompt, body)
+
+def replay(project_root, decisions, tokenizer):
+    """Runs the scripted session and returns (trace, step summaries, unscripted conditions)."""
+    graph = rule_graph.build_graph(project_root)
+    session = Session(project_root, graph, tokenizer, decisions)
+    qa_outcomes = list(decisions["qa"])
+    steps = decisions["modes"] or default_steps(decisions["level"], qa_outcomes)
+    for index, step in enumerate(steps):
+        if step not in STEP_ALIASES:
+            raise ValueError(f"unknown mode {step!r}; use one of {', '.join(sorted(STEP_ALIASES))}")
+        if STEP_ALIASES[step] == QA_STEP:
+            session.run_step(index, QA_STEP, qa_outcomes.pop(0) if qa_outcomes else "pass")
+        else:
+            session.run_step(index, step)
+    return session.trace, summarize(session.trace, steps), session.unscripted
+
+def summarize(trace, steps):
+    """Per-step call counts, tokens added and context at the end of the step."""
+    summaries = []
+    context = 0
+    for index, step in enumerate(steps):
+        calls = [call for call in trace if call["index"] == index]
+        counts = {}
+        for call in calls:
+            counts[call["tool"]] = counts.get(call["tool"], 0) + 1
+        context = calls[-1]["context"] if calls else context
+        summaries.append({"step": index + 1, "mode": step, "calls": counts,
+                          "tokens": sum(c["tokens"] for c in calls), "context": context})
+    return summaries
+
+def load_decisions(path=None, overrides=None):
+    decisions = dict(DEFAULT_DECISIONS)
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            scripted = json.load(f)
+        unknown = set(scripted) - set(DEFAULT_DECISIONS)
+        if unknown:
+            raise ValueError(f"unknown decision keys: {', '.join(sorted(unknown))}")
+        decisions.update(scripted)
+    decisions.update({k: v for k, v in (overrides or {}).items() if v is not None})
+    if decisions["level"] not in context_budget.COMPLEXITY_LEVELS:
+        raise ValueError(f"level must be one of {context_budget.COMPLEXITY_LEVELS}")
+    for outcome in decisions["qa"]:
+        parse_qa_outcome(outcome)
+    return decisions
+
+def print_trace(trace):
+    print(f"{'#':>4} {'mode':<10} {'tool':<12} {'tokens':>7} {'context':>8}  target (instruction)")
+    for call in trace:
+        origin = f" ({call['source']})" if call["source"] else ""
+        note = f" [{call['note']}]" if call["note"] else ""
+        print(f"{call['n']:>4} {call['step']:<10} {call['tool']:<12} {call['tokens']:>7,} {call['context']:>8,}  "
+              f"{context_budget._short(call['target'])}{origin}{note}")
+
+def print_summary(summaries, unscripted):
+    print(f"\n{'step':>4} {'mode':<10} {'fetch':>5} {'read':>5} {'edit':>5} {'tokens':>8} {'context':>8}")
+    for s in summaries:
+        calls = s["calls"]
+        print(f"{s['step']:>4} {s['mode']:<10} {calls.get('fetch_rules', 0):>5} {calls.get('read_file', 0):>5} "
+              f"{calls.get('edit_file', 0):>5} {s['tokens']:>8,} {s['context']:>8,}")
+    total = {tool: sum(s["calls"].get(tool, 0) for s in summaries) for tool in ("fetch_rules", "read_file", "edit_file")}
+    print(f"{'':>4} {'total':<10} {total['fetch_rules']:>5} {total['read_file']:>5} {total['edit_file']:>5} "
+          f"{sum(s['tokens'] for s in summaries):>8,}")
+    if unscripted:
+        print(f"\n{len(unscripted)} condition(s) had no scripted decision and were followed "
+              "(decide them with \"branches\" in the decision file):")
+        for condition, where in sorted(unscripted.items(), key=lambda item: item[1]):
+            print(f"    {where}: {condition[:100]}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a scripted Memory Bank session against the rules offline.")
+    parser.add_argument("decisions", nargs="?", help="JSON decision file (see the header of this script).")
+    parser.add_argument("--level", type=int, choices=context_budget.COMPLEXITY_LEVELS, help="Complexity level.")
+    parser.add_argument("--qa", nargs="+", metavar="OUTCOME", help="VAN QA outcomes: pass, fail or fail:CHECK.")
+    parser.add_argument("--modes", nargs="+", choices=sorted(STEP_ALIASES), help="Mode sequence to replay.")
+    parser.add_argument("--bundles", dest="use_bundles", action="store_true", default=None,
+                        help="Take the bundle fast paths.")
+    parser.add_argument("--new-chat-per-mode", action="store_true", default=None,
+                        help="Start every mode with an empty context.")
+    parser.add_argument("--tokenizer", default=context_budget.DEFAULT_TOKENIZER,
+                        help="Tokenizer name or module:function, as in context_budget.py.")
+    parser.add_argument("--summary", action="store_true", help="Only print the per-step summary.")
+    parser.add_argument("--json", metavar="PATH", help="Write the trace and summary as JSON to PATH.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        tokenizer = context_budget.get_tokenizer(args.tokenizer)
+        decisions = load_decisions(args.decisions, {"level": args.level, "qa": args.qa, "modes": args.modes,
+                                                    "use_bundles": args.use_bundles,
+                                                    "new_chat_per_mode": args.new_chat_per_mode})
+        trace, summaries, unscripted = replay(os.getcwd(), decisions, tokenizer)
+    except (OSError, ValueError, RuntimeError) as e:
+        raise SystemExit(f"Error: {e}")
+    if not args.summary:
+        print_trace(trace)
+    print_summary(summaries, unscripted)
+    if args.json:
+        payload = {"decisions": decisions, "trace": trace, "steps": summaries, "unscripted": unscripted}
+        memory_bank.atomic_write_text(args.json, json.dumps(payload, indent=2) + "\n")
+        print(f"Wrote {args.json}")
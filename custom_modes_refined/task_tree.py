@@ -0,0 +1,874 @@
+# Run this script from the root of the project.
+#
+# Typed model of memory-bank/tasks.md. The file is parsed into a flat list of
+# TaskNodes (systems, tasks, components, features, milestones, work items,
+# sub-tasks, risks and plain sections) with parent/child links, IDs such as
+# L4-001, COMP-ID-A, FEAT-ID-A1, MILE-01, TASK-A1.1 or SUB-A1.1.1, statuses,
+# priorities, dependencies and links. Every editable value (status, priority,
+# checkbox, "**Key:** value" fields) is recorded with its byte span, and the
+# parse is cached in a sidecar index (memory-bank/.tasks.md.index.json), so a
+# status or checkbox change is a patch of just those bytes: written in place
+# when the length is unchanged, spliced otherwise, with no re-parse either way.
+# Only the same-length case is O(subtree): loading the index decodes every
+# node, and a splice rewrites the file after the edit (atomically, so whole).
+#
+# Large Level 3/4 projects can use a sharded layout (`split`): each system and
+# component moves to memory-bank/tasks/<ID>.md and tasks.md becomes a compact
+# index of "- ID: [Title](tasks/ID.md) - Status: X" entries. The commands below
+# read and patch the right shard transparently, and `focus` names the one shard
+# the current activeContext.md focus needs.
+
+import argparse
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+import active_context
+import memory_bank
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = "index.json"
+
+# IDs contain a hyphen/dot-separated part or a digit: L4-001, COMP-ID-A, MILE-01, TASK-A1.1, FR1.
+ID_PATTERN = r"[A-Z][A-Z0-9]*(?:[-.][A-Z0-9]+)+|[A-Z]+[0-9][A-Z0-9.]*"
+_ID_RE = re.compile(ID_PATTERN)
+
+HEADING_KINDS = {
+    "system": "system",
+    "task": "task",
+    "component": "component",
+    "feature": "feature",
+    "milestone": "milestone",
+    "phase": "phase",
+}
+# Kinds of list items and table rows, by ID prefix.
+ID_PREFIX_KINDS = [("MILE-", "milestone"), ("SUB-", "subtask"), ("RISK-", "risk")]
+DONE_STATUSES = {"DONE", "COMPLETE", "COMPLETED"}
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_NUMBERING_RE = re.compile(r"^\d+(?:\.\d+)*\.?\s+")
+_KIND_RE = re.compile(r"^(" + "|".join(HEADING_KINDS) + r")\s*:\s*", re.IGNORECASE)
+_HEADING_ID_RE = re.compile(r"^\[?(" + ID_PATTERN + r")\s*(?::|\s-\s)\s*")
+_LIST_RE = re.compile(r"^(\s*)[-*+]\s+(?:\[([ xX])\]\s+)?(.*)$")
+_BOLD_FIELD_RE = re.compile(r"^\*\*([^*]+?):?\*\*:?\s*(.*)$")
+_PLAIN_FIELD_RE = re.compile(r"^([A-Za-z][A-Za-z .()/-]{0,40}?):\s*(.*)$")
+_ITEM_ID_RE = re.compile(r"^(" + ID_PATTERN + r"):\s*")
+_INLINE_FIELD_RE = re.compile(r"^([A-Z][A-Za-z .]{0,24}):\s*(.*)$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+SHARD_DIR_NAME = "tasks"
+# Outermost systems and components become shards; a component inside a system
+# shard becomes a nested shard, referenced from it by a marker line.
+SHARD_KINDS = ("system", "component")
+_ENTRY_RE = re.compile(r"^([ \t]*)[-*+]\s+(" + ID_PATTERN + r"):\s+\[([^\]]*)\]\(([^)\s]+\.md)\)")
+_MARKER_RE = re.compile(rb"^<!-- tasks shard: (\S+\.md) -->[ \t]*\r?\n?", re.MULTILINE)
+_FOCUS_RE = re.compile(r"focus[^:\n]*:\s*(.*)", re.IGNORECASE)
+
+@dataclass
+class TaskNode:
+    """One node of the tasks.md tree.
+
+    start/end are byte offsets of the node's subtree (end exclusive) and
+    line/end_line the matching 0-based line numbers. spans maps an editable
+    value name ("status", "priority", "checkbox" or a lowercased field name)
+    to the [start, end) byte range of the value.
+    """
+    kind: str
+    id: Optional[str]
+    title: str
+    line: int
+    start: int
+    end_line: int = 0
+    end: int = 0
+    level: int = 0
+    indent: int = -1
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    checked: Optional[bool] = None
+    dependencies: List[str] = field(default_factory=list)
+    links: Dict[str, str] = field(default_factory=dict)
+    fields: Dict[str, str] = field(default_factory=dict)
+    spans: Dict[str, List[int]] = field(default_factory=dict)
+    parent: Optional[int] = None
+    children: List[int] = field(default_factory=list)
+
+def _kind_for_id(node_id, default):
+    for prefix, kind in ID_PREFIX_KINDS:
+        if node_id and node_id.startswith(prefix):
+            return kind
+    return default
+
+def _byte_len(text):
+    return len(text.encode("utf-8"))
+
+def _set_field(node, name, value, value_start):
+    """Records a field on a node; value_start is the byte offset of value in the file."""
+    key = name.strip().lower()
+    value = value.strip()
+    node.fields[name.strip()] = value
+    node.spans[key] = [value_start, value_start + _byte_len(value)]
+    if key == "status" or key.endswith(" status"):
+        node.status = value
+        node.spans["status"] = node.spans[key]
+    elif key == "priority":
+        node.priority = value
+        node.spans["priority"] = node.spans[key]
+    if key.startswith("dependencies"):
+        node.dependencies.extend(d for d in _ID_RE.findall(value) if d != node.id and d not in node.dependencies)
+
+def _inline_fields(node, segments_text, text_start):
+    """Parses 'Title - Status: X - Assignee: Y' trailing segments into fields."""
+    parts = segments_text.split(" - ")
+    offset = text_start + _byte_len(parts[0])
+    title_parts = [parts[0]]
+    # A segment that is not "Key: value" belongs to the title (it contained " - ").
+    for part in parts[1:]:
+        offset += 3  # " - "
+        match = _INLINE_FIELD_RE.match(part)
+        if match:
+            value = match.group(2).rstrip()
+            _set_field(node, match.group(1), value, offset + _byte_len(part[:match.start(2)]))
+        else:
+            title_parts.append(part)
+        offset += _byte_len(part)
+    return " - ".join(title_parts).strip()
+
+def parse_tasks(data):
+    """Parses tasks.md bytes into a flat list of TaskNodes in file order."""
+    text = data.decode("utf-8", errors="replace")
+    nodes = []
+    headings = []      # stack of heading node indices
+    items = []         # stack of list item node indices (innermost last)
+    links_owner = None  # (node index, indent of the "**Links:**" line)
+    table_header = None
+    in_fence = False
+    offset = 0
+    lines = text.splitlines(keepends=True)
+
+    def close(index, line_number, byte_offset):
+        node = nodes[index]
+        node.end_line = line_number
+        node.end = byte_offset
+
+    def add(node):
+        parent = items[-1] if items else headings[-1] if headings else None
+        node.parent = parent
+        nodes.append(node)
+        index = len(nodes) - 1
+        if parent is not None:
+            nodes[parent].children.append(index)
+        return index
+
+    for number, raw in enumerate(lines):
+        line = raw.rstrip("\r\n")
+        line_start = offset
+        offset += _byte_len(raw)
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence or not line.strip():
+            if not line.strip():
+                table_header = None
+            continue
+        indent = len(line) - len(line.lstrip())
+
+        heading = _HEADING_RE.match(line)
+        if heading:
+            while items:
+                close(items.pop(), number, line_start)
+            level = len(heading.group(1))
+            while headings and nodes[headings[-1]].level >= level:
+                close(headings.pop(), number, line_start)
+            rest = _NUMBERING_RE.sub("", heading.group(2))
+            kind_match = _KIND_RE.match(rest)
+            kind = HEADING_KINDS[kind_match.group(1).lower()] if kind_match else None
+            rest = rest[kind_match.end():] if kind_match else rest
+            id_match = _HEADING_ID_RE.match(rest)
+            node_id = id_match.group(1) if id_match else None
+            title = (rest[id_match.end():] if id_match else rest).strip().rstrip("]").strip()
+            if kind is None:
+                kind = _kind_for_id(node_id, "task") if node_id else "section"
+            node = TaskNode(kind, node_id, title, number, line_start, level=level)
+            parent = headings[-1] if headings else None
+            node.parent = parent
+            nodes.append(node)
+            headings.append(len(nodes) - 1)
+            if parent is not None:
+                nodes[parent].children.append(len(nodes) - 1)
+            links_owner = None
+            continue
+
+        while items and nodes[items[-1]].indent >= indent:
+            close(items.pop(), number, line_start)
+        if links_owner and indent <= links_owner[1]:
+            links_owner = None
+
+        if line.lstrip().startswith("|"):
+            cells = [c.strip() for c in line.strip().strip("|").split("|")]
+            if all(re.fullmatch(r":?-+:?", c) for c in cells if c):
+                continue
+            if cells and _ID_RE.fullmatch(cells[0]) and table_header:
+                node = TaskNode(_kind_for_id(cells[0], "row"), cells[0], cells[1] if len(cells) > 1 else "",
+                                number, line_start, indent=indent)
+                cell_offset = line_start + _byte_len(line[:line.index("|") + 1])
+                for name, raw_cell in zip(table_header, line.strip().strip("|").split("|")):
+                    lead = len(raw_cell) - len(raw_cell.lstrip())
+                    _set_field(node, name, raw_cell.strip(), cell_offset + _byte_len(raw_cell[:lead]))
+                    cell_offset += _byte_len(raw_cell) + 1
+                node.end_line, node.end = number + 1, offset
+                add(node)
+            else:
+                table_header = cells
+            continue
+
+        list_match = _LIST_RE.match(line)
+        if not list_match:
+            continue
+        box, body = list_match.group(2), list_match.group(3)
+        body_start = line_start + _byte_len(line[:list_match.start(3)])
+
+        if links_owner:
+            field_match = _PLAIN_FIELD_RE.match(body)
+            if field_match:
+                nodes[links_owner[0]].links[field_match.group(1).strip()] = field_match.group(2).strip()
+                continue
+
+        id_match = _ITEM_ID_RE.match(body)
+        if box is None and not id_match:
+            # A field line: "- **Status:** X" under a heading, "- Dependencies: X" under an item.
+            owner = items[-1] if items else headings[-1] if headings else None
+            field_match = _BOLD_FIELD_RE.match(body) or (_PLAIN_FIELD_RE.match(body) if items else None)
+            if owner is None or not field_match:
+                continue
+            name, value = field_match.group(1), field_match.group(2)
+            if name.strip().lower() == "links" and not value.strip():
+                links_owner = (owner, indent)
+                continue
+            _set_field(nodes[owner], name, value, body_start + _byte_len(body[:field_match.start(2)]))
+            continue
+
+        node_id = id_match.group(1) if id_match else None
+        default_kind = "subtask" if items else "task" if node_id else "item"
+        node = TaskNode(_kind_for_id(node_id, default_kind), node_id, "", number, line_start, indent=indent)
+        if box is not None:
+            node.checked = box != " "
+            checkbox_at = line_start + _byte_len(line[:list_match.start(2)])
+            node.spans["checkbox"] = [checkbox_at, checkbox_at + 1]
+        rest_start = id_match.end() if id_match else 0
+        node.title = _inline_fields(node, body[rest_start:], body_start + _byte_len(body[:rest_start]))
+        items.append(add(node))
+
+    while items:
+        close(items.pop(), len(lines), offset)
+    while headings:
+        close(headings.pop(), len(lines), offset)
+    return nodes
+
+def _load_index(index_file):
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if isinstance(index, dict) and index.get("version") == INDEX_VERSION else None
+
+def _save_index(filepath, nodes):
+    signature = memory_bank.stat_signature(filepath)
+    payload = {"version": INDEX_VERSION, "size": signature[0], "mtime_ns": signature[1],
+               "nodes": [asdict(n) for n in nodes]}
+    try:
+        memory_bank.atomic_write_text(memory_bank.sidecar_path(filepath, INDEX_SUFFIX), json.dumps(payload) + "\n")
+    except OSError as e:
+        print(f"Warning: could not write index for {filepath}: {e}")
+
+def load_tasks(filepath=memory_bank.TASKS_FILE, rebuild=False):
+    """Returns the TaskNodes of a tasks file, from its sidecar index when the file
+    is unchanged (same size and mtime), otherwise by parsing it. [] if missing.
+    Either way this is O(nodes): the index is a single JSON document."""
+    signature = memory_bank.stat_signature(filepath)
+    if signature is None:
+        return []
+    if not rebuild:
+        index = _load_index(memory_bank.sidecar_path(filepath, INDEX_SUFFIX))
+        if index and [index["size"], index["mtime_ns"]] == list(signature):
+            return [TaskNode(**n) for n in index["nodes"]]
+    with open(filepath, "rb") as f:
+        nodes = parse_tasks(f.read())
+    _save_index(filepath, nodes)
+    return nodes
+
+def find_node(nodes, node_id):
+    """Returns the index of the node with this ID. Raises KeyError if there is none."""
+    for index, node in enumerate(nodes):
+        if node.id == node_id:
+            return index
+    raise KeyError(f"No task with ID {node_id!r}")
+
+def subtree(nodes, index):
+    """Indices of a node and all of its descendants, in file order."""
+    result = [index]
+    for child in nodes[index].children:
+        result.extend(subtree(nodes, child))
+    return sorted(result)
+
+def ancestors(nodes, index):
+    chain = []
+    parent = nodes[index].parent
+    while parent is not None:
+        chain.append(parent)
+        parent = nodes[parent].parent
+    return chain
+
+def read_node(filepath, node):
+    """Reads just the text of one node's subtree."""
+    return memory_bank.read_range(filepath, node.start, node.end)
+
+def _apply_value(node, key, value):
+    if key == "checkbox":
+        node.checked = value != " "
+        return
+    for name in list(node.fields):
+        if name.lower() == key or (key in ("status", "priority") and node.spans.get(name.lower()) == node.spans.get(key)):
+            node.fields[name] = value
+    if key == "status":
+        node.status = value
+    elif key == "priority":
+        node.priority = value
+
+def _shift(nodes, at, delta):
+    """Moves every byte offset after `at` by delta, after a splice at `at`."""
+    for node in nodes:
+        if node.start > at:
+            node.start += delta
+        if node.end > at:
+            node.end += delta
+        for span in node.spans.values():
+            if span[0] > at:
+                span[0] += delta
+            if span[1] > at:
+                span[1] += delta
+
+def _status_insertion(filepath, node):
+    """Where and how to add a status to a node that has none: a "- **Status:**"
+    line below a heading, or a " - Status:" segment at the end of a list item.
+    Returns (offset, prefix bytes, suffix bytes)."""
+    with open(filepath, "rb") as f:
+        f.seek(node.start)
+        line = f.readline()
+    content = line.rstrip(b"\r\n")
+    newline = line[len(content):]
+    if node.level and content.startswith(b"#"):
+        if newline:
+            return node.start + len(line), b"- **Status:** ", newline
+        return node.start + len(line), b"\n- **Status:** ", b""
+    if node.indent >= 0 and _LIST_RE.match(content.decode("utf-8", errors="replace")):
+        return node.start + len(content), b" - Status: ", b""
+    raise ValueError(f"{node.id} has no 'status' value and a status cannot be added to a {node.kind}")
+
+def patch_node(filepath, node_id, changes, nodes=None, _retry=True):
+    """Replaces editable values of one node, e.g. {"status": "DONE", "checkbox": "x"}.
+
+    Only the value bytes are touched: if the total length is unchanged they are
+    overwritten in place, otherwise the file is spliced and atomically
+    replaced, which rewrites the whole file (O(file) I/O, but no re-parse).
+    The sidecar index is shifted rather than rebuilt. A node without a status
+    gets one (see _status_insertion). Raises KeyError for an unknown ID and
+    ValueError for any other value the node does not have.
+    """
+    nodes = load_tasks(filepath) if nodes is None else nodes
+    index = find_node(nodes, node_id)
+    node = nodes[index]
+    edits = []
+    for key, value in changes.items():
+        key = key.lower()
+        if "\n" in value or (key == "checkbox" and value not in (" ", "x", "X")):
+            raise ValueError(f"Invalid value for {key!r}: {value!r}")
+        if key in node.spans:
+            edits.append((node.spans[key], key, value.encode("utf-8"), 0))
+        elif key == "status":
+            at, prefix, suffix = _status_insertion(filepath, node)
+            edits.append(([at, at], key, prefix + value.encode("utf-8") + suffix, len(prefix)))
+        else:
+            raise ValueError(f"{node_id} has no {key!r} value to update (has: {', '.join(sorted(node.spans)) or 'none'})")
+    edits.sort(key=lambda e: e[0][0], reverse=True)
+
+    with open(filepath, "rb") as f:
+        # Verify the index still describes the file before writing anything.
+        first = min(span[0] for span, _, _, _ in edits)
+        last = max(span[1] for span, _, _, _ in edits)
+        f.seek(first)
+        window = bytearray(f.read(last - first))
+    stale = False
+    for span, key, _, inserted in edits:
+        if inserted:
+            continue
+        current = bytes(window[span[0] - first:span[1] - first]).decode("utf-8", errors="replace")
+        if key == "checkbox":
+            stale = stale or current not in (" ", "x", "X") or (current != " ") != node.checked
+        else:
+            stored = node.fields.get(next((n for n in node.fields if n.lower() == key), ""), None)
+            if key == "status":
+                stored = node.status
+            elif key == "priority":
+                stored = node.priority
+            stale = stale or current != stored
+    if stale:
+        if not _retry:
+            raise RuntimeError(f"{filepath} changed while patching {node_id}")
+        return patch_node(filepath, node_id, changes, load_tasks(filepath, rebuild=True), _retry=False)
+
+    delta = 0
+    for span, key, new, _ in edits:
+        window[span[0] - first:span[1] - first] = new
+        delta += len(new) - (span[1] - span[0])
+
+    if delta == 0:
+        with open(filepath, "r+b") as f:
+            f.seek(first)
+            f.write(window)
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(filepath, "rb") as f:
+            data = f.read()
+        memory_bank.atomic_write_bytes(filepath, data[:first] + bytes(window) + data[last:])
+
+    for span, key, new, inserted in edits:  # highest offset first, so earlier spans are still valid
+        old_len = span[1] - span[0]
+        if len(new) != old_len:
+            _shift(nodes, span[1] - 1, len(new) - old_len)
+        if inserted:
+            value = new[inserted:].rstrip(b"\r\n")
+            span = [span[0] + inserted, span[0] + inserted + len(value)]
+            node.fields["Status"] = value.decode("utf-8")
+            node.spans["status"] = span
+            node.status = node.fields["Status"]
+            continue
+        span[1] = span[0] + len(new)
+        _apply_value(node, key, new.decode("utf-8"))
+    _save_index(filepath, nodes)
+    return node
+
+def set_status(filepath, node_id, status, nodes=None):
+    """Sets a node's status; a DONE/COMPLETE(D) status also ticks its checkbox and
+    any other status un-ticks it. Without nodes, filepath may be a sharded root."""
+    routed = nodes is None
+    nodes = load_tasks(locate(filepath, node_id)) if routed else nodes
+    node = nodes[find_node(nodes, node_id)]
+    changes = {"status": status}
+    if "checkbox" in node.spans:
+        changes["checkbox"] = "x" if status.upper() in DONE_STATUSES else " "
+    return update_task(filepath, node_id, changes) if routed else patch_node(filepath, node_id, changes, nodes)
+
+def set_checked(filepath, node_id, checked=True, nodes=None):
+    changes = {"checkbox": "x" if checked else " "}
+    return update_task(filepath, node_id, changes) if nodes is None else patch_node(filepath, node_id, changes, nodes)
+
+def _ends_with_blank_line(content):
+    return content.endswith(b"\n\n") or content.endswith(b"\r\n\r\n")
+
+def shard_entries(filepath=memory_bank.TASKS_FILE):
+    """Returns the shard entries of a sharded root tasks file, [] for a plain one.
+
+    Each entry is a dict with id, title, path (relative to the current
+    directory), line, indent and parent (index of the enclosing entry or None).
+    """
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    root_dir = os.path.dirname(filepath)
+    entries = []
+    for number, line in enumerate(lines):
+        match = _ENTRY_RE.match(line)
+        if not match:
+            continue
+        indent = len(match.group(1).expandtabs())
+        parent = None
+        for i in range(len(entries) - 1, -1, -1):
+            if entries[i]["indent"] < indent:
+                parent = i
+                break
+        entries.append({"id": match.group(2), "title": match.group(3),
+                        "path": os.path.normpath(os.path.join(root_dir, match.group(4))),
+                        "line": number, "indent": indent, "parent": parent})
+    return entries
+
+def _entry_line(node, link, indent):
+    title = node.title.replace("[", "").replace("]", "")
+    status = f" - Status: {node.status}" if node.status else ""
+    return f"{' ' * indent}- {node.id}: [{title}]({link}){status}\n".encode("utf-8")
+
+def split_tasks(filepath=memory_bank.TASKS_FILE):
+    """Converts a single tasks file into the sharded layout.
+
+    Shard files are written under tasks/ next to filepath, then the root file
+    is atomically replaced by the index. `join_tasks` restores the original
+    bytes. Returns the list of shard paths written. Raises ValueError if the
+    file is already sharded, has nothing to shard or a shard would collide.
+    """
+    if shard_entries(filepath):
+        raise ValueError(f"{filepath} is already sharded")
+    with open(filepath, "rb") as f:
+        data = f.read()
+    nodes = parse_tasks(data)
+    shard_dir = os.path.join(os.path.dirname(filepath), SHARD_DIR_NAME)
+
+    def owner(index, kinds):
+        return next((a for a in ancestors(nodes, index) if nodes[a].kind in kinds and nodes[a].id), None)
+
+    tops, nested = [], {}
+    for index, node in enumerate(nodes):
+        if node.kind not in SHARD_KINDS or not node.id:
+            continue
+        if node.kind == "system" and owner(index, ("system",)) is None:
+            tops.append(index)
+        elif node.kind == "component" and owner(index, ("component",)) is None:
+            system = owner(index, ("system",))
+            if system is None:
+                tops.append(index)
+            else:
+                nested.setdefault(system, []).append(index)
+    if not tops:
+        raise ValueError(f"{filepath} has no systems or components with IDs to shard")
+    names = [nodes[i].id for i in tops] + [nodes[i].id for group in nested.values() for i in group]
+    for name in names:
+        if names.count(name) > 1:
+            raise ValueError(f"ID {name} is used by more than one system/component")
+        if os.path.exists(os.path.join(shard_dir, f"{name}.md")):
+            raise ValueError(f"Shard {os.path.join(shard_dir, name + '.md')} already exists")
+
+    written = []
+    root = bytearray()
+    cursor = 0
+    for top in sorted(tops, key=lambda i: nodes[i].start):
+        node = nodes[top]
+        content = bytearray()
+        inner = node.start
+        block = _entry_line(node, f"{SHARD_DIR_NAME}/{node.id}.md", 0)
+        for child in nested.get(top, []):
+            comp = nodes[child]
+            comp_content = data[comp.start:comp.end]
+            content += data[inner:comp.start] + f"<!-- tasks shard: {comp.id}.md -->\n".encode("utf-8")
+            if _ends_with_blank_line(comp_content):
+                content += b"\n"
+            inner = comp.end
+            path = os.path.join(shard_dir, f"{comp.id}.md")
+            memory_bank.atomic_write_bytes(path, comp_content)
+            written.append(path)
+            block += _entry_line(comp, f"{SHARD_DIR_NAME}/{comp.id}.md", 2)
+        content += data[inner:node.end]
+        path = os.path.join(shard_dir, f"{node.id}.md")
+        memory_bank.atomic_write_bytes(path, bytes(content))
+        written.append(path)
+        root += data[cursor:node.start] + block
+        if _ends_with_blank_line(content):
+            root += b"\n"
+        cursor = node.end
+    root += data[cursor:]
+    memory_bank.atomic_write_bytes(filepath, bytes(root))
+    return written
+
+def _expand_shard(path):
+    """Shard content with its nested shard markers replaced by their content."""
+    with open(path, "rb") as f:
+        content = f.read()
+    out = bytearray()
+    cursor = 0
+    for match in _MARKER_RE.finditer(content):
+        child = _expand_shard(os.path.join(os.path.dirname(path), match.group(1).decode("utf-8")))
+        end = match.end()
+        if _ends_with_blank_line(child) and content[end:end + 1] == b"\n":
+            end += 1
+        out += content[cursor:match.start()] + child
+        cursor = end
+    out += content[cursor:]
+    return bytes(out)
+
+def join_tasks(filepath=memory_bank.TASKS_FILE):
+    """Reverses `split_tasks`: inlines every shard into the root file and removes
+    the shard files. Returns the list of shard paths removed."""
+    entries = shard_entries(filepath)
+    if not entries:
+        raise ValueError(f"{filepath} is not sharded")
+    with open(filepath, "rb") as f:
+        lines = f.read().splitlines(keepends=True)
+    skip = {e["line"] for e in entries}
+    out = bytearray()
+    number = 0
+    while number < len(lines):
+        entry = next((e for e in entries if e["line"] == number and e["parent"] is None), None)
+        if entry is None:
+            if number not in skip:
+                out += lines[number]
+            number += 1
+            continue
+        content = _expand_shard(entry["path"])
+        out += content
+        number += 1
+        while number < len(lines) and number in skip and next(
+                e for e in entries if e["line"] == number)["parent"] is not None:
+            number += 1
+        if _ends_with_blank_line(content) and number < len(lines) and not lines[number].strip():
+            number += 1
+    memory_bank.atomic_write_bytes(filepath, bytes(out))
+    removed = []
+    for entry in entries:
+        for path in (entry["path"], memory_bank.sidecar_path(entry["path"], INDEX_SUFFIX)):
+            try:
+                os.remove(path)
+                removed.append(path)
+            except FileNotFoundError:
+                pass
+    try:
+        os.rmdir(os.path.join(os.path.dirname(filepath), SHARD_DIR_NAME))
+    except OSError:
+        pass
+    return [p for p in removed if p.endswith(".md")]
+
+def load_all_tasks(filepath=memory_bank.TASKS_FILE, rebuild=False):
+    """Returns (nodes, files): the whole task tree and, per node, the file it lives in.
+
+    For a plain tasks file this is load_tasks() with every node in filepath.
+    For a sharded one the index entries are replaced by the shards' nodes,
+    each nested shard under the node that holds its marker, so IDs, parents
+    and dependencies look the same as before splitting.
+    """
+    root_nodes = load_tasks(filepath, rebuild)
+    entries = shard_entries(filepath)
+    if not entries:
+        return root_nodes, [filepath] * len(root_nodes)
+    by_line = {e["line"]: i for i, e in enumerate(entries)}
+    nodes, files = [], []
+
+    def append(node, path, parent):
+        node.parent = parent
+        node.children = []
+        nodes.append(node)
+        files.append(path)
+        if parent is not None:
+            nodes[parent].children.append(len(nodes) - 1)
+        return len(nodes) - 1
+
+    def splice(entry_index, parent):
+        path = entries[entry_index]["path"]
+        shard = load_tasks(path, rebuild)
+        local = {}
+        for index, node in enumerate(shard):
+            if node.parent is None:
+                # A shard's top heading sits beside, not below, headings of its own level.
+                top = parent
+                while top is not None and node.level and nodes[top].level >= node.level:
+                    top = nodes[top].parent
+                local[index] = append(node, path, top)
+            else:
+                local[index] = append(node, path, local[node.parent])
+        children = [i for i, e in enumerate(entries) if e["parent"] == entry_index]
+        if not children:
+            return
+        with open(path, "rb") as f:
+            markers = {m.group(1).decode("utf-8"): m.start() for m in _MARKER_RE.finditer(f.read())}
+        for child in children:
+            at = markers.get(os.path.basename(entries[child]["path"]))
+            holder = None
+            if at is not None:
+                holding = [i for i, n in enumerate(shard) if n.start <= at < n.end]
+                holder = local[max(holding, key=lambda i: shard[i].start)] if holding else None
+            if holder is None and shard:
+                holder = local[0]
+            splice(child, holder if holder is not None else parent)
+
+    remap, skipped = {}, set()
+    for index, node in enumerate(root_nodes):
+        entry_index = by_line.get(node.line)
+        if entry_index is not None or node.parent in skipped:
+            skipped.add(index)
+            if entry_index is not None and entries[entry_index]["parent"] is None:
+                splice(entry_index, remap.get(node.parent))
+            continue
+        remap[index] = append(node, filepath, remap.get(node.parent))
+    return nodes, files
+
+def locate(filepath, node_id):
+    """Returns the file that holds node_id: filepath itself unless it is a sharded
+    root, in which case the shard. Raises KeyError if no file has the ID."""
+    entries = shard_entries(filepath)
+    if not entries:
+        return filepath
+    for entry in entries:
+        if entry["id"] == node_id:
+            return entry["path"]
+    for entry in entries:
+        if any(n.id == node_id for n in load_tasks(entry["path"])):
+            return entry["path"]
+    find_node(load_tasks(filepath), node_id)
+    return filepath
+
+def update_task(filepath, node_id, changes):
+    """patch_node() through a possibly sharded root: patches the shard that holds
+    node_id and keeps the status shown in the root index entry in sync."""
+    path = locate(filepath, node_id)
+    node = patch_node(path, node_id, changes)
+    status = next((v for k, v in changes.items() if k.lower() == "status"), None)
+    if path != filepath and status is not None:
+        root_nodes = load_tasks(filepath)
+        try:
+            entry = root_nodes[find_node(root_nodes, node_id)]
+        except KeyError:
+            entry = None
+        if entry is not None and "status" in entry.spans and entry.status != status:
+            patch_node(filepath, node_id, {"status": status}, root_nodes)
+    return node
+
+def _focus_in(text):
+    """The last "...Focus: X" value in text (or the line after a bare "Current Focus")."""
+    focus = None
+    pending = False
+    for line in text.splitlines():
+        stripped = line.strip().lstrip("#*-> ").replace("**", "")
+        if pending and stripped:
+            focus, pending = stripped, False
+            continue
+        match = _FOCUS_RE.search(stripped)
+        if match:
+            focus = match.group(1).strip() or focus
+            pending = not match.group(1).strip()
+    return focus
+
+def current_focus(active_context_file=memory_bank.ACTIVE_CONTEXT_FILE):
+    """Returns the latest task focus named in activeContext.md, or None.
+
+    Looks at the latest "Mode Transition Prepared" block first (read through
+    the section index), and only if that names no focus reads the whole file
+    for the last "...Focus: X" line.
+    """
+    try:
+        latest = active_context.latest_section(active_context_file, "mode_transition")
+        focus = _focus_in(latest[1]) if latest is not None else None
+        if focus:
+            return focus
+        with open(active_context_file, "r", encoding="utf-8", errors="replace") as f:
+            return _focus_in(f.read())
+    except OSError:
+        return None
+
+def focus_shard(filepath=memory_bank.TASKS_FILE, active_context_file=memory_bank.ACTIVE_CONTEXT_FILE):
+    """Returns (path, focus): the one file to read for the current focus.
+
+    path is the shard whose ID (or a task ID inside it, or its title) appears in
+    the focus text, or filepath when the layout is not sharded or nothing matches.
+    """
+    focus = current_focus(active_context_file)
+    entries = shard_entries(filepath)
+    if not focus or not entries:
+        return filepath, focus
+    ids = _ID_RE.findall(focus)
+    # The most specific entry first: components before the systems holding them.
+    for node_id in ids:
+        for entry in sorted(entries, key=lambda e: -e["indent"]):
+            if entry["id"] == node_id:
+                return entry["path"], focus
+    for node_id in ids:
+        try:
+            path = locate(filepath, node_id)
+        except KeyError:
+            continue
+        if path != filepath:
+            return path, focus
+    titled = [e for e in entries if e["title"] and e["title"].lower() in focus.lower()]
+    if titled:
+        return max(titled, key=lambda e: (len(e["title"]), e["indent"]))["path"], focus
+    return filepath, focus
+
+def describe(node):
+    box = "" if node.checked is None else "[x] " if node.checked else "[ ] "
+    label = f"{node.id}: " if node.id else ""
+    status = f"  <{node.status}>" if node.status else ""
+    return f"{box}{node.kind} {label}{node.title}{status}"
+
+def print_tree(nodes, roots=None, kinds=None):
+    roots = [i for i, n in enumerate(nodes) if n.parent is None] if roots is None else roots
+
+    def walk(index, depth):
+        node = nodes[index]
+        shown = not kinds or node.kind in kinds
+        if shown:
+            print("  " * depth + describe(node))
+        for child in node.children:
+            walk(child, depth + 1 if shown else depth)
+    for root in roots:
+        walk(root, 0)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Query and update memory-bank/tasks.md by task ID.")
+    parser.add_argument("--file", default=memory_bank.TASKS_FILE,
+                        help=f"Tasks file (default: {memory_bank.TASKS_FILE}).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    tree = sub.add_parser("tree", help="Print the task tree (or one subtree).")
+    tree.add_argument("id", nargs="?")
+    tree.add_argument("--kind", action="append", help="Only show nodes of this kind. May be repeated.")
+    show = sub.add_parser("show", help="Print the Markdown of one node's subtree.")
+    show.add_argument("id")
+    status = sub.add_parser("status", help="Set a node's status (DONE/COMPLETE also ticks its checkbox).")
+    status.add_argument("id")
+    status.add_argument("value")
+    check = sub.add_parser("check", help="Tick a node's checkbox.")
+    check.add_argument("id")
+    uncheck = sub.add_parser("uncheck", help="Untick a node's checkbox.")
+    uncheck.add_argument("id")
+    setf = sub.add_parser("set", help="Set any recorded field value, e.g. 'set TASK-A1.1 Assignee User'.")
+    setf.add_argument("id")
+    setf.add_argument("field")
+    setf.add_argument("value")
+    sub.add_parser("reindex", help="Rebuild the sidecar index.")
+    sub.add_parser("split", help="Move each system and component into its own file under tasks/.")
+    sub.add_parser("join", help="Inline all shards back into a single tasks file.")
+    focus = sub.add_parser("focus", help="Name the shard holding the current activeContext.md focus.")
+    focus.add_argument("--active-context", default=memory_bank.ACTIVE_CONTEXT_FILE,
+                       help=f"Active context file (default: {memory_bank.ACTIVE_CONTEXT_FILE}).")
+    focus.add_argument("--show", action="store_true", help="Also print the shard's Markdown.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not os.path.exists(args.file):
+        raise SystemExit(f"File not found: {args.file}")
+    try:
+        if args.command == "tree":
+            nodes, _ = load_all_tasks(args.file)
+            print_tree(nodes, [find_node(nodes, args.id)] if args.id else None, args.kind)
+        elif args.command == "show":
+            nodes, files = load_all_tasks(args.file)
+            index = find_node(nodes, args.id)
+            print(read_node(files[index], nodes[index]), end="")
+        elif args.command == "status":
+            print(describe(set_status(args.file, args.id, args.value)))
+        elif args.command in ("check", "uncheck"):
+            print(describe(set_checked(args.file, args.id, args.command == "check")))
+        elif args.command == "set":
+            print(describe(update_task(args.file, args.id, {args.field: args.value})))
+        elif args.command == "reindex":
+            nodes, files = load_all_tasks(args.file, rebuild=True)
+            print(f"Indexed {len(nodes)} nodes in {len(set(files))} file(s).")
+        elif args.command == "split":
+            written = split_tasks(args.file)
+            print(f"Split {args.file} into {len(written)} shards:")
+            for path in written:
+                print(f"    {path}")
+        elif args.command == "join":
+            removed = join_tasks(args.file)
+            print(f"Joined {len(removed)} shards back into {args.file}.")
+        elif args.command == "focus":
+            path, focus_text = focus_shard(args.file, args.active_context)
+            print(f"Focus: {focus_text or '(none found in ' + args.active_context + ')'}")
+            print(f"Read: {path}")
+            if args.show:
+                with open(path, "r", encoding="utf-8") as f:
+                    print(f.read(), end="")
+    except (KeyError, ValueError, RuntimeError, OSError) as e:
+        print(f"Error: {e.args[0] if e.args else e}")
+        sys.exit(1)
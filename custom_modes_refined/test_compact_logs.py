@@ -0,0 +1,56 @@
+# Run from the root of the project: python -m unittest discover -s custom_modes_refined
+
+import os
+import tempfile
+import unittest
+
+import compact_logs
+
+NESTED_TRANSITION = """# Active Context
+
+## Log - 2025-05-18 09:00
+{old}
+
+### Build Log - 2025-05-18 09:30
+Built it.
+
+## Log - 2025-05-20 10:00
+Planning done.
+
+### Mode Transition Prepared - 2025-05-20 11:00
+Next mode: CREATIVE.
+
+#### Notes - 2025-05-20 11:05
+Open questions.
+
+### Build Log - 2025-05-20 12:00
+{new}
+""".format(old="Old work.\n" * 20, new="Started building.\n" * 20)
+
+class NestedTransitionTest(unittest.TestCase):
+    def compact(self, text, max_bytes=compact_logs.DEFAULT_MAX_BYTES):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "activeContext.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            summary = compact_logs.compact(path, max_bytes, today="2025-05-21")
+            with open(path, "r", encoding="utf-8") as f:
+                return summary, f.read()
+
+    def test_keeps_transition_nested_in_older_entry(self):
+        summary, text = self.compact(NESTED_TRANSITION)
+        # Both older entries go, the second one up to the transition nested in it.
+        self.assertEqual(summary["archived"], 2)
+        self.assertNotIn("Old work.", text)
+        self.assertNotIn("Planning done.", text)
+        self.assertIn("### Mode Transition Prepared - 2025-05-20 11:00\nNext mode: CREATIVE.", text)
+        self.assertIn("Open questions.", text)
+
+    def test_size_cap_never_archives_the_transition(self):
+        summary, text = self.compact(NESTED_TRANSITION, max_bytes=0)
+        self.assertIn("### Mode Transition Prepared - 2025-05-20 11:00\nNext mode: CREATIVE.", text)
+        self.assertIn("Open questions.", text)
+        self.assertNotIn("Started building.", text)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,519 @@
+# Run this script from the root of the project.
+#
+# Local runner for the VAN QA four-point technical validation described in
+# visual-maps/van_mode_split/van-qa-checks/. The dependency, configuration and
+# environment checks only read files and query tool versions, so they run at
+# the same time in a process pool (and each check runs its own probes
+# concurrently). The minimal build test keeps its short-circuit semantics: it
+# only runs once the other three checks have not failed.
+#
+# Results are written to memory-bank/.qa_check_results.json and appended to
+# memory-bank/activeContext.md in the "#### <Check> Log - [Timestamp]" format
+# the check rules use, so reports.mdc can build its report from either. The
+# verdict is recorded in memory-bank/.qa_validation_status.json (see qa_status.py).
+#
+# Passing outcomes of the three parallel checks are cached in
+# memory-bank/.qa_check_cache.json, keyed on a fingerprint of the config files
+# and tool executables each check depends on. A rerun with unchanged inputs
+# answers those checks from the cache and only re-probes the ones whose inputs
+# changed (or that warned or failed last time: a warning such as `pip check`
+# can clear without any fingerprinted file changing).
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import memory_bank
+import qa_status
+
+RESULTS_FILE = os.path.join(memory_bank.MEMORY_BANK_DIR, ".qa_check_results.json")
+CACHE_FILE = os.path.join(memory_bank.MEMORY_BANK_DIR, ".qa_check_cache.json")
+CACHE_VERSION = 1
+
+PASS = "PASS"
+WARN = "WARN"
+FAIL = "FAIL"
+NOTE = "NOTE"
+SKIPPED = "SKIPPED"
+
+# (name, log heading) in report order; the build test runs last.
+CHECKS = [
+    ("dependency", "Dependency Check"),
+    ("config", "Configuration Check"),
+    ("environment", "Environment Check"),
+    ("build", "Minimal Build Test"),
+]
+PARALLEL_CHECKS = ["dependency", "config", "environment"]
+
+# Files (relative to the project root) whose content a check's outcome depends on.
+_NODE_LOCKFILES = ["package-lock.json", "yarn.lock", "pnpm-lock.yaml"]
+_PYTHON_FILES = ["pyproject.toml", "requirements.txt", "setup.py"]
+CHECK_INPUT_FILES = {
+    # npm rewrites node_modules/.package-lock.json on every install.
+    "dependency": ["package.json"] + _NODE_LOCKFILES + _PYTHON_FILES + ["node_modules/.package-lock.json"],
+    "config": ["package.json", "tsconfig.json", "eslint.config.js", "eslint.config.mjs", ".eslintrc.js",
+               ".eslintrc.json", ".eslintrc.cjs", ".eslintrc", "vite.config.js", "vite.config.ts",
+               "webpack.config.js", "pyproject.toml"],
+    "environment": ["package.json", "node_modules/.package-lock.json"],
+}
+# Executables whose version a check's outcome depends on. An upgrade replaces
+# the resolved file, so its path, size and mtime stand in for the version
+# without running it.
+CHECK_TOOLS = {
+    "dependency": ["node", "npm", "python3", "python"],
+    "config": [],
+    "environment": ["git", "vite", "webpack", "tsc"],
+}
+
+PROBE_TIMEOUT = 60
+BUILD_TIMEOUT = 600
+
+# Directories that are never the project's own Python sources.
+NON_SOURCE_DIRS = {"node_modules", "__pycache__", "site-packages", "venv", "env", "build", "dist"}
+# compileall -x pattern for the same directories (and dot-directories) deeper in the tree.
+_NON_SOURCE_RE = r"(^|[/\\])(\.[^/\\]+|" + "|".join(sorted(NON_SOURCE_DIRS)) + r")[/\\]"
+# make has no generic "check" target; a dry run only shows the Makefile parses.
+MAKE_DRY_RUN = ["make", "-n"]
+MAX_OUTPUT_CHARS = 2000
+
+def timestamp():
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
+def item(name, status, command=None, output=None, detail=None):
+    return {"name": name, "status": status, "command": command, "output": output, "detail": detail}
+
+def overall_status(items):
+    """FAIL if any item failed, WARN if any warned, PASS otherwise (NOTEs do not count)."""
+    statuses = {i["status"] for i in items}
+    if FAIL in statuses:
+        return FAIL
+    if WARN in statuses:
+        return WARN
+    return PASS
+
+def run_command(command, cwd, timeout=PROBE_TIMEOUT, env=None):
+    """Runs a command list without a shell. Returns (returncode, output); returncode is
+    None if the program is missing or timed out."""
+    try:
+        proc = subprocess.run(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              stdin=subprocess.DEVNULL, timeout=timeout, env=env)
+    except FileNotFoundError:
+        return None, f"{command[0]}: command not found"
+    except subprocess.TimeoutExpired as e:
+        output = (e.output or b"").decode("utf-8", errors="replace")
+        return None, (output + f"\n(timed out after {timeout}s)").strip()
+    output = proc.stdout.decode("utf-8", errors="replace").strip()
+    if len(output) > MAX_OUTPUT_CHARS:
+        output = "...\n" + output[-MAX_OUTPUT_CHARS:]
+    return proc.returncode, output
+
+def run_probes(probes, cwd):
+    """Runs [(name, command, on_missing_status)] concurrently and returns items in order.
+
+    A probe passes when its command exits 0; a missing tool or non-zero exit
+    gets on_missing_status.
+    """
+    def run_one(probe):
+        name, command, failure_status = probe
+        returncode, output = run_command(command, cwd)
+        status = PASS if returncode == 0 else failure_status
+        return item(name, status, " ".join(command), output)
+    if not probes:
+        return []
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        return list(pool.map(run_one, probes))
+
+def load_jsonc(text):
+    """Parses JSON that may contain // and /* */ comments and trailing commas (tsconfig.json)."""
+    text = re.sub(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', lambda m: m.group(1) or "", text, flags=re.S)
+    text = re.sub(r",(\s*[}\]])", r"\1", text)
+    return json.loads(text)
+
+def read_json(project_root, name, jsonc=False):
+    """Returns (data, error) for a JSON config file; (None, None) if it does not exist."""
+    path = os.path.join(project_root, name)
+    if not os.path.exists(path):
+        return None, None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        return (load_jsonc(text) if jsonc else json.loads(text)), None
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+def find_python():
+    return shutil.which("python3") or shutil.which("python") or sys.executable
+
+def detect_project(project_root):
+    """Summarises which project types and config files are present."""
+    exists = lambda name: os.path.exists(os.path.join(project_root, name))
+    package, _ = read_json(project_root, "package.json")
+    package = package if isinstance(package, dict) else {}
+    deps = {}
+    for key in ("dependencies", "devDependencies"):
+        if isinstance(package.get(key), dict):
+            deps.update(package[key])
+    return {
+        "node": exists("package.json"),
+        "typescript": exists("tsconfig.json"),
+        "python": any(exists(n) for n in ("pyproject.toml", "requirements.txt", "setup.py")),
+        "make": exists("Makefile"),
+        "lockfile": next((n for n in ("package-lock.json", "yarn.lock", "pnpm-lock.yaml") if exists(n)), None),
+        "scripts": package.get("scripts") if isinstance(package.get("scripts"), dict) else {},
+        "engines_node": (package.get("engines") or {}).get("node") if isinstance(package.get("engines"), dict) else None,
+        "deps": sorted(deps),
+    }
+
+def node_major(version_output):
+    match = re.search(r"v?(\d+)\.", version_output or "")
+    return int(match.group(1)) if match else None
+
+def check_dependency(project_root, project):
+    probes = []
+    if project["node"]:
+        probes.append(("Node.js version", ["node", "--version"], FAIL))
+        probes.append(("npm version", ["npm", "--version"], FAIL))
+        if project["lockfile"] and os.path.isdir(os.path.join(project_root, "node_modules")):
+            probes.append(("Installed packages match package.json", ["npm", "ls", "--depth=0"], FAIL))
+    if project["python"]:
+        python = find_python()
+        probes.append(("Python version", [python, "--version"], FAIL))
+        probes.append(("Installed Python packages consistent", [python, "-m", "pip", "check"], WARN))
+    items = run_probes(probes, project_root)
+
+    if project["node"]:
+        if not project["lockfile"]:
+            items.append(item("Lockfile", WARN, detail="No package-lock.json, yarn.lock or pnpm-lock.yaml"))
+        elif project["deps"] and not os.path.isdir(os.path.join(project_root, "node_modules")):
+            items.append(item("Installed packages", FAIL,
+                              detail=f"node_modules/ missing; run the install for {project['lockfile']}"))
+        required = re.search(r">=?\s*(\d+)", project["engines_node"] or "")
+        version = next((i for i in items if i["name"] == "Node.js version" and i["status"] == PASS), None)
+        if required and version and node_major(version["output"]) is not None:
+            ok = node_major(version["output"]) >= int(required.group(1))
+            items.append(item("Node.js meets engines.node", PASS if ok else FAIL,
+                              detail=f"requires {project['engines_node']}, found {version['output']}"))
+    if project["python"] and not os.path.exists(os.path.join(project_root, "requirements.txt")) \
+            and not os.path.exists(os.path.join(project_root, "pyproject.toml")):
+        items.append(item("requirements.txt / pyproject.toml", WARN, detail="No dependency list found"))
+    if not items:
+        items.append(item("Project type", WARN, detail="No package.json, pyproject.toml, requirements.txt or setup.py"))
+    return items
+
+def check_config(project_root, project):
+    items = []
+    if project["node"]:
+        package, error = read_json(project_root, "package.json")
+        if error or not isinstance(package, dict):
+            items.append(item("package.json", FAIL, detail=f"Invalid JSON: {error}"))
+        else:
+            missing = [s for s in ("build", "start", "test") if s not in project["scripts"]]
+            items.append(item("package.json", WARN if "build" in missing else PASS,
+                              detail="Valid JSON" + (f"; missing scripts: {', '.join(missing)}" if missing else "")))
+    if project["typescript"]:
+        tsconfig, error = read_json(project_root, "tsconfig.json", jsonc=True)
+        if error or not isinstance(tsconfig, dict):
+            items.append(item("tsconfig.json", FAIL, detail=f"Invalid JSON: {error}"))
+        else:
+            options = tsconfig.get("compilerOptions") or {}
+            uses_react = "react" in project["deps"]
+            if uses_react and "jsx" not in options and "extends" not in tsconfig:
+                items.append(item("tsconfig.json", FAIL, detail="React project without compilerOptions.jsx"))
+            else:
+                items.append(item("tsconfig.json", PASS, detail="Valid JSON"))
+    for label, names in (("ESLint config", ("eslint.config.js", "eslint.config.mjs", ".eslintrc.js",
+                                            ".eslintrc.json", ".eslintrc.cjs", ".eslintrc")),
+                         ("Bundler config", ("vite.config.js", "vite.config.ts", "webpack.config.js"))):
+        found = [n for n in names if os.path.exists(os.path.join(project_root, n))]
+        if found:
+            items.append(item(label, NOTE, detail=f"Present: {', '.join(found)}"))
+    pyproject = os.path.join(project_root, "pyproject.toml")
+    if os.path.exists(pyproject):
+        try:
+            import tomllib
+        except ImportError:
+            items.append(item("pyproject.toml", NOTE, detail="Present (not validated: needs Python 3.11+)"))
+        else:
+            try:
+                with open(pyproject, "rb") as f:
+                    tomllib.load(f)
+                items.append(item("pyproject.toml", PASS, detail="Valid TOML"))
+            except (OSError, tomllib.TOMLDecodeError) as e:
+                items.append(item("pyproject.toml", FAIL, detail=f"Invalid TOML: {e}"))
+    if not items:
+        items.append(item("Configuration files", WARN, detail="No known configuration files found"))
+    return items
+
+def port_in_use(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+def check_environment(project_root, project):
+    items = run_probes([("Git CLI availability", ["git", "--version"], WARN)], project_root)
+    for tool in ("vite", "webpack", "tsc"):
+        package = "typescript" if tool == "tsc" else tool
+        if package not in project["deps"]:
+            continue
+        local = os.path.join(project_root, "node_modules", ".bin", tool)
+        found = os.path.exists(local) or shutil.which(tool)
+        items.append(item(f"{tool} CLI", PASS if found else WARN,
+                          detail=local if os.path.exists(local) else found or "not installed"))
+    return items
+
+def live_environment_items(project_root, project):
+    """Environment items that can change at any moment; never cached, and cheap."""
+    writable = os.access(project_root, os.W_OK)
+    items = [item("Project directory writable", PASS if writable else FAIL, detail=project_root)]
+    if project["node"]:
+        port = 5173 if "vite" in project["deps"] else 3000
+        busy = port_in_use(port)
+        items.append(item(f"Port {port} for dev server", WARN if busy else PASS,
+                          detail="in use" if busy else "free"))
+    return items
+
+def python_sources(project_root):
+    """Top-level Python modules and directories of the project itself: no
+    dot-directories, virtualenvs (a pyvenv.cfg inside), node_modules, build
+    output or memory-bank/."""
+    targets = []
+    for name in sorted(os.listdir(project_root)):
+        path = os.path.join(project_root, name)
+        if os.path.isdir(path):
+            if (name.startswith(".") or name in NON_SOURCE_DIRS or name == memory_bank.MEMORY_BANK_DIR
+                    or os.path.exists(os.path.join(path, "pyvenv.cfg"))):
+                continue
+            targets.append(name)
+        elif name.endswith(".py"):
+            targets.append(name)
+    return targets
+
+def build_command(project_root, project):
+    """Picks the most minimal build command available, or None."""
+    tsc = os.path.join(project_root, "node_modules", ".bin", "tsc")
+    if project["typescript"] and os.path.exists(tsc):
+        return [tsc, "--noEmit"]
+    if "build" in project["scripts"]:
+        return ["npm", "run", "build"]
+    if project["python"]:
+        targets = python_sources(project_root)
+        if targets:
+            return [find_python(), "-m", "compileall", "-q", "-x", _NON_SOURCE_RE] + targets
+    if project["make"]:
+        return MAKE_DRY_RUN
+    return None
+
+def check_build(project_root, project, command=None):
+    command = command or build_command(project_root, project)
+    if command is None:
+        return [item("Build command", WARN, detail="No build command found (tsc, npm run build, make, compileall)")]
+    # QA only validates: Python bytecode (compileall) goes to a throwaway
+    # directory instead of __pycache__/ folders in the project.
+    with tempfile.TemporaryDirectory(prefix="van_qa_pycache_") as pycache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+        returncode, output = run_command(command, project_root, BUILD_TIMEOUT, env)
+    if command == MAKE_DRY_RUN and returncode == 0:
+        return [item("Minimal build", WARN, " ".join(command), output,
+                     detail="Dry run only: the Makefile parses, but nothing was built (use --build-cmd)")]
+    return [item("Minimal build", PASS if returncode == 0 else FAIL, " ".join(command), output)]
+
+CHECK_FUNCTIONS = {
+    "dependency": check_dependency,
+    "config": check_config,
+    "environment": check_environment,
+    "build": check_build,
+}
+
+def run_check(name, project_root, project, *extra):
+    """Runs one check and wraps its items with status and timing. Runs in a worker process."""
+    started = timestamp()
+    start = time.perf_counter()
+    try:
+        items = CHECK_FUNCTIONS[name](project_root, project, *extra)
+    except Exception as e:
+        items = [item("Check crashed", FAIL, detail=f"{type(e).__name__}: {e}")]
+    return {
+        "check": name,
+        "status": overall_status(items),
+        "started": started,
+        "duration_ms": round((time.perf_counter() - start) * 1000),
+        "items": items,
+    }
+
+def skipped_result(name, reason):
+    return {"check": name, "status": SKIPPED, "started": timestamp(), "duration_ms": 0,
+            "items": [item("Not run", SKIPPED, detail=reason)]}
+
+def tool_fingerprint(project_root, tool):
+    """Returns [resolved path, size, mtime_ns] of a tool executable, or None if absent."""
+    local = os.path.join(project_root, "node_modules", ".bin", tool)
+    path = local if os.path.exists(local) else shutil.which(tool)
+    if not path:
+        return None
+    path = os.path.realpath(path)
+    signature = memory_bank.stat_signature(path)
+    return [path] + list(signature) if signature else None
+
+def check_fingerprint(name, project_root, project):
+    """Hashes everything the outcome of a cacheable check depends on."""
+    inputs = {
+        "version": CACHE_VERSION,
+        "project": project,
+        "files": {f: memory_bank.sha256_file(os.path.join(project_root, f)) for f in CHECK_INPUT_FILES[name]},
+        "tools": {t: tool_fingerprint(project_root, t) for t in CHECK_TOOLS[name]},
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+def load_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("checks", {})
+
+def save_cache(cache_path, entries):
+    try:
+        memory_bank.atomic_write_text(cache_path, json.dumps({"version": CACHE_VERSION, "checks": entries}, indent=2) + "\n")
+    except OSError as e:
+        print(f"Warning: could not write QA cache {cache_path}: {e}")
+
+def with_live_items(result, project_root, project):
+    """Adds the uncached environment items to an environment result."""
+    if result["check"] != "environment":
+        return result
+    result = dict(result, items=result["items"] + live_environment_items(project_root, project))
+    result["status"] = overall_status(result["items"])
+    return result
+
+def run_qa(project_root, build_cmd=None, jobs=None, cache_path=None):
+    """Runs the four checks and returns the results dict (see RESULTS_FILE).
+
+    With a cache_path, the parallel checks whose fingerprint matches a cached
+    passing result are answered from the cache; only the others are probed,
+    and the cache is updated with their new outcomes. Warnings and failures
+    are never cached. The build test is never cached.
+    """
+    start = time.perf_counter()
+    project = detect_project(project_root)
+    results = {}
+    cache = load_cache(cache_path) if cache_path else {}
+    fingerprints = {name: check_fingerprint(name, project_root, project) for name in PARALLEL_CHECKS}
+    for name in PARALLEL_CHECKS:
+        entry = cache.get(name)
+        if entry and entry.get("fingerprint") == fingerprints[name]:
+            results[name] = dict(entry["result"], cached=True, duration_ms=0)
+    misses = [name for name in PARALLEL_CHECKS if name not in results]
+    if misses:
+        with ProcessPoolExecutor(max_workers=jobs or len(misses)) as pool:
+            futures = {name: pool.submit(run_check, name, project_root, project) for name in misses}
+            for name, future in futures.items():
+                results[name] = dict(future.result(), cached=False)
+    if cache_path and misses:
+        for name in misses:
+            if results[name]["status"] != PASS:
+                cache.pop(name, None)
+            else:
+                cache[name] = {"fingerprint": fingerprints[name], "stored": timestamp(), "result": results[name]}
+        save_cache(cache_path, cache)
+    for name in PARALLEL_CHECKS:
+        results[name] = dict(with_live_items(results[name], project_root, project),
+                             fingerprint=fingerprints[name])
+    failed = [name for name in PARALLEL_CHECKS if results[name]["status"] == FAIL]
+    if failed:
+        results["build"] = skipped_result("build", f"Skipped because these checks failed: {', '.join(failed)}")
+    else:
+        results["build"] = run_check("build", project_root, project, build_cmd)
+    overall = FAIL if any(r["status"] in (FAIL, SKIPPED) for r in results.values()) else PASS
+    return {
+        "timestamp": timestamp(),
+        "overall": overall,
+        "duration_ms": round((time.perf_counter() - start) * 1000),
+        "project": {k: v for k, v in project.items() if k != "deps"},
+        "checks": {name: results[name] for name, _ in CHECKS},
+    }
+
+def format_log(result, heading, stamp):
+    """Renders one check result in the Markdown log format of the check rules."""
+    lines = [f"#### {heading} Log - {stamp}"]
+    for entry in result["items"]:
+        lines.append(f"- Check: {entry['name']}")
+        if entry["command"]:
+            lines.append(f"  - Command: `{entry['command']}`")
+        if entry["output"]:
+            output = entry["output"]
+            if "\n" in output:
+                lines.append("  - Output:")
+                lines.append("    ```")
+                lines.extend("    " + line for line in output.splitlines())
+                lines.append("    ```")
+            else:
+                lines.append(f"  - Output: `{output}`")
+        if entry["detail"]:
+            lines.append(f"  - Details: {entry['detail']}")
+        lines.append(f"  - Status: {entry['status']}")
+    lines.append(f"- Overall {heading.replace(' Check', '')} Status: {result['status']}")
+    return "\n".join(lines) + "\n"
+
+def append_logs(activecontext_path, report):
+    """Appends the four check logs and the outcome line to activeContext.md."""
+    stamp = report["timestamp"]
+    blocks = [format_log(report["checks"][name], heading, stamp) for name, heading in CHECKS]
+    text = "\n" + "\n".join(blocks) + \
+        f"\nVAN QA Log - {stamp}: Technical validation run by van_qa.py. Outcome: {report['overall']}.\n"
+    os.makedirs(os.path.dirname(activecontext_path) or ".", exist_ok=True)
+    with open(activecontext_path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+def print_summary(report):
+    for name, heading in CHECKS:
+        result = report["checks"][name]
+        cached = " (cached)" if result.get("cached") else ""
+        print(f"{heading:<22} {result['status']:<8} {result['duration_ms']:>7,} ms{cached}")
+        for entry in result["items"]:
+            if entry["status"] in (FAIL, WARN):
+                print(f"    {entry['status']}: {entry['name']}" + (f" ({entry['detail']})" if entry["detail"] else ""))
+    print(f"Overall QA Status: {report['overall']} ({report['duration_ms']:,} ms)")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the VAN QA checks locally, in parallel.")
+    parser.add_argument("--build-cmd", help="Command for the minimal build test (default: detected).")
+    parser.add_argument("--jobs", type=int, help="Worker processes for the parallel checks (default: 3).")
+    parser.add_argument("--no-log", action="store_true",
+                        help="Do not append the check logs to memory-bank/activeContext.md.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-probe every check and ignore (but refresh) the result cache.")
+    parser.add_argument("--cache-file", default=CACHE_FILE,
+                        help=f"Result cache location (default: {CACHE_FILE}).")
+    parser.add_argument("--results", default=RESULTS_FILE,
+                        help=f"Where to write the per-check results JSON (default: {RESULTS_FILE}).")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    project_root = os.getcwd()
+    build_cmd = args.build_cmd.split() if args.build_cmd else None
+    if args.no_cache:
+        try:
+            os.remove(args.cache_file)
+        except OSError:
+            pass
+    report = run_qa(project_root, build_cmd, args.jobs, args.cache_file)
+    memory_bank.atomic_write_text(args.results, json.dumps(report, indent=2) + "\n")
+    qa_status.write_status(qa_status.status_from_report(report))
+    if not args.no_log:
+        append_logs(memory_bank.ACTIVE_CONTEXT_FILE, report)
+    print_summary(report)
+    print(f"Results written to {args.results}; QA status written to {qa_status.STATUS_FILE}")
+    sys.exit(0 if report["overall"] == PASS else 1)
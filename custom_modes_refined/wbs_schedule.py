@@ -0,0 +1,321 @@
+# Run this script from the root of the project.
+#
+# Dependency-aware scheduler over the Level 4 work breakdown structure in
+# memory-bank/tasks.md (see Level4/task-tracking-advanced.mdc). Builds a DAG of
+# components (or features, or tasks) from the declared dependencies, reports
+# dependency cycles, computes the critical path and the waves of units that can
+# run in parallel, and can spread the open work over N parallel agent sessions
+# for Level4/phased-implementation.mdc.
+
+import argparse
+import json
+import re
+import sys
+
+import memory_bank
+import task_tree
+
+DEFAULT_EFFORT_DAYS = 1.0
+_EFFORT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(h|hr|hrs|hours?|d|days?|w|wks?|weeks?)\b", re.IGNORECASE)
+_EFFORT_UNITS = {"h": 1 / 8, "d": 1.0, "w": 5.0}
+
+# --unit choices and the node kinds they schedule.
+UNIT_KINDS = {
+    "component": ("component",),
+    "feature": ("feature",),
+    "task": ("task", "item"),
+}
+
+def effort_days(node):
+    """Estimated effort in days from an 'Est. Effort' / 'Effort' field, or None."""
+    for name, value in node.fields.items():
+        if "effort" in name.lower():
+            match = _EFFORT_RE.search(value)
+            if match:
+                return float(match.group(1)) * _EFFORT_UNITS[match.group(2)[0].lower()]
+    return None
+
+def is_done(node):
+    status = (node.status or "").upper()
+    return node.checked is True or status in task_tree.DONE_STATUSES or status.startswith("COMPLETE")
+
+def build_dag(nodes, unit="component"):
+    """Builds the scheduling DAG.
+
+    A unit depends on every ID declared in its own subtree or by its
+    ancestors (a task inherits its component's dependencies). A dependency on
+    a node inside another unit becomes a dependency on that unit; one on a
+    container (e.g. a component while scheduling tasks) becomes a dependency
+    on every unit inside it. Returns a dict with "units" {id: info}, "edges"
+    {id: sorted dependency ids}, "unresolved" [(unit, id)] for IDs that do
+    not exist and "empty" [(unit, id)] for containers without any unit inside.
+    """
+    kinds = UNIT_KINDS[unit]
+    by_id = {n.id: i for i, n in enumerate(nodes) if n.id}
+    unit_of = {}
+    units = {}
+    for index, node in enumerate(nodes):
+        if node.kind in kinds and node.id:
+            units[node.id] = index
+            for member in task_tree.subtree(nodes, index):
+                unit_of.setdefault(member, node.id)
+
+    def resolve(dep_id):
+        index = by_id.get(dep_id)
+        if index is None:
+            return None
+        if index in unit_of:
+            return {unit_of[index]}
+        return {unit_of[i] for i in task_tree.subtree(nodes, index) if i in unit_of}
+
+    edges = {}
+    unresolved = []
+    empty = []
+    info = {}
+    for unit_id, index in units.items():
+        declared = []
+        for member in task_tree.subtree(nodes, index) + task_tree.ancestors(nodes, index):
+            declared.extend(nodes[member].dependencies)
+        targets = set()
+        for dep_id in dict.fromkeys(declared):
+            resolved = resolve(dep_id)
+            if resolved is None:
+                unresolved.append((unit_id, dep_id))
+            elif not resolved:
+                empty.append((unit_id, dep_id))
+            else:
+                targets |= resolved
+        targets.discard(unit_id)
+        edges[unit_id] = sorted(targets)
+        node = nodes[index]
+        done = is_done(node) or any(is_done(nodes[a]) for a in task_tree.ancestors(nodes, index))
+        effort = effort_days(node)
+        if effort is None:
+            # Sum the estimates of the tasks inside a component or feature.
+            estimates = [effort_days(nodes[m]) for m in task_tree.subtree(nodes, index)[1:]]
+            estimates = [e for e in estimates if e is not None]
+            effort = sum(estimates) if estimates else DEFAULT_EFFORT_DAYS
+        info[unit_id] = {"title": node.title, "status": node.status, "done": done,
+                         "effort": 0.0 if done else effort, "line": node.line + 1}
+    return {"units": info, "edges": edges, "unresolved": unresolved, "empty": empty}
+
+def cycle_path(edges, members):
+    """A shortest closed walk of real 'depends on' edges through the first
+    member of a strongly connected component: [A, C, B, A] for A->C->B->A."""
+    members = set(members)
+    start = min(members)
+    came_from = {}
+    queue = [start]
+    for node in queue:
+        for target in edges.get(node, ()):
+            if target not in members:
+                continue
+            if target == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(came_from[path[-1]])
+                return path[::-1] + [start]
+            if target not in came_from:
+                came_from[target] = node
+                queue.append(target)
+    return [start, start]
+
+def find_cycles(edges):
+    """Returns the dependency cycles (strongly connected components with more
+    than one unit, or a unit depending on itself), each as a dict with the
+    sorted "members" and a "path" of actual edges that closes the cycle."""
+    index_of, low, on_stack, stack, cycles = {}, {}, set(), [], []
+    counter = [0]
+
+    def strongconnect(root):
+        # Iterative Tarjan, so deep WBS chains cannot hit the recursion limit.
+        work = [(root, iter(edges.get(root, ())))]
+        index_of[root] = low[root] = counter[0]
+        counter[0] += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, targets = work[-1]
+            advanced = False
+            for target in targets:
+                if target not in index_of:
+                    index_of[target] = low[target] = counter[0]
+                    counter[0] += 1
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(edges.get(target, ()))))
+                    advanced = True
+                    break
+                if target in on_stack:
+                    low[node] = min(low[node], index_of[target])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                low[work[-1][0]] = min(low[work[-1][0]], low[node])
+            if low[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in edges.get(node, ()):
+                    cycles.append({"members": sorted(component), "path": cycle_path(edges, component)})
+
+    for node in sorted(edges):
+        if node not in index_of:
+            strongconnect(node)
+    return cycles
+
+def topological_order(edges):
+    """Kahn's algorithm over 'depends on' edges; dependencies come first."""
+    remaining = {n: len(deps) for n, deps in edges.items()}
+    dependents = {n: [] for n in edges}
+    for node, deps in edges.items():
+        for dep in deps:
+            dependents[dep].append(node)
+    ready = sorted(n for n, count in remaining.items() if count == 0)
+    order = []
+    while ready:
+        node = ready.pop(0)
+        order.append(node)
+        for dependent in sorted(dependents[node]):
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    return order
+
+def schedule(dag):
+    """Computes waves, earliest start/finish, slack and the critical path.
+
+    Returns a dict with "waves" (lists of open units whose dependencies are
+    all in earlier waves or done), "times" {id: {start, finish, slack}},
+    "critical_path" and "makespan" (days of effort along the critical path).
+    """
+    edges, units = dag["edges"], dag["units"]
+    order = topological_order(edges)
+    start, finish, depth = {}, {}, {}
+    for node in order:
+        start[node] = max((finish[d] for d in edges[node]), default=0.0)
+        finish[node] = start[node] + units[node]["effort"]
+        open_deps = [depth[d] for d in edges[node] if not units[d]["done"]]
+        depth[node] = (max(open_deps) + 1) if open_deps else 0
+    makespan = max(finish.values(), default=0.0)
+
+    dependents = {n: [] for n in edges}
+    for node, deps in edges.items():
+        for dep in deps:
+            dependents[dep].append(node)
+    latest_finish = {}
+    for node in reversed(order):
+        latest_finish[node] = min((latest_finish[d] - units[d]["effort"] for d in dependents[node]),
+                                  default=makespan)
+    times = {n: {"start": start[n], "finish": finish[n], "slack": round(latest_finish[n] - finish[n], 6)}
+             for n in order}
+
+    critical = []
+    open_nodes = [n for n in order if not units[n]["done"]]
+    if open_nodes:
+        node = max(open_nodes, key=lambda n: (finish[n], n))
+        critical.append(node)
+        while True:
+            preds = [d for d in edges[node] if not units[d]["done"]
+                     and abs(finish[d] - start[node]) < 1e-9]
+            if not preds:
+                break
+            node = max(preds)
+            critical.append(node)
+        critical.reverse()
+
+    waves = {}
+    for node in open_nodes:
+        waves.setdefault(depth[node], []).append(node)
+    return {"waves": [sorted(waves[k]) for k in sorted(waves)], "times": times,
+            "critical_path": critical, "makespan": makespan}
+
+def assign_sessions(dag, plan, sessions):
+    """Greedy list scheduling of the open units onto parallel sessions.
+
+    Units are taken in order of earliest start, least slack first; each goes
+    to the session that becomes free first, but not before its dependencies
+    finish. Returns [[{unit, start, finish}], ...] per session.
+    """
+    units, edges, times = dag["units"], dag["edges"], plan["times"]
+    pending = sorted((n for n in times if not units[n]["done"]),
+                     key=lambda n: (times[n]["start"], times[n]["slack"], n))
+    free_at = [0.0] * sessions
+    lanes = [[] for _ in range(sessions)]
+    finished = {n: 0.0 for n in units if units[n]["done"]}
+    while pending:
+        # Next unit whose dependencies have all been placed.
+        node = next(n for n in pending if all(d in finished for d in edges[n]))
+        pending.remove(node)
+        ready = max((finished[d] for d in edges[node]), default=0.0)
+        lane = min(range(sessions), key=lambda i: (max(free_at[i], ready), i))
+        begin = max(free_at[lane], ready)
+        end = begin + units[node]["effort"]
+        lanes[lane].append({"unit": node, "start": begin, "finish": end})
+        free_at[lane] = end
+        finished[node] = end
+    return lanes
+
+def days(value):
+    return f"{value:g} day{'' if value == 1 else 's'}"
+
+def print_report(dag, plan, cycles, lanes=None, unit="component"):
+    units = dag["units"]
+    open_count = sum(1 for u in units.values() if not u["done"])
+    print(f"{len(units)} units ({open_count} open), {sum(len(d) for d in dag['edges'].values())} dependencies")
+    for unit_id, dep_id in dag["unresolved"]:
+        print(f"    unresolved dependency: {unit_id} -> {dep_id}")
+    for unit_id, dep_id in dag["empty"]:
+        print(f"    empty dependency (no {unit} inside, ignored): {unit_id} -> {dep_id}")
+    if cycles:
+        print("\nDependency cycles (must be broken before scheduling):")
+        for cycle in cycles:
+            others = [m for m in cycle["members"] if m not in cycle["path"]]
+            print("    " + " -> ".join(cycle["path"])
+                  + (f" (also in the cycle: {', '.join(others)})" if others else ""))
+        return
+    print(f"\nCritical path ({days(plan['makespan'])}): " + (" -> ".join(plan["critical_path"]) or "(nothing open)"))
+    print("\nParallel waves (units in one wave do not depend on each other):")
+    for number, wave in enumerate(plan["waves"], start=1):
+        labels = [f"{u} ({units[u]['effort']:g}d{', critical' if u in plan['critical_path'] else ''})" for u in wave]
+        print(f"    {number}. " + ", ".join(labels))
+    if lanes:
+        print(f"\nAssignment to {len(lanes)} parallel sessions:")
+        for number, lane in enumerate(lanes, start=1):
+            steps = ", ".join(f"{s['unit']} [{s['start']:g}-{s['finish']:g}]" for s in lane) or "(idle)"
+            print(f"    session {number}: {steps}")
+        print(f"    finishes after {days(max((s['finish'] for lane in lanes for s in lane), default=0))}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Schedule the Level 4 WBS in tasks.md by its dependencies.")
+    parser.add_argument("--file", default=memory_bank.TASKS_FILE,
+                        help=f"Tasks file (default: {memory_bank.TASKS_FILE}).")
+    parser.add_argument("--unit", choices=sorted(UNIT_KINDS), default="component",
+                        help="What to schedule (default: component).")
+    parser.add_argument("--sessions", type=int, help="Also assign the open units to this many parallel sessions.")
+    parser.add_argument("--json", metavar="PATH", help="Write the DAG and schedule as JSON to PATH.")
+    args = parser.parse_args(argv)
+    if args.sessions is not None and args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    nodes, _ = task_tree.load_all_tasks(args.file)
+    if not nodes:
+        raise SystemExit(f"No tasks found in {args.file}")
+    dag = build_dag(nodes, args.unit)
+    cycles = find_cycles(dag["edges"])
+    plan = None if cycles else schedule(dag)
+    lanes = assign_sessions(dag, plan, args.sessions) if plan and args.sessions else None
+    print_report(dag, plan, cycles, lanes, args.unit)
+    if args.json:
+        payload = {"unit": args.unit, "dag": dag, "cycles": cycles, "schedule": plan, "sessions": lanes}
+        memory_bank.atomic_write_text(args.json, json.dumps(payload, indent=2) + "\n")
+        print(f"\nWrote schedule JSON: {args.json}")
+    sys.exit(1 if cycles else 0)